@@ -3,19 +3,22 @@ AI-related components.
 """
 
 from ecs.component import Component
-from enum import Enum
+from utils.enums import LabeledIntEnum
 
 
-class AIType(Enum):
+class AIType(LabeledIntEnum):
     """Types of AI behavior."""
-    AGGRESSIVE = "aggressive"  # Moves toward player when visible
-    PATROL = "patrol"         # Moves in patterns, attacks when close
-    GUARD = "guard"           # Stays in area, attacks when approached
+    AGGRESSIVE = 0  # Moves toward player when visible
+    PATROL = 1      # Moves in patterns, attacks when close
+    GUARD = 2       # Stays in area, attacks when approached
 
 
 class AI(Component):
     """AI behavior component for NPCs."""
     
+    __slots__ = ('ai_type', 'detection_range', 'target_entity', 'last_known_position',
+                 'patrol_points', 'current_patrol_index', 'home_position')
+    
     def __init__(self, ai_type: AIType, detection_range: int = 8):
         self.ai_type = ai_type
         self.detection_range = detection_range
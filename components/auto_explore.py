@@ -2,28 +2,40 @@
 Auto-exploration component for tracking exploration state and behavior.
 """
 
+import sys
 from dataclasses import dataclass, field
-from typing import Optional, List, Tuple
-from enum import Enum
+from typing import Optional, Tuple, Sequence
+from utils.enums import LabeledIntEnum
+from game.config import LEVEL_WIDTH, LEVEL_HEIGHT
 
+# Generate __slots__ for the dataclasses below where supported (Python 3.10+)
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-class AutoExploreState(Enum):
+
+class AutoExploreState(LabeledIntEnum):
     """States for auto-exploration."""
-    INACTIVE = "inactive"
-    SCANNING = "scanning"
-    MOVING = "moving"
+    INACTIVE = 0
+    SCANNING = 1
+    MOVING = 2
 
 
-class ExploreTargetType(Enum):
+class ExploreTargetType(LabeledIntEnum):
     """Types of exploration targets."""
-    UNEXPLORED = "unexplored"
-    STAIRS_DOWN = "stairs_down"
-    STAIRS_UP = "stairs_up"
-    ITEM = "item"
-    DOOR = "door"
+    UNEXPLORED = 0
+    STAIRS_DOWN = 1
+    STAIRS_UP = 2
+    ITEM = 3
+    DOOR = 4
+
+
+# Human-readable target descriptions, indexed by ExploreTargetType value
+TARGET_DESCRIPTIONS = ("unexplored area", "stairs down", "stairs up", "item", "door")
 
+# Default target priorities, indexed by ExploreTargetType value
+_DEFAULT_PRIORITY = (10, 100, 90, 50, 40)
 
-@dataclass
+
+@dataclass(**_DATACLASS_OPTIONS)
 class ExploreTarget:
     """Represents a target for auto-exploration."""
     x: int
@@ -35,28 +47,19 @@ class ExploreTarget:
     def __post_init__(self):
         """Set default priorities based on target type."""
         if self.priority == 0:
-            if self.target_type == ExploreTargetType.STAIRS_DOWN:
-                self.priority = 100
-            elif self.target_type == ExploreTargetType.STAIRS_UP:
-                self.priority = 90
-            elif self.target_type == ExploreTargetType.ITEM:
-                self.priority = 50
-            elif self.target_type == ExploreTargetType.DOOR:
-                self.priority = 40
-            elif self.target_type == ExploreTargetType.UNEXPLORED:
-                self.priority = 10
+            self.priority = _DEFAULT_PRIORITY[self.target_type]
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class AutoExplore:
     """Component for auto-exploration behavior."""
     
     # Current state
     state: AutoExploreState = AutoExploreState.INACTIVE
     
-    # Current target and path
+    # Current target and path (an immutable step sequence walked by path_index)
     current_target: Optional[ExploreTarget] = None
-    current_path: List[Tuple[int, int]] = field(default_factory=list)
+    current_path: Tuple[Tuple[int, int], ...] = ()
     path_index: int = 0
     
     # Exploration preferences
@@ -72,13 +75,23 @@ class AutoExplore:
     # State tracking
     last_scan_turn: int = 0
     scan_frequency: int = 5  # Rescan every N turns
-    visited_positions: set = field(default_factory=set)
+    
+    # Visited tiles, one bit per tile of a map_width x map_height level
+    map_width: int = 0
+    map_height: int = 0
+    visited_bitmap: bytearray = field(default_factory=bytearray)
     
     # Statistics
     tiles_explored: int = 0
     items_found: int = 0
     stairs_found: int = 0
     
+    def __post_init__(self):
+        """Size the visited bitmap to the map."""
+        bitmap_size = (self.map_width * self.map_height + 7) >> 3
+        if len(self.visited_bitmap) != bitmap_size:
+            self.visited_bitmap = bytearray(bitmap_size)
+    
     def is_active(self) -> bool:
         """Check if auto-explore is currently active."""
         return self.state != AutoExploreState.INACTIVE
@@ -113,13 +126,17 @@ class AutoExplore:
     def clear_target(self) -> None:
         """Clear the current target and path."""
         self.current_target = None
-        self.current_path.clear()
+        self.current_path = ()
         self.path_index = 0
     
-    def set_target(self, target: ExploreTarget, path: List[Tuple[int, int]]) -> None:
-        """Set a new target and path."""
+    def set_target(self, target: ExploreTarget, path: Sequence[Tuple[int, int]]) -> None:
+        """Set a new target and path.
+        
+        Paths are never modified in place, so a tuple (as returned by the
+        pathfinder) is shared rather than copied.
+        """
         self.current_target = target
-        self.current_path = path.copy()
+        self.current_path = path if isinstance(path, tuple) else tuple(path)
         self.path_index = 0
         self.state = AutoExploreState.MOVING
     
@@ -138,13 +155,36 @@ class AutoExplore:
         self.state = AutoExploreState.INACTIVE
         self.clear_target()
     
+    def restore_state(self, state: dict) -> None:
+        """Restore saved fields, including saves that stored a set of visited positions."""
+        for name, value in state.items():
+            if name != 'visited_positions':
+                setattr(self, name, value)
+        
+        if 'visited_bitmap' not in state:
+            self.map_width = LEVEL_WIDTH
+            self.map_height = LEVEL_HEIGHT
+            self.visited_bitmap = bytearray()
+            self.__post_init__()
+            for x, y in state.get('visited_positions', ()):
+                self.mark_position_visited(x, y)
+    
     def mark_position_visited(self, x: int, y: int) -> None:
         """Mark a position as visited."""
-        self.visited_positions.add((x, y))
+        if 0 <= x < self.map_width and 0 <= y < self.map_height:
+            index = y * self.map_width + x
+            self.visited_bitmap[index >> 3] |= 1 << (index & 7)
     
     def is_position_visited(self, x: int, y: int) -> bool:
         """Check if a position has been visited."""
-        return (x, y) in self.visited_positions
+        if 0 <= x < self.map_width and 0 <= y < self.map_height:
+            index = y * self.map_width + x
+            return bool(self.visited_bitmap[index >> 3] & (1 << (index & 7)))
+        return False
+    
+    def clear_visited(self) -> None:
+        """Forget all visited positions."""
+        self.visited_bitmap[:] = bytes(len(self.visited_bitmap))
     
     def should_rescan(self, current_turn: int) -> bool:
         """Check if it's time to rescan for new targets."""
@@ -162,13 +202,7 @@ class AutoExplore:
             return "Auto-explore: Scanning for targets..."
         elif self.state == AutoExploreState.MOVING:
             if self.current_target:
-                target_desc = {
-                    ExploreTargetType.UNEXPLORED: "unexplored area",
-                    ExploreTargetType.STAIRS_DOWN: "stairs down",
-                    ExploreTargetType.STAIRS_UP: "stairs up",
-                    ExploreTargetType.ITEM: "item",
-                    ExploreTargetType.DOOR: "door"
-                }.get(self.current_target.target_type, "unknown")
+                target_desc = TARGET_DESCRIPTIONS[self.current_target.target_type]
                 return f"Auto-explore: Moving to {target_desc}"
             else:
                 return "Auto-explore: Moving"
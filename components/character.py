@@ -8,6 +8,8 @@ from ecs.component import Component
 class CharacterAttributes(Component):
     """Character attributes that affect various game mechanics."""
     
+    __slots__ = ('strength', 'agility', 'constitution', 'intelligence', 'willpower', 'perception')
+    
     def __init__(self, strength=10, agility=10, constitution=10, 
                  intelligence=10, willpower=10, perception=10):
         self.strength = strength          # Affects damage and contributes to HP
@@ -23,53 +25,47 @@ class CharacterAttributes(Component):
                 self.intelligence + self.willpower + self.perception)
 
 
+# Cumulative XP required to reach each level (index = level). Each level costs
+# 1.5x the previous one, starting at 100 for level 2; extended on demand.
+_XP_THRESHOLDS = [0, 0, 100]
+
+
+def _xp_threshold(level: int) -> int:
+    """Get the total XP needed to reach a level."""
+    thresholds = _XP_THRESHOLDS
+    while len(thresholds) <= level:
+        thresholds.append(thresholds[-1] + int((thresholds[-1] - thresholds[-2]) * 1.5))
+    return thresholds[level]
+
+
 class Experience(Component):
     """Experience points and level tracking."""
     
+    __slots__ = ('current_xp', 'level')
+    
     def __init__(self, current_xp=0, level=1):
         self.current_xp = current_xp
         self.level = level
     
     def xp_for_next_level(self) -> int:
         """Calculate XP required for next level using 1.5x curve starting at 100."""
-        if self.level == 1:
-            return 100
-        
-        # Calculate cumulative XP needed for current level
-        total_xp_needed = 0
-        xp_for_level = 100
-        
-        for level in range(2, self.level + 2):  # +2 because we want next level
-            total_xp_needed += xp_for_level
-            if level < self.level + 1:  # Don't multiply for the target level calculation
-                xp_for_level = int(xp_for_level * 1.5)
-        
-        return total_xp_needed
+        return _xp_threshold(self.level + 1)
     
     def xp_for_current_level(self) -> int:
         """Calculate XP that was required to reach current level."""
-        if self.level == 1:
-            return 0
-        
-        total_xp_needed = 0
-        xp_for_level = 100
-        
-        for level in range(2, self.level + 1):
-            total_xp_needed += xp_for_level
-            xp_for_level = int(xp_for_level * 1.5)
-        
-        return total_xp_needed
+        return _xp_threshold(self.level)
     
     def add_xp(self, amount: int) -> bool:
-        """Add XP and return True if leveled up."""
+        """Add XP and return True if leveled up (possibly more than once)."""
         self.current_xp += amount
         
         # Check for level up
-        while self.current_xp >= self.xp_for_next_level():
+        leveled_up = False
+        while self.current_xp >= _xp_threshold(self.level + 1):
             self.level += 1
-            return True
+            leveled_up = True
         
-        return False
+        return leveled_up
     
     def get_xp_progress(self) -> tuple:
         """Get current XP progress as (current_in_level, needed_for_next)."""
@@ -85,6 +81,8 @@ class Experience(Component):
 class XPValue(Component):
     """XP value that an entity gives when killed."""
     
+    __slots__ = ('xp_value',)
+    
     def __init__(self, xp_value: int):
         self.xp_value = xp_value
 
@@ -92,5 +90,7 @@ class XPValue(Component):
 class DarkVision(Component):
     """Dark vision component that allows entities to see in darkness."""
     
+    __slots__ = ('radius',)
+    
     def __init__(self, radius: int = 0):
         self.radius = radius  # How far this entity can see in complete darkness
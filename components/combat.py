@@ -8,20 +8,25 @@ from ecs.component import Component
 class Health(Component):
     """Health component for entities that can take damage."""
     
+    __slots__ = ('max_health', 'current_health')
+    
     def __init__(self, max_health: int):
         self.max_health = max_health
         self.current_health = max_health
     
     def take_damage(self, damage: int) -> int:
         """Take damage and return actual damage dealt."""
-        actual_damage = min(damage, self.current_health)
-        self.current_health -= actual_damage
+        current_health = self.current_health
+        actual_damage = damage if damage < current_health else current_health
+        self.current_health = current_health - actual_damage
         return actual_damage
     
     def heal(self, amount: int) -> int:
         """Heal and return actual amount healed."""
-        actual_heal = min(amount, self.max_health - self.current_health)
-        self.current_health += actual_heal
+        current_health = self.current_health
+        missing_health = self.max_health - current_health
+        actual_heal = amount if amount < missing_health else missing_health
+        self.current_health = current_health + actual_heal
         return actual_heal
     
     def is_alive(self) -> bool:
@@ -36,6 +41,8 @@ class Health(Component):
 class Stats(Component):
     """Combat statistics for entities."""
     
+    __slots__ = ('strength', 'defense', 'speed')
+    
     def __init__(self, strength: int, defense: int, speed: int = 100):
         self.strength = strength
         self.defense = defense
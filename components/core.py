@@ -8,6 +8,8 @@ from ecs.component import Component
 class Position(Component):
     """Entity position in the world using global coordinates."""
     
+    __slots__ = ('x', 'y')
+    
     def __init__(self, x: int, y: int):
         self.x = x  # X coordinate
         self.y = y  # Y coordinate
@@ -16,6 +18,8 @@ class Position(Component):
 class Renderable(Component):
     """Visual representation of an entity."""
     
+    __slots__ = ('char', 'color')
+    
     def __init__(self, char: str, color: str = 'white'):
         self.char = char
         self.color = color
@@ -23,17 +27,20 @@ class Renderable(Component):
 
 class Player(Component):
     """Marker component for the player entity."""
-    pass
+    __slots__ = ()
 
 
 class Blocking(Component):
     """Entities with this component block movement."""
-    pass
+    __slots__ = ()
 
 
 class Visible(Component):
     """Tracks visibility state for FOV system."""
     
+    __slots__ = ('visible', 'explored', 'last_seen_x', 'last_seen_y',
+                 'last_seen_char', 'last_seen_color')
+    
     def __init__(self):
         self.visible = False      # Currently visible to player
         self.explored = False     # Has been seen before
@@ -46,6 +53,8 @@ class Visible(Component):
 class Door(Component):
     """Door that can be opened/closed, affecting movement and vision."""
     
+    __slots__ = ('is_open',)
+    
     def __init__(self, is_open: bool = False):
         self.is_open = is_open
 
@@ -53,5 +62,7 @@ class Door(Component):
 class Prefab(Component):
     """Marker component for entities created from prefabs."""
     
+    __slots__ = ('prefab_id',)
+    
     def __init__(self, prefab_id: str):
         self.prefab_id = prefab_id
@@ -3,12 +3,14 @@ Corpse-related components and character species/disposition.
 """
 
 from ecs.component import Component
-from enum import Enum
+from utils.enums import LabeledIntEnum
 
 
 class Corpse(Component):
     """Marker component indicating this entity is a corpse."""
     
+    __slots__ = ('original_entity_type',)
+    
     def __init__(self, original_entity_type: str):
         self.original_entity_type = original_entity_type  # "goliath", "cultist", etc.
 
@@ -16,20 +18,24 @@ class Corpse(Component):
 class Species(Component):
     """Species information for entities."""
     
+    __slots__ = ('species_name',)
+    
     def __init__(self, species_name: str):
         self.species_name = species_name  # "goliath", "cultist", "skeleton", etc.
 
 
-class DispositionType(Enum):
+class DispositionType(LabeledIntEnum):
     """Types of disposition a character can have."""
-    HOSTILE = "hostile"
-    NEUTRAL = "neutral"
-    FRIENDLY = "friendly"
+    HOSTILE = 0
+    NEUTRAL = 1
+    FRIENDLY = 2
 
 
 class Disposition(Component):
     """Disposition component indicating how a character behaves toward others."""
     
+    __slots__ = ('disposition',)
+    
     def __init__(self, disposition: DispositionType = DispositionType.NEUTRAL):
         self.disposition = disposition
     
@@ -3,85 +3,200 @@ Components for the effects system.
 """
 
 from ecs.component import Component
-from typing import Dict, List, Any
-import time
+from game.config import LEVEL_WIDTH, LEVEL_HEIGHT
+from typing import Dict, List, Any, Optional
 
 
 class Physics(Component):
     """Physics properties for entities that can be affected by knockback."""
     
+    __slots__ = ('mass', 'knockback_coef', 'velocity_x', 'velocity_y')
+    
+    _transient_fields = ('knockback_coef',)
+    
     def __init__(self, mass: float = 10.0):
         self.mass = mass  # Mass affects how far entity is knocked back
+        # Knockback distance is force * knockback_coef; mass is normalized
+        # around 50lbs per unit and scaled by 4
+        self.knockback_coef = 50.0 / (mass * 4.0)
         self.velocity_x = 0.0  # Current velocity in X direction
         self.velocity_y = 0.0  # Current velocity in Y direction
+    
+    def restore_state(self, state: Dict[str, Any]) -> None:
+        """Restore saved physics and recompute knockback_coef from the mass."""
+        # Some saves stored the mass under its old private name
+        self.__init__(state['mass'] if 'mass' in state else state['_mass'])
+        self.velocity_x = state.get('velocity_x', 0.0)
+        self.velocity_y = state.get('velocity_y', 0.0)
 
 
 class StatusEffect(Component):
-    """Container for status effects affecting an entity."""
+    """Container for status effects affecting an entity.
     
-    def __init__(self):
-        self.effects: Dict[str, Dict[str, Any]] = {}  # effect_name -> effect_data
+    Effects are stored as parallel lists indexed by slot: names[i] has
+    durations[i] turns left at intensities[i], with any extra data in extras[i].
+    """
     
-    def add_effect(self, effect_name: str, duration: int, intensity: int = 1, **kwargs) -> None:
-        """Add a status effect."""
-        self.effects[effect_name] = {
-            'duration': duration,
-            'intensity': intensity,
-            'start_time': time.time(),
-            **kwargs
-        }
+    __slots__ = ('names', 'durations', 'intensities', 'extras')
+    
+    def __init__(self):
+        self.names: List[str] = []
+        self.durations: List[int] = []
+        self.intensities: List[int] = []
+        self.extras: List[Dict[str, Any]] = []
+    
+    def restore_state(self, state: Dict[str, Any]) -> None:
+        """Restore saved effects, including saves that stored an effect_name -> data dict."""
+        if 'names' in state:
+            self.names = list(state['names'])
+            self.durations = list(state['durations'])
+            self.intensities = list(state['intensities'])
+            self.extras = list(state['extras'])
+            return
+        self.__init__()
+        for effect_name, effect_data in state.get('effects', {}).items():
+            extras = dict(effect_data)
+            duration = extras.pop('duration', 0)
+            intensity = extras.pop('intensity', 1)
+            self.add_effect(effect_name, duration, intensity, **extras)
+    
+    @property
+    def effects(self) -> Dict[str, Dict[str, Any]]:
+        """Snapshot of all effects as effect_name -> effect_data."""
+        return {name: self._effect_data(index) for index, name in enumerate(self.names)}
+    
+    def _effect_data(self, index: int) -> Dict[str, Any]:
+        """Build the effect data dict for a slot."""
+        return {'duration': self.durations[index], 'intensity': self.intensities[index], **self.extras[index]}
+    
+    def add_effect(self, effect_name: str, duration: int, intensity: int = 1,
+                   start_turn: Optional[int] = None, **kwargs) -> None:
+        """Add a status effect. Durations are counted in turns by tick_effects."""
+        if start_turn is not None:
+            kwargs['start_turn'] = start_turn
+        
+        if effect_name in self.names:
+            # Replace the existing effect in its slot
+            index = self.names.index(effect_name)
+            self.durations[index] = duration
+            self.intensities[index] = intensity
+            self.extras[index] = kwargs
+        else:
+            self.names.append(effect_name)
+            self.durations.append(duration)
+            self.intensities.append(intensity)
+            self.extras.append(kwargs)
     
     def remove_effect(self, effect_name: str) -> None:
         """Remove a status effect."""
-        if effect_name in self.effects:
-            del self.effects[effect_name]
+        if effect_name in self.names:
+            index = self.names.index(effect_name)
+            del self.names[index]
+            del self.durations[index]
+            del self.intensities[index]
+            del self.extras[index]
     
     def has_effect(self, effect_name: str) -> bool:
         """Check if entity has a specific effect."""
-        return effect_name in self.effects
+        return effect_name in self.names
     
     def get_effect(self, effect_name: str) -> Dict[str, Any]:
         """Get effect data."""
-        return self.effects.get(effect_name, {})
+        if effect_name in self.names:
+            return self._effect_data(self.names.index(effect_name))
+        return {}
     
     def tick_effects(self) -> List[str]:
         """Reduce duration of all effects and return list of expired effects."""
+        names = self.names
+        durations = self.durations
+        intensities = self.intensities
+        extras = self.extras
+        
+        # Decrement in place, compacting surviving effects towards the front
         expired = []
-        for effect_name, data in list(self.effects.items()):
-            data['duration'] -= 1
-            if data['duration'] <= 0:
-                expired.append(effect_name)
-                del self.effects[effect_name]
+        kept = 0
+        for index in range(len(names)):
+            duration = durations[index] - 1
+            if duration <= 0:
+                expired.append(names[index])
+                continue
+            names[kept] = names[index]
+            durations[kept] = duration
+            intensities[kept] = intensities[index]
+            extras[kept] = extras[index]
+            kept += 1
+        
+        if expired:
+            del names[kept:]
+            del durations[kept:]
+            del intensities[kept:]
+            del extras[kept:]
         return expired
 
 
 class TileModification(Component):
     """Tracks modifications to world tiles (like blood splatter)."""
     
-    def __init__(self):
-        self.bloody_tiles: Dict[tuple, int] = {}  # (x, y) -> intensity
+    __slots__ = ('width', 'height', 'blood_grid', 'bloody_tile_count')
+    
+    _transient_fields = ('bloody_tile_count',)
+    
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        # Row-major blood intensity per tile (0 = clean, max 5)
+        self.blood_grid = bytearray(width * height)
+        # Number of nonzero cells in blood_grid
+        self.bloody_tile_count = 0
+    
+    def restore_state(self, state: Dict[str, Any]) -> None:
+        """Restore the saved blood grid, including saves that stored an (x, y) -> intensity dict."""
+        if 'blood_grid' in state:
+            self.width = state['width']
+            self.height = state['height']
+            self.blood_grid = bytearray(state['blood_grid'])
+            self.bloody_tile_count = len(self.blood_grid) - self.blood_grid.count(0)
+            return
+        
+        self.__init__(LEVEL_WIDTH, LEVEL_HEIGHT)
+        for position, intensity in state.get('bloody_tiles', {}).items():
+            if isinstance(position, tuple):
+                self.add_blood_tile(position[0], position[1], intensity)
     
     def add_blood_tile(self, x: int, y: int, intensity: int = 1) -> None:
         """Add or increase blood intensity at a tile."""
-        current = self.bloody_tiles.get((x, y), 0)
-        self.bloody_tiles[(x, y)] = min(current + intensity, 5)  # Max intensity of 5
+        if 0 <= x < self.width and 0 <= y < self.height:
+            index = y * self.width + x
+            current = self.blood_grid[index]
+            if not current:
+                self.bloody_tile_count += 1
+            self.blood_grid[index] = min(current + intensity, 5)  # Max intensity of 5
     
     def get_blood_intensity(self, x: int, y: int) -> int:
         """Get blood intensity at a tile."""
-        return self.bloody_tiles.get((x, y), 0)
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return self.blood_grid[y * self.width + x]
+        return 0
     
     def is_bloody(self, x: int, y: int) -> bool:
         """Check if a tile is bloody."""
-        return (x, y) in self.bloody_tiles
+        return self.get_blood_intensity(x, y) > 0
     
     def get_all_bloody_tiles(self) -> Dict[tuple, int]:
-        """Get all bloody tiles."""
-        return self.bloody_tiles.copy()
+        """Get all bloody tiles as (x, y) -> intensity."""
+        if not self.bloody_tile_count:
+            return {}
+        width = self.width
+        return {(index % width, index // width): intensity
+                for index, intensity in enumerate(self.blood_grid) if intensity}
 
 
 class WeaponEffects(Component):
     """Special effects that weapons can trigger."""
     
+    __slots__ = ('knockback_chance', 'knockback_force', 'slashing_chance', 'slashing_damage')
+    
     def __init__(self):
         self.knockback_chance = 0.0  # Chance to cause knockback (0.0 to 1.0)
         self.knockback_force = 0.0   # Force of knockback
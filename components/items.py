@@ -2,8 +2,12 @@
 Item-related components for the inventory and equipment system.
 """
 
+from types import MappingProxyType
 from ecs.component import Component
-from typing import Dict, Optional
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+# Shared read-only bonuses for equipment without attribute bonuses
+_EMPTY_BONUSES: Mapping[str, int] = MappingProxyType({})
 
 
 class Item(Component):
@@ -20,12 +24,14 @@ class Item(Component):
 class Equipment(Component):
     """Component for equippable items."""
     
+    __slots__ = ('slot', 'attack_bonus', 'defense_bonus', 'attribute_bonuses')
+    
     def __init__(self, slot: str, attack_bonus: int = 0, defense_bonus: int = 0, 
                  attribute_bonuses: Optional[Dict[str, int]] = None):
         self.slot = slot  # weapon, armor, accessory
         self.attack_bonus = attack_bonus
         self.defense_bonus = defense_bonus
-        self.attribute_bonuses = attribute_bonuses or {}
+        self.attribute_bonuses = attribute_bonuses or _EMPTY_BONUSES
 
 
 class Consumable(Component):
@@ -40,24 +46,57 @@ class Consumable(Component):
 class Inventory(Component):
     """Component for entities that can carry items."""
     
+    __slots__ = ('items', 'capacity', '_item_set', '_filtered')
+    
+    _transient_fields = ('_item_set', '_filtered')
+    
     def __init__(self, capacity: int = 20):
-        self.items = []  # List of entity IDs
+        self.items = []  # List of entity IDs, in pickup order
         self.capacity = capacity
+        self._item_set = set()  # Same IDs as items, for O(1) membership tests
+        self._filtered = {}  # Filter key -> cached subset of items, see get_filtered_items
+    
+    def restore_state(self, state: Dict[str, Any]) -> None:
+        """Restore saved items and rebuild the derived lookups."""
+        self.items = list(state.get('items', ()))
+        self.capacity = state.get('capacity', 20)
+        self._item_set = set(self.items)
+        self._filtered = {}
     
     def add_item(self, item_entity_id: int) -> bool:
         """Add an item to the inventory. Returns True if successful."""
         if len(self.items) < self.capacity:
             self.items.append(item_entity_id)
+            self._item_set.add(item_entity_id)
+            self._filtered.clear()
             return True
         return False
     
     def remove_item(self, item_entity_id: int) -> bool:
         """Remove an item from the inventory. Returns True if successful."""
-        if item_entity_id in self.items:
+        if item_entity_id in self._item_set:
+            self._item_set.discard(item_entity_id)
             self.items.remove(item_entity_id)
+            self._filtered.clear()
             return True
         return False
     
+    def get_filtered_items(self, key: str, predicate: Callable[[int], bool]) -> List[int]:
+        """Get the items matching predicate, in inventory order.
+        
+        The result is cached under key until an item is added or removed, so
+        predicate must depend only on the item (e.g. which components it has)
+        and callers must not mutate the returned list.
+        """
+        filtered = self._filtered.get(key)
+        if filtered is None:
+            filtered = self._filtered[key] = [item_id for item_id in self.items if predicate(item_id)]
+        return filtered
+    
+    def has_item(self, item_entity_id: int) -> bool:
+        """Check if an item is in the inventory."""
+        return item_entity_id in self._item_set
+    
     def is_full(self) -> bool:
         """Check if inventory is full."""
         return len(self.items) >= self.capacity
@@ -70,50 +109,102 @@ class Inventory(Component):
 class EquipmentSlots(Component):
     """Component for tracking equipped items."""
     
+    __slots__ = ('_slots', '_item_slots', '_bonuses')
+    
+    _transient_fields = ('_item_slots', '_bonuses')
+    
     def __init__(self):
-        self.weapon = None      # Entity ID of equipped weapon
-        self.armor = None       # Entity ID of equipped armor
-        self.accessory = None   # Entity ID of equipped accessory
+        # Slot name -> entity ID of equipped item (None when empty)
+        self._slots = {'weapon': None, 'armor': None, 'accessory': None}
+        # Entity ID of equipped item -> slot name (reverse of _slots)
+        self._item_slots = {}
+        # Summed equipment bonuses, or None until computed for the current slots
+        self._bonuses = None
+    
+    def restore_state(self, state: Dict[str, Any]) -> None:
+        """Restore saved slots and rebuild the derived lookups."""
+        slots = state.get('_slots')
+        if slots is None:
+            # Saves from before the slot dict stored one attribute per slot
+            slots = state
+        self._slots = {slot: slots.get(slot) for slot in ('weapon', 'armor', 'accessory')}
+        self._item_slots = {item_id: slot for slot, item_id in self._slots.items() if item_id is not None}
+        self._bonuses = None
+    
+    @property
+    def weapon(self) -> Optional[int]:
+        """Entity ID of equipped weapon."""
+        return self._slots['weapon']
+    
+    @weapon.setter
+    def weapon(self, item_entity_id: Optional[int]) -> None:
+        self._set_slot('weapon', item_entity_id)
+    
+    @property
+    def armor(self) -> Optional[int]:
+        """Entity ID of equipped armor."""
+        return self._slots['armor']
+    
+    @armor.setter
+    def armor(self, item_entity_id: Optional[int]) -> None:
+        self._set_slot('armor', item_entity_id)
+    
+    @property
+    def accessory(self) -> Optional[int]:
+        """Entity ID of equipped accessory."""
+        return self._slots['accessory']
+    
+    @accessory.setter
+    def accessory(self, item_entity_id: Optional[int]) -> None:
+        self._set_slot('accessory', item_entity_id)
     
     def equip_item(self, item_entity_id: int, slot: str) -> Optional[int]:
         """Equip an item in the specified slot. Returns previously equipped item ID if any."""
-        previous_item = None
-        
-        if slot == 'weapon':
-            previous_item = self.weapon
-            self.weapon = item_entity_id
-        elif slot == 'armor':
-            previous_item = self.armor
-            self.armor = item_entity_id
-        elif slot == 'accessory':
-            previous_item = self.accessory
-            self.accessory = item_entity_id
+        slots = self._slots
+        if slot not in slots:
+            return None
         
+        previous_item = slots[slot]
+        self._set_slot(slot, item_entity_id)
         return previous_item
     
     def unequip_item(self, slot: str) -> Optional[int]:
         """Unequip an item from the specified slot. Returns the unequipped item ID if any."""
-        unequipped_item = None
-        
-        if slot == 'weapon':
-            unequipped_item = self.weapon
-            self.weapon = None
-        elif slot == 'armor':
-            unequipped_item = self.armor
-            self.armor = None
-        elif slot == 'accessory':
-            unequipped_item = self.accessory
-            self.accessory = None
+        slots = self._slots
+        if slot not in slots:
+            return None
         
+        unequipped_item = slots[slot]
+        self._set_slot(slot, None)
         return unequipped_item
     
+    def get_item_slot(self, item_entity_id: int) -> Optional[str]:
+        """Get the slot an item is equipped in, or None if it isn't equipped."""
+        return self._item_slots.get(item_entity_id)
+    
     def get_equipped_items(self) -> Dict[str, Optional[int]]:
         """Get all equipped items as a dictionary."""
-        return {
-            'weapon': self.weapon,
-            'armor': self.armor,
-            'accessory': self.accessory
-        }
+        return dict(self._slots)
+    
+    def _set_slot(self, slot: str, item_entity_id: Optional[int]) -> None:
+        """Put an item (or None) in a slot, keeping the reverse map in sync."""
+        slots = self._slots
+        item_slots = self._item_slots
+        previous_item = slots[slot]
+        if previous_item is not None and item_slots.get(previous_item) == slot:
+            del item_slots[previous_item]
+        slots[slot] = item_entity_id
+        if item_entity_id is not None:
+            item_slots[item_entity_id] = slot
+        self._bonuses = None
+    
+    def get_cached_bonuses(self) -> Optional[Dict[str, Any]]:
+        """Get the bonuses cached by set_cached_bonuses, or None if slots changed since."""
+        return self._bonuses
+    
+    def set_cached_bonuses(self, bonuses: Dict[str, Any]) -> None:
+        """Cache the summed bonuses of the currently equipped items."""
+        self._bonuses = bonuses
 
 
 class Pickupable(Component):
@@ -3,24 +3,62 @@ Skills components for tracking character abilities.
 """
 
 from ecs.component import Component
-from typing import Dict
+from typing import Any, Dict, List
+
+# Every skill, in Skills.levels order. Saves store levels positionally, so
+# new skills must be appended here, never inserted or reordered.
+SKILL_NAMES = (
+    'throwing',
+)
+# Skill name -> index into Skills.levels
+SKILL_INDEX: Dict[str, int] = {name: skill_id for skill_id, name in enumerate(SKILL_NAMES)}
+SKILL_THROWING = SKILL_INDEX['throwing']
+
+
+def get_skill_id(skill_name: str) -> int:
+    """Get the index of a skill."""
+    try:
+        return SKILL_INDEX[skill_name]
+    except KeyError:
+        raise ValueError(f"Unknown skill: {skill_name}") from None
 
 
 class Skills(Component):
     """Component for tracking character skills."""
     
+    __slots__ = ('levels',)
+    
     def __init__(self):
-        self.skills: Dict[str, int] = {
-            'throwing': 1,  # Start with basic throwing skill
-        }
+        # Skill level per skill index (see SKILL_NAMES)
+        self.levels: List[int] = [0] * len(SKILL_NAMES)
+        self.levels[SKILL_THROWING] = 1  # Start with basic throwing skill
+    
+    def restore_state(self, state: Dict[str, Any]) -> None:
+        """Restore saved skill levels, including saves that stored a name -> level dict."""
+        # Saves from before a skill was appended to SKILL_NAMES are padded out
+        self.levels = [0] * len(SKILL_NAMES)
+        levels = state.get('levels')
+        if levels is not None:
+            self.levels[:len(levels)] = levels
+            return
+        for skill_name, level in state.get('skills', {}).items():
+            if skill_name in SKILL_INDEX:
+                self.set_skill(skill_name, level)
+    
+    def get_skill_by_id(self, skill_id: int) -> int:
+        """Get skill level by skill index, for callers that cache the index."""
+        return self.levels[skill_id]
     
     def get_skill(self, skill_name: str) -> int:
         """Get skill level for a specific skill."""
-        return self.skills.get(skill_name, 0)
+        skill_id = SKILL_INDEX.get(skill_name)
+        if skill_id is None:
+            return 0
+        return self.get_skill_by_id(skill_id)
     
     def set_skill(self, skill_name: str, level: int) -> None:
         """Set skill level for a specific skill."""
-        self.skills[skill_name] = max(0, level)
+        self.levels[get_skill_id(skill_name)] = max(0, level)
     
     def increase_skill(self, skill_name: str, amount: int = 1) -> int:
         """Increase skill level and return new level."""
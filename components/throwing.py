@@ -9,6 +9,8 @@ from typing import Optional
 class ThrowingCursor(Component):
     """Component for tracking throwing cursor state."""
     
+    __slots__ = ('cursor_x', 'cursor_y', 'selected_item', 'is_active')
+    
     def __init__(self, cursor_x: int, cursor_y: int, selected_item: int):
         self.cursor_x = cursor_x
         self.cursor_y = cursor_y
@@ -28,6 +30,8 @@ class ThrowingCursor(Component):
 class ThrownObject(Component):
     """Component for objects that are currently being thrown."""
     
+    __slots__ = ('target_x', 'target_y', 'thrower_id', 'throwing_skill', 'strength', 'has_landed')
+    
     def __init__(self, target_x: int, target_y: int, thrower_id: int, 
                  throwing_skill: int, strength: int):
         self.target_x = target_x
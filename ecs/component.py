@@ -2,15 +2,84 @@
 Component management for the ECS system.
 """
 
-from typing import Dict, Type, Any, Set, Optional, TypeVar, Generic
+from typing import Dict, Type, Any, Set, Optional, TypeVar, Generic, FrozenSet, Iterator, Tuple
 from collections import defaultdict
+from types import MappingProxyType
 
 T = TypeVar('T')
 
+# Stand-in column for component types no entity has had yet
+_NO_COMPONENTS = MappingProxyType({})
+
 
 class Component:
-    """Base class for all components."""
-    pass
+    """Base class for all components.
+    
+    Subclasses holding derived data can list those fields in
+    _transient_fields to keep them out of saved state, and define
+    restore_state(state) to rebuild them (or to read fields saved under an
+    older layout) when the component is loaded.
+    """
+    
+    __slots__ = ()
+    
+    _transient_fields: Tuple[str, ...] = ()
+
+
+# class -> names of the persistent __slots__ fields declared across its MRO
+_slot_fields: Dict[type, Tuple[str, ...]] = {}
+
+
+def _get_slot_fields(cls: type) -> Tuple[str, ...]:
+    """Get (and cache) the persistent slot field names of a class."""
+    fields = _slot_fields.get(cls)
+    if fields is None:
+        transient = getattr(cls, '_transient_fields', ())
+        names = []
+        for klass in cls.__mro__:
+            slots = klass.__dict__.get('__slots__', ())
+            if isinstance(slots, str):
+                slots = (slots,)
+            for name in slots:
+                if name not in ('__dict__', '__weakref__') and name not in transient and name not in names:
+                    names.append(name)
+        fields = _slot_fields[cls] = tuple(names)
+    return fields
+
+
+def get_component_state(component: Any) -> Dict[str, Any]:
+    """Get a shallow copy of a component's fields for serialization.
+    
+    Works for both __slots__ based components and plain objects with a __dict__.
+    Fields named in the class's _transient_fields are left out.
+    """
+    state = {}
+    for name in _get_slot_fields(type(component)):
+        try:
+            state[name] = getattr(component, name)
+        except AttributeError:
+            pass  # Slot never assigned
+    instance_dict = getattr(component, '__dict__', None)
+    if instance_dict:
+        transient = getattr(component, '_transient_fields', ())
+        for name, value in instance_dict.items():
+            if name not in transient:
+                state[name] = value
+    return state
+
+
+def set_component_state(component: Any, state: Dict[str, Any]) -> None:
+    """Restore a component's fields from serialized data.
+    
+    Uses the component's restore_state(state) when it defines one, so it can
+    rebuild derived fields or migrate state saved under an older layout.
+    """
+    restore_state = getattr(component, 'restore_state', None)
+    if restore_state is not None:
+        restore_state(state)
+        return
+    for name, value in state.items():
+        setattr(component, name, value)
 
 
 class ComponentManager:
@@ -18,55 +87,131 @@ class ComponentManager:
     
     def __init__(self):
         # component_type -> entity_id -> component_instance
-        self._components: Dict[Type[Component], Dict[int, Component]] = defaultdict(dict)
+        self._components: Dict[Type[Component], Dict[int, Component]] = {}
         # entity_id -> set of component types
-        self._entity_components: Dict[int, Set[Type[Component]]] = defaultdict(set)
+        self._entity_components: Dict[int, Set[Type[Component]]] = {}
+        # component type tuple -> cached get_entities_with_components result
+        self._query_cache: Dict[Tuple[Type[Component], ...], FrozenSet[int]] = {}
+        # component_type -> cached query keys that include it
+        self._queries_by_type: Dict[Type[Component], Set[Tuple[Type[Component], ...]]] = defaultdict(set)
     
     def add_component(self, entity_id: int, component: Component) -> None:
         """Add a component to an entity."""
         component_type = type(component)
-        self._components[component_type][entity_id] = component
-        self._entity_components[entity_id].add(component_type)
+        column = self._components.get(component_type)
+        if column is None:
+            column = self._components[component_type] = {}
+        column[entity_id] = component
+        entity_types = self._entity_components.get(entity_id)
+        if entity_types is None:
+            entity_types = self._entity_components[entity_id] = set()
+        elif component_type in entity_types:
+            # Replacing an existing component doesn't change any query result
+            return
+        entity_types.add(component_type)
+        self._invalidate_queries(component_type)
     
     def remove_component(self, entity_id: int, component_type: Type[Component]) -> None:
         """Remove a component from an entity."""
         if component_type in self._components:
             self._components[component_type].pop(entity_id, None)
-        self._entity_components[entity_id].discard(component_type)
+        entity_types = self._entity_components.get(entity_id)
+        if entity_types and component_type in entity_types:
+            entity_types.discard(component_type)
+            self._invalidate_queries(component_type)
+    
+    def _invalidate_queries(self, component_type: Type[Component]) -> None:
+        """Drop cached query results that depend on component_type."""
+        query_keys = self._queries_by_type.pop(component_type, None)
+        if query_keys:
+            query_cache = self._query_cache
+            for query_key in query_keys:
+                query_cache.pop(query_key, None)
     
     def get_component(self, entity_id: int, component_type: Type[T]) -> Optional[T]:
         """Get a component from an entity."""
-        return self._components[component_type].get(entity_id)
+        return self._components.get(component_type, _NO_COMPONENTS).get(entity_id)
+    
+    def get_all_components(self, component_type: Type[T]) -> Dict[int, T]:
+        """Get the entity_id -> component mapping for a component type.
+        
+        Returns the live storage column so systems can scan every instance of a
+        component in one pass instead of looking each entity up individually.
+        Callers must treat the mapping as read-only.
+        """
+        column = self._components.get(component_type)
+        if column is None:
+            column = self._components[component_type] = {}
+        return column
+    
+    def get_entity_components(self, entity_id: int) -> Iterator[Tuple[Type[Component], Component]]:
+        """Get (component_type, component) pairs for every component an entity has."""
+        components = self._components
+        for component_type in self._entity_components.get(entity_id, ()):
+            yield component_type, components[component_type][entity_id]
     
     def has_component(self, entity_id: int, component_type: Type[Component]) -> bool:
         """Check if an entity has a component."""
-        return component_type in self._entity_components[entity_id]
+        return component_type in self._entity_components.get(entity_id, ())
     
     def has_components(self, entity_id: int, *component_types: Type[Component]) -> bool:
         """Check if an entity has all specified components."""
-        entity_components = self._entity_components[entity_id]
-        return all(comp_type in entity_components for comp_type in component_types)
+        entity_components = self._entity_components.get(entity_id, ())
+        # A plain loop skips the generator frame all() would need
+        for comp_type in component_types:
+            if comp_type not in entity_components:
+                return False
+        return True
     
-    def get_entities_with_components(self, *component_types: Type[Component]) -> Set[int]:
-        """Get all entities that have all specified components."""
-        if not component_types:
-            return set()
+    def get_entities_with_components(self, *component_types: Type[Component]) -> FrozenSet[int]:
+        """Get all entities that have all specified components.
         
-        # Start with entities that have the first component type
-        entities = set(self._components[component_types[0]].keys())
+        Results are cached per component type tuple until a component of one
+        of those types is added to or removed from any entity, so the returned
+        set is shared and immutable.
+        """
+        cached = self._query_cache.get(component_types)
+        if cached is not None:
+            return cached
         
-        # Intersect with entities that have each additional component type
-        for component_type in component_types[1:]:
-            entities &= set(self._components[component_type].keys())
+        if not component_types:
+            return frozenset()
+        
+        # A type's storage column is keyed by exactly the entities that have it
+        components = self._components
+        if len(component_types) == 1:
+            entities = frozenset(components.get(component_types[0], _NO_COMPONENTS))
+        else:
+            # Filter the rarest component type's entities by the other columns;
+            # if nothing has it there is nothing to intersect
+            columns = sorted((components.get(component_type, _NO_COMPONENTS)
+                              for component_type in component_types), key=len)
+            common = columns[0].keys()
+            for column in columns[1:]:
+                if not common:
+                    break
+                common = common & column.keys()
+            entities = frozenset(common)
         
+        self._query_cache[component_types] = entities
+        queries_by_type = self._queries_by_type
+        for component_type in component_types:
+            queries_by_type[component_type].add(component_types)
         return entities
     
     def remove_all_components(self, entity_id: int) -> None:
         """Remove all components from an entity."""
-        component_types = list(self._entity_components[entity_id])
-        for component_type in component_types:
-            self.remove_component(entity_id, component_type)
+        for component_type in self._entity_components.pop(entity_id, ()):
+            self._components[component_type].pop(entity_id, None)
+            self._invalidate_queries(component_type)
+    
+    def clear(self) -> None:
+        """Remove every component from every entity."""
+        self._components.clear()
+        self._entity_components.clear()
+        self._query_cache.clear()
+        self._queries_by_type.clear()
     
     def get_component_count(self, component_type: Type[Component]) -> int:
         """Get the number of entities with a specific component type."""
-        return len(self._components[component_type])
+        return len(self._components.get(component_type, _NO_COMPONENTS))
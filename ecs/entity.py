@@ -2,7 +2,7 @@
 Entity management for the ECS system.
 """
 
-from typing import Set, Iterator
+from typing import Iterable, Iterator, List
 
 
 class EntityManager:
@@ -10,36 +10,57 @@ class EntityManager:
     
     def __init__(self):
         self._next_id = 0
-        self._alive_entities: Set[int] = set()
-        self._dead_entities: Set[int] = set()
+        self._alive_bits = bytearray()  # entity_id -> 1 if alive, 0 if dead
+        self._freelist: List[int] = []  # Dead entity IDs available for reuse (LIFO)
+        self._alive_count = 0
     
     def create_entity(self) -> int:
         """Create a new entity and return its ID."""
-        if self._dead_entities:
+        if self._freelist:
             # Reuse a dead entity ID
-            entity_id = self._dead_entities.pop()
+            entity_id = self._freelist.pop()
         else:
             # Create a new ID
             entity_id = self._next_id
             self._next_id += 1
+            self._alive_bits.append(0)
         
-        self._alive_entities.add(entity_id)
+        self._alive_bits[entity_id] = 1
+        self._alive_count += 1
         return entity_id
     
     def destroy_entity(self, entity_id: int) -> None:
         """Mark an entity as destroyed."""
-        if entity_id in self._alive_entities:
-            self._alive_entities.remove(entity_id)
-            self._dead_entities.add(entity_id)
+        if self.is_alive(entity_id):
+            self._alive_bits[entity_id] = 0
+            self._freelist.append(entity_id)
+            self._alive_count -= 1
     
     def is_alive(self, entity_id: int) -> bool:
         """Check if an entity is alive."""
-        return entity_id in self._alive_entities
+        return 0 <= entity_id < len(self._alive_bits) and self._alive_bits[entity_id] == 1
     
     def get_alive_entities(self) -> Iterator[int]:
         """Get all alive entity IDs."""
-        return iter(self._alive_entities)
+        return (entity_id for entity_id, alive in enumerate(self._alive_bits) if alive)
+    
+    def get_dead_entities(self) -> List[int]:
+        """Get the dead entity IDs waiting to be reused, in reuse order (last first)."""
+        return list(self._freelist)
     
     def get_entity_count(self) -> int:
         """Get the number of alive entities."""
-        return len(self._alive_entities)
+        return self._alive_count
+    
+    def restore(self, next_id: int, alive_entities: Iterable[int], dead_entities: Iterable[int]) -> None:
+        """Replace the allocation state, e.g. when loading a saved game."""
+        self._next_id = next_id
+        self._alive_bits = bytearray(next_id)
+        for entity_id in alive_entities:
+            self._alive_bits[entity_id] = 1
+        self._freelist = list(dead_entities)
+        self._alive_count = self._alive_bits.count(1)
+    
+    def clear(self) -> None:
+        """Forget all entities and restart ID allocation from zero."""
+        self.restore(0, (), ())
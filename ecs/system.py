@@ -2,52 +2,62 @@
 System management for the ECS system.
 """
 
-from abc import ABC, abstractmethod
-from typing import List, TYPE_CHECKING
+from typing import Dict, List, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .world import World
 
 
-class System(ABC):
+class System:
     """Base class for all systems."""
     
     def __init__(self, world: 'World'):
         self.world = world
     
-    @abstractmethod
     def update(self, dt: float = 0.0) -> None:
         """Update the system. dt is delta time (unused in turn-based game)."""
-        pass
+        raise NotImplementedError
 
 
 class SystemManager:
     """Manages system registration and execution order."""
     
     def __init__(self):
-        self._systems: List[System] = []
+        self._order: List[System] = []
+        # Every class in each system's MRO (except object) -> first system registered
+        self._by_type: Dict[type, System] = {}
     
     def add_system(self, system: System) -> None:
         """Add a system to the manager."""
-        self._systems.append(system)
+        self._order.append(system)
+        self._index_system(system)
+    
+    def _index_system(self, system: System) -> None:
+        """Register a system under its own type and each of its base classes."""
+        for cls in type(system).__mro__[:-1]:
+            self._by_type.setdefault(cls, system)
     
     def remove_system(self, system: System) -> None:
         """Remove a system from the manager."""
-        if system in self._systems:
-            self._systems.remove(system)
+        if system in self._order:
+            self._order.remove(system)
+            self._by_type.clear()
+            for remaining in self._order:
+                self._index_system(remaining)
     
     def update_all(self, dt: float = 0.0) -> None:
         """Update all systems in order."""
-        for system in self._systems:
+        for system in self._order:
             system.update(dt)
     
     def get_system(self, system_type: type) -> System:
         """Get a system by type."""
-        for system in self._systems:
-            if isinstance(system, system_type):
-                return system
-        raise ValueError(f"System of type {system_type} not found")
+        try:
+            return self._by_type[system_type]
+        except KeyError:
+            raise ValueError(f"System of type {system_type} not found") from None
     
     def clear(self) -> None:
         """Remove all systems."""
-        self._systems.clear()
+        self._order.clear()
+        self._by_type.clear()
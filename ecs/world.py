@@ -2,25 +2,42 @@
 ECS World - coordinates entities, components, and systems.
 """
 
-from typing import Type, Optional, Set, TypeVar
 from .entity import EntityManager
 from .component import ComponentManager, Component
 from .system import SystemManager
 
-T = TypeVar('T', bound=Component)
-
 
 class World:
-    """The main ECS world that coordinates all managers."""
+    """The main ECS world that coordinates all managers.
+    
+    The read-side component API (get_component, get_all_components,
+    has_component, has_components, get_entities_with_components and
+    remove_component) is bound straight to the ComponentManager's methods in
+    __init__, so those calls don't pay for an extra forwarding frame. See
+    ComponentManager for their signatures.
+    """
+    
+    __slots__ = ('entities', 'components', 'systems', 'event_manager',
+                 'get_component', 'get_all_components', 'has_component', 'has_components',
+                 'get_entities_with_components', 'remove_component')
     
-    def __init__(self):
+    def __init__(self, debug: bool = False):
         self.entities = EntityManager()
         self.components = ComponentManager()
         self.systems = SystemManager()
         
         # Import here to avoid circular imports
         from events.core import EventManager
-        self.event_manager = EventManager()
+        self.event_manager = EventManager(debug=debug)
+        
+        # Forward hot component calls without a trampoline
+        components = self.components
+        self.get_component = components.get_component
+        self.get_all_components = components.get_all_components
+        self.has_component = components.has_component
+        self.has_components = components.has_components
+        self.get_entities_with_components = components.get_entities_with_components
+        self.remove_component = components.remove_component
     
     def create_entity(self) -> int:
         """Create a new entity."""
@@ -37,26 +54,6 @@ class World:
             raise ValueError(f"Entity {entity_id} is not alive")
         self.components.add_component(entity_id, component)
     
-    def remove_component(self, entity_id: int, component_type: Type[Component]) -> None:
-        """Remove a component from an entity."""
-        self.components.remove_component(entity_id, component_type)
-    
-    def get_component(self, entity_id: int, component_type: Type[T]) -> Optional[T]:
-        """Get a component from an entity."""
-        return self.components.get_component(entity_id, component_type)
-    
-    def has_component(self, entity_id: int, component_type: Type[Component]) -> bool:
-        """Check if an entity has a component."""
-        return self.components.has_component(entity_id, component_type)
-    
-    def has_components(self, entity_id: int, *component_types: Type[Component]) -> bool:
-        """Check if an entity has all specified components."""
-        return self.components.has_components(entity_id, *component_types)
-    
-    def get_entities_with_components(self, *component_types: Type[Component]) -> Set[int]:
-        """Get all entities that have all specified components."""
-        return self.components.get_entities_with_components(*component_types)
-    
     def update(self, dt: float = 0.0) -> None:
         """Update all systems."""
         self.systems.update_all(dt)
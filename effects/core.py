@@ -2,25 +2,25 @@
 Core effects system components.
 """
 
-from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional, TYPE_CHECKING
+from typing import Dict, Any, List, Optional, Tuple, TYPE_CHECKING
 from ecs.system import System
 
 if TYPE_CHECKING:
     from ecs.world import World
 
 
-class Effect(ABC):
+class Effect:
     """Base class for all effects."""
     
+    __slots__ = ('name', 'parameters')
+    
     def __init__(self, name: str, **kwargs):
         self.name = name
         self.parameters = kwargs
     
-    @abstractmethod
-    def apply(self, world: 'World', **context) -> None:
-        """Apply the effect to the world."""
-        pass
+    def apply(self, world: 'World', context: Dict[str, Any]) -> None:
+        """Apply the effect to the world using the trigger context mapping."""
+        raise NotImplementedError
 
 
 class EffectsManager(System):
@@ -29,24 +29,47 @@ class EffectsManager(System):
     def __init__(self, world: 'World'):
         super().__init__(world)
         self.registered_effects: Dict[str, Effect] = {}
-        self.pending_effects: List[tuple] = []  # (effect_name, context)
+        self.pending_effects: List[Tuple[Effect, Dict[str, Any]]] = []  # (effect, context)
+        # Cleared context dicts ready for reuse by new_context
+        self._context_pool: List[Dict[str, Any]] = []
     
     def register_effect(self, effect: Effect) -> None:
         """Register an effect with the manager."""
         self.registered_effects[effect.name] = effect
     
-    def trigger_effect(self, effect_name: str, **context) -> None:
-        """Queue an effect to be applied on the next update."""
-        self.pending_effects.append((effect_name, context))
+    def new_context(self) -> Dict[str, Any]:
+        """Get an empty context dict to fill in and pass to trigger_effect.
+        
+        Contexts are recycled once their effect has been applied, so callers
+        must not keep a reference after triggering.
+        """
+        pool = self._context_pool
+        return pool.pop() if pool else {}
+    
+    def trigger_effect(self, effect_name: str, context: Dict[str, Any]) -> None:
+        """Queue an effect to be applied on the next update.
+        
+        The name is resolved here, so unknown effects are dropped immediately.
+        """
+        effect = self.registered_effects.get(effect_name)
+        if effect is not None:
+            self.pending_effects.append((effect, context))
+        else:
+            context.clear()
+            self._context_pool.append(context)
     
     def update(self, dt: float = 0.0) -> None:
         """Process all pending effects."""
-        for effect_name, context in self.pending_effects:
-            if effect_name in self.registered_effects:
-                effect = self.registered_effects[effect_name]
-                effect.apply(self.world, **context)
+        world = self.world
+        pending_effects = self.pending_effects
+        for effect, context in pending_effects:
+            effect.apply(world, context)
         
-        self.pending_effects.clear()
+        pool = self._context_pool
+        for _, context in pending_effects:
+            context.clear()
+            pool.append(context)
+        pending_effects.clear()
     
     def get_effect(self, effect_name: str) -> Optional[Effect]:
         """Get a registered effect by name."""
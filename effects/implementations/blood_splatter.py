@@ -5,10 +5,15 @@ Blood splatter effect implementation.
 import random
 from typing import Any
 
+# Offsets of the 8 tiles surrounding a center tile
+_NEIGHBORS = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+
 
 class BloodSplatterEffect:
     """An effect that splatters blood on nearby tiles based on a power level."""
     
+    __slots__ = ('level',)
+    
     def __init__(self, level: int = 1):
         """
         Initialize the blood splatter effect with a power level.
@@ -30,14 +35,14 @@ class BloodSplatterEffect:
             game_state (Any): The game state instance (unused, kept for compatibility).
             world_generator (Any): The world generator to check map boundaries and add blood tiles.
         """
-        # Select up to `level` adjacent tiles to splatter (excluding center tile)
-        nearby = [(x + dx, y + dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1)
-                  if not (dx == 0 and dy == 0)]
-        random.shuffle(nearby)
-        splatter_tiles = nearby[:self.level]
+        # Select up to `level` adjacent tiles to splatter (excluding center tile);
+        # clamped again here since `level` may be reassigned after construction
+        splatter_count = max(0, min(self.level, len(_NEIGHBORS)))
         
         # Add valid coordinates to the current level's blood_tiles
-        for tile_x, tile_y in splatter_tiles:
+        for dx, dy in random.sample(_NEIGHBORS, splatter_count):
+            tile_x = x + dx
+            tile_y = y + dy
             # Check if the tile exists and is valid
             tile = world_generator.get_tile_at(tile_x, tile_y)
             if tile:  # Allow blood on both floor and wall tiles
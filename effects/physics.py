@@ -4,7 +4,7 @@ Physics system for knockback and collision effects.
 
 import math
 import random
-from typing import Set, Tuple, Optional, TYPE_CHECKING
+from typing import Any, Dict, Set, Tuple, Optional, TYPE_CHECKING
 from .core import Effect
 from components.core import Position
 from components.effects import Physics
@@ -32,8 +32,10 @@ class PhysicsSystem:
     
     def apply_knockback(self, entity_id: int, force: float, direction_x: int, direction_y: int, source_x: int, source_y: int) -> None:
         """Apply knockback force to an entity."""
-        physics = self.world.get_component(entity_id, Physics)
-        position = self.world.get_component(entity_id, Position)
+        world = self.world
+        get_component = world.get_component
+        physics = get_component(entity_id, Physics)
+        position = get_component(entity_id, Position)
         
         if not physics or not position:
             return
@@ -41,8 +43,7 @@ class PhysicsSystem:
         # Calculate knockback distance based on force and mass
         # Further reduced knockback for more balanced gameplay
         # Troll (300lbs) should move 1-2 tiles, Skeleton (80lbs) should move ~6 tiles
-        mass_factor = physics.mass / 50.0  # Normalize mass around 150lbs = 3.0
-        knockback_distance = max(1, int(force / (mass_factor * 4.0)))
+        knockback_distance = max(1, int(force * physics.knockback_coef))
         
         # Normalize direction
         if direction_x == 0 and direction_y == 0:
@@ -52,37 +53,40 @@ class PhysicsSystem:
             
             # Normalize
             if direction_x == 0 and direction_y == 0:
-                direction_x = random.choice([-1, 0, 1])
-                direction_y = random.choice([-1, 0, 1])
-        
-        # Ensure we have some direction
-        if direction_x == 0 and direction_y == 0:
-            direction_x = 1
+                direction_x = random.randint(-1, 1)
+                direction_y = random.randint(-1, 1)
+                
+                # Ensure we have some direction
+                if direction_x == 0 and direction_y == 0:
+                    direction_x = 1
         
-        # Calculate step direction (normalize to -1, 0, or 1)
-        step_x = 0 if direction_x == 0 else (1 if direction_x > 0 else -1)
-        step_y = 0 if direction_y == 0 else (1 if direction_y > 0 else -1)
+        # Calculate step direction (sign of each component: -1, 0, or 1)
+        step_x = (direction_x > 0) - (direction_x < 0)
+        step_y = (direction_y > 0) - (direction_y < 0)
         
         # Apply knockback movement step by step using movement system for validation
         damage_taken = 0
         tiles_moved = 0
         from components.core import Player
-        is_player = self.world.has_component(entity_id, Player)
+        is_player = world.has_component(entity_id, Player)
+        
+        # Bind per-step callees once; position is updated in place by moves
+        try_move = self.movement_system.try_move_entity
+        invalidate = self.render_system.invalidate_cache if self.render_system else None
+        follow = self.camera.follow_entity if (is_player and self.camera) else None
         
         for step in range(knockback_distance):
             # Try to move one step in the knockback direction
-            if self.movement_system.try_move_entity(entity_id, step_x, step_y):
+            if try_move(entity_id, step_x, step_y):
                 tiles_moved += 1
                 
                 # Invalidate render cache since entity moved
-                if self.render_system:
-                    self.render_system.invalidate_cache()
+                if invalidate:
+                    invalidate()
                 
                 # Update camera if player was knocked back
-                if is_player and self.camera:
-                    new_position = self.world.get_component(entity_id, Position)
-                    if new_position:
-                        self.camera.follow_entity(new_position.x, new_position.y)
+                if follow:
+                    follow(position.x, position.y)
             else:
                 # Movement was blocked - take collision damage
                 collision_damage = max(2, int(force / 2))  # Increased collision damage based on force
@@ -105,7 +109,7 @@ class PhysicsSystem:
         # Apply minor knockback damage (separate from collision damage)
         if tiles_moved > 0:
             knockback_damage = max(1, int(force / 10))  # Small damage from being knocked back
-            health = self.world.get_component(entity_id, Health)
+            health = get_component(entity_id, Health)
             if health:
                 health.take_damage(knockback_damage)
         
@@ -154,11 +158,13 @@ class PhysicsSystem:
 class KnockbackEffect(Effect):
     """Effect that applies knockback to entities in a radius."""
     
+    __slots__ = ('physics_system',)
+    
     def __init__(self, physics_system: PhysicsSystem):
         super().__init__("knockback")
         self.physics_system = physics_system
     
-    def apply(self, world: 'World', **context) -> None:
+    def apply(self, world: 'World', context: Dict[str, Any]) -> None:
         """Apply knockback effect."""
         target_id = context.get('target_id')
         force = context.get('force', 20.0)
@@ -182,12 +188,14 @@ class KnockbackEffect(Effect):
 class ShockwaveEffect(Effect):
     """Effect that applies knockback to all entities in a radius."""
     
+    __slots__ = ('physics_system', 'movement_system')
+    
     def __init__(self, physics_system: PhysicsSystem, movement_system):
         super().__init__("shockwave")
         self.physics_system = physics_system
         self.movement_system = movement_system
     
-    def apply(self, world: 'World', **context) -> None:
+    def apply(self, world: 'World', context: Dict[str, Any]) -> None:
         """Apply shockwave effect to all entities in radius."""
         center_x = context.get('center_x', 0)
         center_y = context.get('center_y', 0)
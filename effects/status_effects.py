@@ -3,7 +3,7 @@ Status effects system for handling bleeding, poison, etc.
 """
 
 import random
-from typing import TYPE_CHECKING
+from typing import Any, Dict, TYPE_CHECKING
 from .core import Effect
 from components.core import Position
 from components.effects import StatusEffect
@@ -27,29 +27,26 @@ class StatusEffectsSystem:
         """Process all status effects for all entities."""
         entities_with_status = self.world.get_entities_with_components(StatusEffect)
         
+        get_component = self.world.get_component
         for entity_id in entities_with_status:
-            self._process_entity_status_effects(entity_id)
+            status_effect = get_component(entity_id, StatusEffect)
+            if status_effect:
+                self._process_entity_status_effects(entity_id, status_effect)
     
-    def _process_entity_status_effects(self, entity_id: int) -> None:
+    def _process_entity_status_effects(self, entity_id: int, status_effect: StatusEffect) -> None:
         """Process status effects for a single entity."""
-        status_effect = self.world.get_component(entity_id, StatusEffect)
-        if not status_effect:
-            return
-        
         # Process each active effect
-        for effect_name, effect_data in list(status_effect.effects.items()):
+        for effect_name, intensity in list(zip(status_effect.names, status_effect.intensities)):
             if effect_name == "bleeding":
-                self._process_bleeding(entity_id, effect_data)
+                self._process_bleeding(entity_id, intensity)
         
         # Tick down effect durations and remove expired effects
         expired_effects = status_effect.tick_effects()
         for effect_name in expired_effects:
             self._handle_effect_expiration(entity_id, effect_name)
     
-    def _process_bleeding(self, entity_id: int, effect_data: dict) -> None:
+    def _process_bleeding(self, entity_id: int, intensity: int) -> None:
         """Process bleeding effect for an entity."""
-        intensity = effect_data.get('intensity', 1)
-        
         # Apply bleeding damage
         health = self.world.get_component(entity_id, Health)
         if health:
@@ -88,7 +85,7 @@ class StatusEffectsSystem:
         
         ai = self.world.get_component(entity_id, AI)
         if ai:
-            return ai.ai_type.value
+            return ai.ai_type.label
         
         return "entity"
     
@@ -115,11 +112,13 @@ class StatusEffectsSystem:
 class BleedingEffect(Effect):
     """Effect that applies bleeding status to an entity."""
     
+    __slots__ = ('status_effects_system',)
+    
     def __init__(self, status_effects_system: StatusEffectsSystem):
         super().__init__("apply_bleeding")
         self.status_effects_system = status_effects_system
     
-    def apply(self, world: 'World', **context) -> None:
+    def apply(self, world: 'World', context: Dict[str, Any]) -> None:
         """Apply bleeding effect to target."""
         target_id = context.get('target_id')
         intensity = context.get('intensity', 1)
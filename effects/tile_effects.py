@@ -3,7 +3,8 @@ Tile effects system for handling blood splatter and other tile modifications.
 """
 
 import random
-from typing import TYPE_CHECKING
+from functools import lru_cache
+from typing import Any, Callable, Dict, Tuple, TYPE_CHECKING
 from .core import Effect
 from components.effects import TileModification
 
@@ -11,12 +12,63 @@ if TYPE_CHECKING:
     from ecs.world import World
 
 
+# radius -> ((dx, dy, distance, chance), ...) for every tile around the center,
+# in the order splatter rolls are made
+_SPLATTER_OFFSETS: Dict[int, Tuple[Tuple[int, int, int, float], ...]] = {}
+
+
+def _splatter_offsets(radius: int) -> Tuple[Tuple[int, int, int, float], ...]:
+    """Get the splatter lookup table for a radius, building it on first use."""
+    offsets = _SPLATTER_OFFSETS.get(radius)
+    if offsets is None:
+        table = []
+        for dx in range(-radius, radius + 1):
+            for dy in range(-radius, radius + 1):
+                if dx == 0 and dy == 0:
+                    continue  # Center tile is always bloodied
+                # Chance decreases with distance from center
+                distance = max(abs(dx), abs(dy))
+                chance = max(0.1, 1.0 - (distance * 0.3))  # 70% at distance 1, 40% at distance 2, etc.
+                table.append((dx, dy, distance, chance))
+        offsets = _SPLATTER_OFFSETS[radius] = tuple(table)
+    return offsets
+
+
+@lru_cache(maxsize=32)
+def _make_splatter(intensity: int, radius: int) -> Callable[..., int]:
+    """Build a splatter function specialized for one (intensity, radius) pair.
+    
+    Per-tile blood intensities and the tile cap are worked out here once, so
+    each call only rolls and paints. The returned function takes
+    (center_x, center_y, add_blood_tile, roll) and returns how many tiles
+    around the center were bloodied.
+    """
+    # Intensity decreases with distance
+    trials = tuple((dx, dy, chance, max(1, intensity - distance))
+                   for dx, dy, distance, chance in _splatter_offsets(radius))
+    max_tiles = intensity * 2  # Higher intensity affects more tiles
+    
+    def splatter(center_x: int, center_y: int, add_blood_tile, roll) -> int:
+        tiles_affected = 0
+        for dx, dy, chance, blood_intensity in trials:
+            if tiles_affected >= max_tiles:
+                break
+            if roll() < chance:
+                add_blood_tile(center_x + dx, center_y + dy, blood_intensity)
+                tiles_affected += 1
+        return tiles_affected
+    
+    return splatter
+
+
 class TileEffectsSystem:
     """Handles tile modifications like blood splatter."""
     
-    def __init__(self, world: 'World', message_log):
+    def __init__(self, world: 'World', message_log, width: int, height: int):
         self.world = world
         self.message_log = message_log
+        self.width = width
+        self.height = height
         self._tile_modification_entity = None
         self._ensure_tile_modification_entity()
     
@@ -25,7 +77,7 @@ class TileEffectsSystem:
         if self._tile_modification_entity is None:
             # Create a global entity to hold tile modifications
             self._tile_modification_entity = self.world.create_entity()
-            self.world.add_component(self._tile_modification_entity, TileModification())
+            self.world.add_component(self._tile_modification_entity, TileModification(self.width, self.height))
     
     def get_tile_modification(self) -> TileModification:
         """Get the global tile modification component."""
@@ -42,29 +94,8 @@ class TileEffectsSystem:
         tile_mod.add_blood_tile(center_x, center_y, intensity)
         
         # Add blood to surrounding tiles based on intensity and radius
-        tiles_affected = 0
-        max_tiles = intensity * 2  # Higher intensity affects more tiles
-        
-        for dx in range(-radius, radius + 1):
-            for dy in range(-radius, radius + 1):
-                if dx == 0 and dy == 0:
-                    continue  # Skip center tile (already done)
-                
-                if tiles_affected >= max_tiles:
-                    break
-                
-                # Chance decreases with distance from center
-                distance = max(abs(dx), abs(dy))
-                chance = max(0.1, 1.0 - (distance * 0.3))  # 70% at distance 1, 40% at distance 2, etc.
-                
-                if random.random() < chance:
-                    blood_x = center_x + dx
-                    blood_y = center_y + dy
-                    
-                    # Intensity decreases with distance
-                    blood_intensity = max(1, intensity - distance)
-                    tile_mod.add_blood_tile(blood_x, blood_y, blood_intensity)
-                    tiles_affected += 1
+        tiles_affected = _make_splatter(intensity, radius)(
+            center_x, center_y, tile_mod.add_blood_tile, random.random)
         
         if tiles_affected > 0:
             self.message_log.add_info(f"Blood splatters across {tiles_affected + 1} tiles!")
@@ -91,11 +122,13 @@ class TileEffectsSystem:
 class BloodSplatterEffect(Effect):
     """Effect that creates blood splatter on tiles."""
     
+    __slots__ = ('tile_effects_system',)
+    
     def __init__(self, tile_effects_system: TileEffectsSystem):
         super().__init__("blood_splatter")
         self.tile_effects_system = tile_effects_system
     
-    def apply(self, world: 'World', **context) -> None:
+    def apply(self, world: 'World', context: Dict[str, Any]) -> None:
         """Apply blood splatter effect."""
         center_x = context.get('center_x', 0)
         center_y = context.get('center_y', 0)
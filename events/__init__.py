@@ -2,7 +2,7 @@
 Event system for the ECS roguelike game.
 """
 
-from .core import EventManager, Event
+from .core import EventManager, Event, EventType
 from .movement import EntityMovedEvent
 
-__all__ = ['EventManager', 'Event', 'EntityMovedEvent']
+__all__ = ['EventManager', 'Event', 'EventType', 'EntityMovedEvent']
@@ -2,48 +2,103 @@
 Core event system classes.
 """
 
-from typing import Dict, List, Callable, Any
+from enum import IntEnum
+from typing import List, Tuple, Callable, Any
 from abc import ABC, abstractmethod
 
 
+class EventType(IntEnum):
+    """Kinds of events published through the EventManager."""
+    ENTITY_MOVED = 0
+    ENTITY_TELEPORTED = 1
+
+
 class Event(ABC):
-    """Base class for all events."""
-    pass
+    """Base class for all events.
+    
+    Events with _poolable set are released back to their pool after the
+    EventManager has dispatched them (even if a subscriber raised).
+    """
+    
+    __slots__ = ()
+    
+    _poolable = False
 
 
 class EventManager:
-    """Manages event subscriptions and publishing."""
+    """Manages event subscriptions and publishing.
+    
+    Subscribers are kept in a list indexed by EventType, each entry an
+    immutable tuple of callbacks that is rebuilt on (un)subscribe, so
+    emitting is a list index plus a tuple iteration.
+    
+    Exceptions raised by callbacks propagate to the emitter. With debug set,
+    emit and emit_if_subscribed are replaced by variants that log a failing
+    callback and carry on with the rest.
+    """
     
-    def __init__(self):
-        self._subscribers: Dict[str, List[Callable]] = {}
+    def __init__(self, debug: bool = False):
+        self._subscribers: List[Tuple[Callable[[Event], None], ...]] = [()] * len(EventType)
+        if debug:
+            self.emit = self._safe_emit
+            self.emit_if_subscribed = self._safe_emit_if_subscribed
     
-    def subscribe(self, event_type: str, callback: Callable[[Event], None]) -> None:
+    def subscribe(self, event_type: EventType, callback: Callable[[Event], None]) -> None:
         """Subscribe a callback to an event type."""
-        if event_type not in self._subscribers:
-            self._subscribers[event_type] = []
-        self._subscribers[event_type].append(callback)
+        self._subscribers[event_type] += (callback,)
     
-    def unsubscribe(self, event_type: str, callback: Callable[[Event], None]) -> None:
+    def unsubscribe(self, event_type: EventType, callback: Callable[[Event], None]) -> None:
         """Unsubscribe a callback from an event type."""
-        if event_type in self._subscribers:
-            try:
-                self._subscribers[event_type].remove(callback)
-            except ValueError:
-                pass  # Callback wasn't subscribed
+        callbacks = self._subscribers[event_type]
+        if callback in callbacks:
+            index = callbacks.index(callback)
+            self._subscribers[event_type] = callbacks[:index] + callbacks[index + 1:]
     
-    def emit(self, event_type: str, event: Event) -> None:
+    def emit(self, event_type: EventType, event: Event) -> None:
         """Emit an event to all subscribers."""
-        if event_type in self._subscribers:
+        try:
+            for callback in self._subscribers[event_type]:
+                callback(event)
+        finally:
+            if event._poolable:
+                event.release()
+    
+    def emit_if_subscribed(self, event_type: EventType, factory: Callable[..., Event], *args: Any) -> None:
+        """Build an event with factory(*args) and emit it, only if anything is subscribed.
+        
+        Lets hot paths skip allocating the event object when nobody listens.
+        """
+        callbacks = self._subscribers[event_type]
+        if callbacks:
+            event = factory(*args)
+            try:
+                for callback in callbacks:
+                    callback(event)
+            finally:
+                if event._poolable:
+                    event.release()
+    
+    def _safe_emit(self, event_type: EventType, event: Event) -> None:
+        """Debug emit: log and skip callbacks that raise instead of propagating."""
+        try:
             for callback in self._subscribers[event_type]:
                 try:
                     callback(event)
                 except Exception as e:
                     # Log error but don't crash the game
-                    print(f"Error in event callback for {event_type}: {e}")
+                    print(f"Error in event callback for {EventType(event_type).name}: {e}")
+        finally:
+            if event._poolable:
+                event.release()
+    
+    def _safe_emit_if_subscribed(self, event_type: EventType, factory: Callable[..., Event], *args: Any) -> None:
+        """Debug emit_if_subscribed: log and skip callbacks that raise."""
+        if self._subscribers[event_type]:
+            self._safe_emit(event_type, factory(*args))
     
-    def clear_subscribers(self, event_type: str = None) -> None:
+    def clear_subscribers(self, event_type: EventType = None) -> None:
         """Clear all subscribers for an event type, or all subscribers if no type specified."""
         if event_type is None:
-            self._subscribers.clear()
-        elif event_type in self._subscribers:
-            self._subscribers[event_type].clear()
+            self._subscribers = [()] * len(EventType)
+        else:
+            self._subscribers[event_type] = ()
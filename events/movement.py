@@ -3,16 +3,68 @@ Movement-related events.
 """
 
 from .core import Event
-from typing import Tuple
+from typing import List, Tuple
 
 
 class EntityMovedEvent(Event):
-    """Event emitted when an entity moves from one position to another."""
+    """Event emitted when an entity moves from one position to another.
     
-    def __init__(self, entity_id: int, old_pos: Tuple[int, int], new_pos: Tuple[int, int]):
+    Coordinates are stored as plain ints rather than (x, y) tuples so that
+    emitting an event allocates nothing beyond the (pooled) event itself;
+    old_pos and new_pos build tuples on demand for subscribers that want them.
+    
+    Instances created with acquire() are returned to a free list by the
+    EventManager once every subscriber has seen them, so subscribers must
+    not keep a reference to the event after their callback returns.
+    Instances built with the constructor are never pooled.
+    """
+    
+    __slots__ = ('entity_id', 'old_x', 'old_y', 'new_x', 'new_y', '_leased')
+    
+    _poolable = True
+    _pool: List['EntityMovedEvent'] = []
+    _POOL_LIMIT = 32  # Free-list size cap; only a few moves are in flight at once
+    
+    def __init__(self, entity_id: int, old_x: int, old_y: int, new_x: int, new_y: int):
         self.entity_id = entity_id
-        self.old_pos = old_pos  # (x, y) tuple
-        self.new_pos = new_pos  # (x, y) tuple
+        self.old_x = old_x
+        self.old_y = old_y
+        self.new_x = new_x
+        self.new_y = new_y
+        self._leased = False  # True while handed out by acquire()
+    
+    @classmethod
+    def acquire(cls, entity_id: int, old_x: int, old_y: int, new_x: int, new_y: int) -> 'EntityMovedEvent':
+        """Get an event from the free list (or a new one) filled with these values."""
+        pool = cls._pool
+        if pool:
+            event = pool.pop()
+            event.entity_id = entity_id
+            event.old_x = old_x
+            event.old_y = old_y
+            event.new_x = new_x
+            event.new_y = new_y
+        else:
+            event = cls(entity_id, old_x, old_y, new_x, new_y)
+        event._leased = True
+        return event
+    
+    def release(self) -> None:
+        """Return an acquired event to the free list; other events are left alone."""
+        if not self._leased:
+            return
+        self._leased = False
+        pool = type(self)._pool
+        if len(pool) < self._POOL_LIMIT:
+            pool.append(self)
+    
+    @property
+    def old_pos(self) -> Tuple[int, int]:
+        return self.old_x, self.old_y
+    
+    @property
+    def new_pos(self) -> Tuple[int, int]:
+        return self.new_x, self.new_y
     
     def __repr__(self):
         return f"EntityMovedEvent(entity_id={self.entity_id}, old_pos={self.old_pos}, new_pos={self.new_pos})"
@@ -21,11 +73,24 @@ class EntityMovedEvent(Event):
 class EntityTeleportedEvent(Event):
     """Event emitted when an entity teleports (for special movement like stairs)."""
     
-    def __init__(self, entity_id: int, old_pos: Tuple[int, int], new_pos: Tuple[int, int], teleport_type: str = "unknown"):
+    __slots__ = ('entity_id', 'old_x', 'old_y', 'new_x', 'new_y', 'teleport_type')
+    
+    def __init__(self, entity_id: int, old_x: int, old_y: int, new_x: int, new_y: int,
+                 teleport_type: str = "unknown"):
         self.entity_id = entity_id
-        self.old_pos = old_pos
-        self.new_pos = new_pos
+        self.old_x = old_x
+        self.old_y = old_y
+        self.new_x = new_x
+        self.new_y = new_y
         self.teleport_type = teleport_type  # "stairs", "magic", etc.
     
+    @property
+    def old_pos(self) -> Tuple[int, int]:
+        return self.old_x, self.old_y
+    
+    @property
+    def new_pos(self) -> Tuple[int, int]:
+        return self.new_x, self.new_y
+    
     def __repr__(self):
         return f"EntityTeleportedEvent(entity_id={self.entity_id}, old_pos={self.old_pos}, new_pos={self.new_pos}, type={self.teleport_type})"
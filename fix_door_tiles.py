@@ -8,12 +8,36 @@ import json
 import sys
 import os
 
+try:
+    import orjson  # Optional: much faster parsing/serialization for large saves
+except ImportError:
+    orjson = None
+
+
+def _load_save(save_path):
+    """Read and parse a save file, using orjson when it is installed."""
+    if orjson is not None:
+        with open(save_path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(save_path, 'r') as f:
+        return json.load(f)
+
+
+def _write_save(save_path, save_data):
+    """Write a save file with 2-space indentation, using orjson when it is installed."""
+    if orjson is not None:
+        with open(save_path, 'wb') as f:
+            f.write(orjson.dumps(save_data, option=orjson.OPT_INDENT_2))
+        return
+    with open(save_path, 'w') as f:
+        json.dump(save_data, f, indent=2)
+
+
 def fix_door_tiles_in_save(save_path):
     """Fix door tiles in a save file by converting them to entities."""
     
     # Load the save file
-    with open(save_path, 'r') as f:
-        save_data = json.load(f)
+    save_data = _load_save(save_path)
     
     print(f"Fixing door tiles in {save_path}")
     
@@ -22,14 +46,23 @@ def fix_door_tiles_in_save(save_path):
     
     # Get the next available entity ID
     world_state = save_data['world_state']
+    components = world_state['components']
     entity_ids = []
     
     # Collect all existing entity IDs
-    for component_type, entities in world_state['components'].items():
+    for component_type, entities in components.items():
         entity_ids.extend([int(eid) for eid in entities.keys()])
     
     next_entity_id = max(entity_ids) + 1 if entity_ids else 1
     
+    # New door components, merged into the save in one update per type after the scan
+    new_components = {'Position': {}, 'Door': {}, 'Renderable': {}, 'Visible': {}, 'Blocking': {}}
+    new_positions = new_components['Position']
+    new_doors = new_components['Door']
+    new_renderables = new_components['Renderable']
+    new_visibles = new_components['Visible']
+    new_blockings = new_components['Blocking']
+    
     # Process each level
     levels = save_data['levels']
     for level_id, level_data in levels.items():
@@ -38,20 +71,18 @@ def fix_door_tiles_in_save(save_path):
         tiles = level_data['tiles']
         level_entities = set(level_data['entities'])
         
+        # Index this level's entities by position (first entity wins, as in save order)
+        pos_index = {}
+        for entity_id, pos_data in components.get('Position', {}).items():
+            if int(entity_id) in level_entities:
+                pos_index.setdefault((pos_data['x'], pos_data['y']), int(entity_id))
+        
         # Scan for door tiles that don't have corresponding entities
         for y, row in enumerate(tiles):
             for x, tile in enumerate(row):
-                if tile['tile_type'] in ['door_closed', 'door_open']:
+                if tile['tile_type'] in ('door_closed', 'door_open'):
                     # Check if there's already an entity at this position
-                    entity_at_pos = None
-                    
-                    # Look through Position components to find entity at this position
-                    positions = world_state['components'].get('Position', {})
-                    for entity_id, pos_data in positions.items():
-                        if (pos_data['x'] == x and pos_data['y'] == y and 
-                            int(entity_id) in level_entities):
-                            entity_at_pos = int(entity_id)
-                            break
+                    entity_at_pos = pos_index.get((x, y))
                     
                     if entity_at_pos is None:
                         # No entity at this position - create one
@@ -59,45 +90,36 @@ def fix_door_tiles_in_save(save_path):
                         
                         # Determine door state
                         is_open = (tile['tile_type'] == 'door_open')
+                        eid_str = str(next_entity_id)
                         
                         # Add Position component
-                        if 'Position' not in world_state['components']:
-                            world_state['components']['Position'] = {}
-                        world_state['components']['Position'][str(next_entity_id)] = {
+                        new_positions[eid_str] = {
                             'x': x,
                             'y': y
                         }
                         
                         # Add Door component
-                        if 'Door' not in world_state['components']:
-                            world_state['components']['Door'] = {}
-                        world_state['components']['Door'][str(next_entity_id)] = {
+                        new_doors[eid_str] = {
                             'is_open': is_open
                         }
                         
                         # Add Renderable component
-                        if 'Renderable' not in world_state['components']:
-                            world_state['components']['Renderable'] = {}
                         # Use glyph config for door characters
                         # For this utility script, we'll use the same characters as defined in glyphs.yaml
                         door_char = '/' if is_open else '+'
-                        world_state['components']['Renderable'][str(next_entity_id)] = {
+                        new_renderables[eid_str] = {
                             'char': door_char,
                             'color': 'brown'
                         }
                         
                         # Add Visible component
-                        if 'Visible' not in world_state['components']:
-                            world_state['components']['Visible'] = {}
-                        world_state['components']['Visible'][str(next_entity_id)] = {
+                        new_visibles[eid_str] = {
                             'visible': False
                         }
                         
                         # Add Blocking component if door is closed
                         if not is_open:
-                            if 'Blocking' not in world_state['components']:
-                                world_state['components']['Blocking'] = {}
-                            world_state['components']['Blocking'][str(next_entity_id)] = {}
+                            new_blockings[eid_str] = {}
                         
                         # Add entity to level
                         level_data['entities'].append(next_entity_id)
@@ -111,14 +133,17 @@ def fix_door_tiles_in_save(save_path):
                         doors_fixed += 1
                         next_entity_id += 1
     
+    for component_type, new_entries in new_components.items():
+        if new_entries:
+            components.setdefault(component_type, {}).update(new_entries)
+    
     if doors_fixed > 0:
         # Save the fixed file
         backup_path = save_path + '.backup'
         print(f"Creating backup at {backup_path}")
         os.rename(save_path, backup_path)
         
-        with open(save_path, 'w') as f:
-            json.dump(save_data, f, indent=2)
+        _write_save(save_path, save_data)
         
         print(f"Fixed {doors_fixed} door tiles and saved to {save_path}")
         print(f"Original save backed up to {backup_path}")
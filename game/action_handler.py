@@ -3,7 +3,12 @@ Player action handling logic.
 """
 
 from components.core import Position, Player
-from components.items import Inventory, Item, Equipment, Consumable, EquipmentSlots
+from components.items import Inventory, Item, EquipmentSlots, LightEmitter
+from components.auto_explore import AutoExplore
+from systems.menus.equip_menu import EquipMenu, EQUIP_ENTRY, UNEQUIP_ENTRY
+from systems.menus.use_menu import UseMenu
+from systems.menus.drop_menu import DropMenu
+from systems.menus.throwing_menu import ThrowingMenu
 
 
 class ActionHandler:
@@ -15,12 +20,34 @@ class ActionHandler:
         self.game_state = game_state
         self.message_log = message_log
         self.render_system = render_system
+        # Bound once: the render system keeps the same camera for the whole game
+        self._invalidate_cache = render_system.invalidate_cache
+        self._camera = render_system.camera
         self.movement_system = movement_system
         self.combat_system = combat_system
         self.inventory_system = inventory_system
         self.throwing_system = throwing_system
         self.level_manager = level_manager
         self.auto_explore_system = auto_explore_system
+        
+        # Active menu class -> item selection handler
+        self._menu_dispatch = {
+            EquipMenu: self._handle_equip_selection,
+            UseMenu: self._handle_use_selection,
+            DropMenu: self._handle_drop_selection,
+            ThrowingMenu: self._handle_throwing_selection,
+        }
+        
+        # Item examination action name -> handler
+        self._item_actions = {
+            "Drop": self._action_drop,
+            "Equip": self._action_equip,
+            "Unequip": self._action_unequip,
+            "Use": self._action_use,
+            "Light": self._action_light,
+            "Extinguish": self._action_extinguish,
+            "Throw": self._action_throw,
+        }
     
     def handle_player_movement(self, player_entity: int, dx: int, dy: int) -> None:
         """Handle player movement or attack."""
@@ -38,28 +65,23 @@ class ActionHandler:
             # Attack the target
             self.combat_system.attack(player_entity, target_entity)
             # Invalidate render cache since entity positions may have changed due to combat/knockback
-            self.render_system.invalidate_cache()
+            self._invalidate_cache()
         else:
             # Try to move
-            success = self.movement_system.try_move_entity(player_entity, dx, dy)
+            new_pos = self.movement_system.try_move_entity(player_entity, dx, dy)
             
-            if success:
+            if new_pos:
                 # Invalidate render cache since player moved
-                self.render_system.invalidate_cache()
+                self._invalidate_cache()
                 
                 # Update camera to follow player
-                new_position = self.world.get_component(player_entity, Position)
-                if new_position:
-                    from game.camera import Camera
-                    # Get camera from render system
-                    camera = self.render_system.camera
-                    camera.follow_entity(new_position.x, new_position.y)
-                    
-                    # Check for stairs and handle level transitions
-                    self.level_manager.check_stairs_interaction(player_entity, new_position.x, new_position.y)
+                new_x, new_y = new_pos
+                self._camera.follow_entity(new_x, new_y)
+                
+                # Check for stairs and handle level transitions
+                self.level_manager.check_stairs_interaction(player_entity, new_x, new_y)
             else:
                 # Movement blocked
-                from game.level_world_gen import LevelWorldGenerator
                 # Get world generator from render system
                 world_generator = self.render_system.world_generator
                 if world_generator.is_wall_at(target_x, target_y):
@@ -81,34 +103,30 @@ class ActionHandler:
             return
         
         # Try to pick up all items
-        picked_up_count = 0
-        current_level = self.game_state.get_current_level()
+        pickup_item = self.inventory_system.pickup_item
+        picked_up = [item_entity_id for item_entity_id in items_at_pos
+                     if pickup_item(player_entity, item_entity_id)]
         
-        for item_entity_id in items_at_pos:
-            if self.inventory_system.pickup_item(player_entity, item_entity_id):
-                picked_up_count += 1
-                # Remove item from current level's entity list
-                if current_level:
-                    current_level.remove_entity(item_entity_id)
-                # Invalidate render cache since item was removed from world
-                self.render_system.invalidate_cache()
-        
-        if picked_up_count == 0:
+        if not picked_up:
             self.message_log.add_warning("Your inventory is full!")
+            return
+        
+        # Remove items from current level's entity list
+        current_level = self.game_state.get_current_level()
+        if current_level:
+            current_level.remove_entities(picked_up)
+        # Invalidate render cache once since items were removed from world
+        self._invalidate_cache()
     
     def handle_item_selection(self, player_entity: int, item_number: int) -> None:
         """Handle item selection from menus."""
         # Check which menu is active using the menu manager
         menu_manager = self.render_system.menu_manager
+        active_menu = menu_manager.active_menu
+        handler = self._menu_dispatch.get(type(active_menu)) if active_menu else None
         
-        if menu_manager.active_menu and menu_manager.active_menu.__class__.__name__ == 'EquipMenu':
-            self._handle_equip_selection(player_entity, item_number)
-        elif menu_manager.active_menu and menu_manager.active_menu.__class__.__name__ == 'UseMenu':
-            self._handle_use_selection(player_entity, item_number)
-        elif menu_manager.active_menu and menu_manager.active_menu.__class__.__name__ == 'DropMenu':
-            self._handle_drop_selection(player_entity, item_number)
-        elif menu_manager.active_menu and menu_manager.active_menu.__class__.__name__ == 'ThrowingMenu':
-            self._handle_throwing_selection(player_entity, item_number)
+        if handler:
+            handler(player_entity, item_number)
         elif menu_manager.is_inventory_shown():
             # Just show item info for now
             inventory = self.world.get_component(player_entity, Inventory)
@@ -120,33 +138,15 @@ class ActionHandler:
     
     def _handle_equip_selection(self, player_entity: int, item_number: int) -> None:
         """Handle equipment selection."""
-        # Build the same list as the render system
-        inventory = self.world.get_component(player_entity, Inventory)
-        equipment_slots = self.world.get_component(player_entity, EquipmentSlots)
-        
-        if not inventory or not equipment_slots:
-            return
-        
-        # Build equip menu items list - same logic as render system
-        equip_items = []
-        
-        # Add equippable items from inventory
-        for item_entity_id in inventory.items:
-            equipment = self.world.get_component(item_entity_id, Equipment)
-            if equipment:
-                equip_items.append(('equip', item_entity_id))
-        
-        # Add equipped items for unequipping
-        equipped_items = equipment_slots.get_equipped_items()
-        for slot, item_entity_id in equipped_items.items():
-            if item_entity_id:
-                equip_items.append(('unequip', item_entity_id, slot))
+        # Use the list the equip menu displayed
+        equip_items = self.render_system.menu_manager.menus['equip'].get_entries(player_entity)
         
         # Handle selection
         if 1 <= item_number <= len(equip_items):
             item_info = equip_items[item_number - 1]
+            tag = item_info[0]
             
-            if item_info[0] == 'equip':
+            if tag == EQUIP_ENTRY:
                 # Equip item
                 _, item_entity_id = item_info
                 success = self.inventory_system.equip_item(player_entity, item_entity_id)
@@ -154,7 +154,7 @@ class ActionHandler:
                     self.render_system.hide_all_menus()
                 else:
                     self.message_log.add_warning("Cannot equip that item.")
-            elif item_info[0] == 'unequip':
+            elif tag == UNEQUIP_ENTRY:
                 # Unequip item
                 _, item_entity_id, slot = item_info
                 success = self.inventory_system.unequip_item(player_entity, slot)
@@ -167,16 +167,8 @@ class ActionHandler:
     
     def _handle_use_selection(self, player_entity: int, item_number: int) -> None:
         """Handle consumable use selection."""
-        inventory = self.world.get_component(player_entity, Inventory)
-        if not inventory:
-            return
-        
-        # Build list of consumable items
-        consumable_items = []
-        for item_entity_id in inventory.items:
-            consumable = self.world.get_component(item_entity_id, Consumable)
-            if consumable:
-                consumable_items.append(item_entity_id)
+        # Use the list the use menu displayed
+        consumable_items = self.render_system.menu_manager.menus['use'].get_entries(player_entity)
         
         # Handle selection
         if 1 <= item_number <= len(consumable_items):
@@ -203,18 +195,15 @@ class ActionHandler:
                 if current_level:
                     current_level.add_entity(item_entity_id)
                 # Invalidate render cache since item was added to world
-                self.render_system.invalidate_cache()
+                self._invalidate_cache()
                 self.render_system.hide_all_menus()
         else:
             self.message_log.add_warning("Invalid selection.")
     
     def _handle_throwing_selection(self, player_entity: int, item_number: int) -> None:
         """Handle throwing item selection."""
-        from systems.menus.throwing_menu import ThrowingMenu
-        
-        # Get throwable items using the throwing menu's method
-        throwing_menu = self.render_system.menu_manager.menus['throwing']
-        throwable_items = throwing_menu.get_throwable_items(player_entity)
+        # Use the list the throwing menu displayed
+        throwable_items = self.render_system.menu_manager.menus['throwing'].get_entries(player_entity)
         
         # Handle selection
         if 1 <= item_number <= len(throwable_items):
@@ -237,7 +226,6 @@ class ActionHandler:
             self.message_log.add_warning("Auto-explore system not available.")
             return
         
-        from components.auto_explore import AutoExplore
         auto_explore = self.world.get_component(player_entity, AutoExplore)
         
         if auto_explore and auto_explore.is_active():
@@ -249,37 +237,24 @@ class ActionHandler:
     
     def handle_use_stairs_down(self, player_entity: int) -> None:
         """Handle using downward stairs at current position."""
-        position = self.world.get_component(player_entity, Position)
-        if not position:
-            return
-        
-        # Check if player is on downward stairs
-        from game.level_world_gen import LevelWorldGenerator
-        world_generator = self.render_system.world_generator
-        stairs_type = world_generator.is_stairs_at(position.x, position.y)
-        
-        if stairs_type == 'down':
-            # Player is on downward stairs - use them
-            self.level_manager.use_stairs_down(player_entity)
-        else:
-            self.message_log.add_warning("You're not standing on downward stairs.")
+        self._handle_use_stairs(player_entity, 'down', self.level_manager.use_stairs_down)
     
     def handle_use_stairs_up(self, player_entity: int) -> None:
         """Handle using upward stairs at current position."""
+        self._handle_use_stairs(player_entity, 'up', self.level_manager.use_stairs_up)
+    
+    def _handle_use_stairs(self, player_entity: int, stairs_wanted: str, use_stairs) -> None:
+        """Use the stairs under the player if they go the wanted way ('up' or 'down')."""
         position = self.world.get_component(player_entity, Position)
         if not position:
             return
         
-        # Check if player is on upward stairs
-        from game.level_world_gen import LevelWorldGenerator
+        # Check if player is on stairs going the wanted way
         world_generator = self.render_system.world_generator
-        stairs_type = world_generator.is_stairs_at(position.x, position.y)
-        
-        if stairs_type == 'up':
-            # Player is on upward stairs - use them
-            self.level_manager.use_stairs_up(player_entity)
+        if world_generator.is_stairs_at(position.x, position.y) == stairs_wanted:
+            use_stairs(player_entity)
         else:
-            self.message_log.add_warning("You're not standing on upward stairs.")
+            self.message_log.add_warning(f"You're not standing on {stairs_wanted}ward stairs.")
     
     def handle_travel_to_stairs_down(self, player_entity: int) -> None:
         """Handle traveling to downward stairs."""
@@ -351,70 +326,74 @@ class ActionHandler:
     
     def _execute_item_action(self, player_entity: int, item_entity_id: int, action: str) -> None:
         """Execute the selected action on an item."""
-        if action == "Drop":
-            success = self.inventory_system.drop_item(player_entity, item_entity_id)
-            if success:
-                # Add dropped item to current level's entity list
-                current_level = self.game_state.get_current_level()
-                if current_level:
-                    current_level.add_entity(item_entity_id)
-                # Invalidate render cache since item was added to world
-                self.render_system.invalidate_cache()
-                self.render_system.hide_all_menus()
-        
-        elif action == "Equip":
-            success = self.inventory_system.equip_item(player_entity, item_entity_id)
-            if success:
-                self.render_system.hide_all_menus()
-            else:
-                self.message_log.add_warning("Cannot equip that item.")
-        
-        elif action == "Unequip":
-            # Find which slot this item is equipped in
-            from components.items import EquipmentSlots
-            equipment_slots = self.world.get_component(player_entity, EquipmentSlots)
-            if equipment_slots:
-                equipped_items = equipment_slots.get_equipped_items()
-                for slot, equipped_item_id in equipped_items.items():
-                    if equipped_item_id == item_entity_id:
-                        success = self.inventory_system.unequip_item(player_entity, slot)
-                        if success:
-                            self.render_system.hide_all_menus()
-                        else:
-                            self.message_log.add_warning("Cannot unequip that item.")
-                        return
-                self.message_log.add_warning("Item is not equipped.")
-        
-        elif action == "Use":
-            success = self.inventory_system.use_consumable(player_entity, item_entity_id)
-            if success:
-                self.render_system.hide_all_menus()
-        
-        elif action == "Light":
-            self._handle_light_action(item_entity_id, True)
-            self.render_system.hide_all_menus()
-        
-        elif action == "Extinguish":
-            self._handle_light_action(item_entity_id, False)
-            self.render_system.hide_all_menus()
-        
-        elif action == "Throw":
-            # Start throwing with the selected item
-            success = self.throwing_system.start_throwing(player_entity, item_entity_id)
-            if success:
-                self.render_system.hide_all_menus()
-                # Request render to show the targeting cursor
-                self.game_state.request_render()
-            else:
-                self.message_log.add_warning("Cannot throw that item.")
-        
-        else:
+        handler = self._item_actions.get(action)
+        if not handler:
             self.message_log.add_warning(f"Unknown action: {action}")
+        elif handler(player_entity, item_entity_id):
+            # Action handlers return True when the menus should close
+            self.render_system.hide_all_menus()
+    
+    def _action_drop(self, player_entity: int, item_entity_id: int) -> bool:
+        """Drop an item from the examination menu."""
+        if not self.inventory_system.drop_item(player_entity, item_entity_id):
+            return False
+        # Add dropped item to current level's entity list
+        current_level = self.game_state.get_current_level()
+        if current_level:
+            current_level.add_entity(item_entity_id)
+        # Invalidate render cache since item was added to world
+        self._invalidate_cache()
+        return True
+    
+    def _action_equip(self, player_entity: int, item_entity_id: int) -> bool:
+        """Equip an item from the examination menu."""
+        if self.inventory_system.equip_item(player_entity, item_entity_id):
+            return True
+        self.message_log.add_warning("Cannot equip that item.")
+        return False
+    
+    def _action_unequip(self, player_entity: int, item_entity_id: int) -> bool:
+        """Unequip an item from the examination menu."""
+        equipment_slots = self.world.get_component(player_entity, EquipmentSlots)
+        if not equipment_slots:
+            return False
+        
+        # Find which slot this item is equipped in
+        slot = equipment_slots.get_item_slot(item_entity_id)
+        if slot is None:
+            self.message_log.add_warning("Item is not equipped.")
+            return False
+        
+        if self.inventory_system.unequip_item(player_entity, slot):
+            return True
+        self.message_log.add_warning("Cannot unequip that item.")
+        return False
+    
+    def _action_use(self, player_entity: int, item_entity_id: int) -> bool:
+        """Use a consumable from the examination menu."""
+        return self.inventory_system.use_consumable(player_entity, item_entity_id)
+    
+    def _action_light(self, player_entity: int, item_entity_id: int) -> bool:
+        """Light a light source from the examination menu."""
+        self._handle_light_action(item_entity_id, True)
+        return True
+    
+    def _action_extinguish(self, player_entity: int, item_entity_id: int) -> bool:
+        """Extinguish a light source from the examination menu."""
+        self._handle_light_action(item_entity_id, False)
+        return True
+    
+    def _action_throw(self, player_entity: int, item_entity_id: int) -> bool:
+        """Start throwing an item from the examination menu."""
+        if not self.throwing_system.start_throwing(player_entity, item_entity_id):
+            self.message_log.add_warning("Cannot throw that item.")
+            return False
+        # Request render to show the targeting cursor
+        self.game_state.request_render()
+        return True
     
     def _handle_light_action(self, item_entity_id: int, activate: bool) -> None:
         """Handle lighting or extinguishing a light source."""
-        from components.items import LightEmitter, Item
-        
         light = self.world.get_component(item_entity_id, LightEmitter)
         item = self.world.get_component(item_entity_id, Item)
         
@@ -9,68 +9,133 @@ from game.config import GameConfig
 class Camera:
     """Manages the viewport for level-based dungeon exploration."""
     
+    __slots__ = ('_viewport_width', '_viewport_height', '_x', '_y',
+                 'left', 'top', 'right', 'bottom',
+                 '_level_width', '_level_height', '_half_width', '_half_height', '_max_x', '_max_y')
+    
     def __init__(self, viewport_width: int = 55, viewport_height: int = 23):
-        self.viewport_width = viewport_width
-        self.viewport_height = viewport_height
-        self.x = 0  # Camera's X position
-        self.y = 0  # Camera's Y position
+        self._viewport_width = viewport_width
+        self._viewport_height = viewport_height
+        self._x = 0  # Camera's X position
+        self._y = 0  # Camera's Y position
+        # Viewport edges in world coordinates (right/bottom exclusive),
+        # recomputed whenever position or size changes
+        self._update_bounds()
         
         # Level bounds for camera constraint
-        self.level_width = GameConfig.LEVEL_WIDTH
-        self.level_height = GameConfig.LEVEL_HEIGHT
+        self._level_width = GameConfig.LEVEL_WIDTH
+        self._level_height = GameConfig.LEVEL_HEIGHT
+        self._update_limits()
+    
+    @property
+    def x(self) -> int:
+        return self._x
+    
+    @x.setter
+    def x(self, value: int) -> None:
+        self._x = value
+        self._update_bounds()
+    
+    @property
+    def y(self) -> int:
+        return self._y
+    
+    @y.setter
+    def y(self, value: int) -> None:
+        self._y = value
+        self._update_bounds()
+    
+    @property
+    def viewport_width(self) -> int:
+        return self._viewport_width
+    
+    @viewport_width.setter
+    def viewport_width(self, value: int) -> None:
+        self._viewport_width = value
+        self._update_limits()
+        self._update_bounds()
+    
+    @property
+    def viewport_height(self) -> int:
+        return self._viewport_height
+    
+    @viewport_height.setter
+    def viewport_height(self, value: int) -> None:
+        self._viewport_height = value
+        self._update_limits()
+        self._update_bounds()
+    
+    @property
+    def level_width(self) -> int:
+        return self._level_width
+    
+    @level_width.setter
+    def level_width(self, value: int) -> None:
+        self._level_width = value
+        self._update_limits()
+    
+    @property
+    def level_height(self) -> int:
+        return self._level_height
+    
+    @level_height.setter
+    def level_height(self, value: int) -> None:
+        self._level_height = value
+        self._update_limits()
+    
+    def _update_limits(self) -> None:
+        """Recompute the centering offsets and furthest camera position for the level."""
+        self._half_width = self._viewport_width // 2
+        self._half_height = self._viewport_height // 2
+        # Levels no bigger than the viewport pin the camera to 0
+        self._max_x = max(0, self._level_width - self._viewport_width)
+        self._max_y = max(0, self._level_height - self._viewport_height)
+    
+    def _update_bounds(self) -> None:
+        """Recompute the viewport edge attributes."""
+        self.left = self._x
+        self.top = self._y
+        self.right = self._x + self._viewport_width
+        self.bottom = self._y + self._viewport_height
     
     def follow_entity(self, entity_x: int, entity_y: int) -> None:
         """Update camera to follow an entity (usually the player)."""
         # Center the camera on the entity
-        target_x = entity_x - self.viewport_width // 2
-        target_y = entity_y - self.viewport_height // 2
-        
-        # Constrain camera to level bounds
-        self.x = max(0, min(target_x, self.level_width - self.viewport_width))
-        self.y = max(0, min(target_y, self.level_height - self.viewport_height))
-        
-        # If the level is smaller than or equal to viewport, center it
-        if self.level_width <= self.viewport_width:
-            self.x = 0
-        if self.level_height <= self.viewport_height:
-            self.y = 0
+        self._move_to(entity_x - self._half_width, entity_y - self._half_height)
     
     def get_viewport_bounds(self) -> Tuple[int, int, int, int]:
-        """Get the bounds of the current viewport in global coordinates."""
-        left = self.x
-        right = self.x + self.viewport_width
-        top = self.y
-        bottom = self.y + self.viewport_height
-        return left, top, right, bottom
+        """Get the bounds of the current viewport in global coordinates.
+        
+        Kept for existing callers; prefer the left/top/right/bottom attributes.
+        """
+        return self.left, self.top, self.right, self.bottom
     
     def world_to_screen(self, world_x: int, world_y: int) -> Tuple[int, int]:
         """Convert world coordinates to screen coordinates."""
-        screen_x = world_x - self.x
-        screen_y = world_y - self.y
-        return screen_x, screen_y
+        return world_x - self._x, world_y - self._y
     
     def screen_to_world(self, screen_x: int, screen_y: int) -> Tuple[int, int]:
         """Convert screen coordinates to world coordinates."""
-        world_x = screen_x + self.x
-        world_y = screen_y + self.y
-        return world_x, world_y
+        return screen_x + self._x, screen_y + self._y
     
     def is_in_viewport(self, world_x: int, world_y: int) -> bool:
         """Check if a world position is visible in the current viewport."""
-        left, top, right, bottom = self.get_viewport_bounds()
-        return left <= world_x < right and top <= world_y < bottom
+        return self.left <= world_x < self.right and self.top <= world_y < self.bottom
     
     def set_level_bounds(self, width: int, height: int) -> None:
         """Update the camera's level bounds for a new level."""
-        self.level_width = width
-        self.level_height = height
+        self._level_width = width
+        self._level_height = height
+        self._update_limits()
         
         # Recalculate camera position to ensure it's within new bounds
-        self.x = max(0, min(self.x, self.level_width - self.viewport_width))
-        self.y = max(0, min(self.y, self.level_height - self.viewport_height))
-        
-        # If the level is smaller than or equal to viewport, center it
-        if self.level_width <= self.viewport_width:
-            self.x = 0
-        if self.level_height <= self.viewport_height:
-            self.y = 0
+        self._move_to(self._x, self._y)
+    
+    def _move_to(self, target_x: int, target_y: int) -> None:
+        """Move the camera to a position, constrained to the level bounds."""
+        # Constrain camera to level bounds
+        max_x = self._max_x
+        max_y = self._max_y
+        self._x = target_x if 0 <= target_x <= max_x else (0 if target_x < 0 else max_x)
+        self._y = target_y if 0 <= target_y <= max_y else (0 if target_y < 0 else max_y)
+        self._update_bounds()
@@ -2,38 +2,71 @@
 Utility functions for calculating derived stats from character attributes.
 """
 
+from typing import NamedTuple
 from components.character import CharacterAttributes, Experience
 from components.combat import Health
+from components.items import EquipmentSlots, Equipment
+
+_ATTRIBUTE_NAMES = frozenset(CharacterAttributes.__slots__)
+
+
+# Stat formulas over plain ints, shared by the calculate_* helpers and
+# compute_derived_stats so each formula is defined once
+
+def _max_hp(constitution: int, strength: int, level: int, base_hp: int = 30) -> int:
+    return base_hp + (constitution * 2) + (strength * 1) + (level * 2)
+
+
+def _attack_power(strength: int, level: int, base_attack: int = 5) -> int:
+    return base_attack + strength + (level // 2)
+
+
+def _evasion(agility: int, level: int, base_evasion: int = 5) -> int:
+    return base_evasion + agility + (level // 3)
+
+
+def _damage_reduction(constitution: int, equipment_bonus: int = 0) -> int:
+    return (constitution // 3) + equipment_bonus
+
+
+def _speed(agility: int, base_speed: int = 100) -> int:
+    return base_speed + (agility * 2)
 
 
 def calculate_max_hp(attributes: CharacterAttributes, level: int = 1, base_hp: int = 30) -> int:
     """Calculate maximum HP from attributes and level."""
-    return base_hp + (attributes.constitution * 2) + (attributes.strength * 1) + (level * 2)
+    return _max_hp(attributes.constitution, attributes.strength, level, base_hp)
 
 
 def calculate_attack_power(attributes: CharacterAttributes, level: int = 1, base_attack: int = 5) -> int:
     """Calculate attack power from attributes and level."""
-    return base_attack + attributes.strength + (level // 2)
+    return _attack_power(attributes.strength, level, base_attack)
 
 
 def calculate_evasion(attributes: CharacterAttributes, level: int = 1, base_evasion: int = 5) -> int:
     """Calculate evasion from attributes and level."""
-    return base_evasion + attributes.agility + (level // 3)
+    return _evasion(attributes.agility, level, base_evasion)
 
 
 def calculate_damage_reduction(attributes: CharacterAttributes, equipment_bonus: int = 0) -> int:
     """Calculate damage reduction from constitution and equipment."""
-    return (attributes.constitution // 3) + equipment_bonus
+    return _damage_reduction(attributes.constitution, equipment_bonus)
 
 
 def get_total_equipment_bonuses(world, entity_id: int) -> dict:
-    """Get total equipment bonuses for an entity."""
-    from components.items import EquipmentSlots, Equipment
+    """Get total equipment bonuses for an entity.
     
+    The totals are cached on EquipmentSlots until a slot changes, so callers
+    must treat the returned dict as read-only.
+    """
     equipment_slots = world.get_component(entity_id, EquipmentSlots)
     if not equipment_slots:
         return {'attack': 0, 'defense': 0, 'attributes': {}}
     
+    bonuses = equipment_slots.get_cached_bonuses()
+    if bonuses is not None:
+        return bonuses
+    
     total_attack = 0
     total_defense = 0
     total_attributes = {}
@@ -49,33 +82,71 @@ def get_total_equipment_bonuses(world, entity_id: int) -> dict:
                 for attr, bonus in equipment.attribute_bonuses.items():
                     total_attributes[attr] = total_attributes.get(attr, 0) + bonus
     
-    return {
+    bonuses = {
         'attack': total_attack,
         'defense': total_defense,
         'attributes': total_attributes
     }
+    equipment_slots.set_cached_bonuses(bonuses)
+    return bonuses
 
 
 def get_effective_attributes(attributes: CharacterAttributes, equipment_bonuses: dict) -> CharacterAttributes:
     """Get effective attributes including equipment bonuses."""
     attr_bonuses = equipment_bonuses.get('attributes', {})
     
-    # Create a copy with bonuses applied
+    # Create a copy, then add only the bonuses that are present (usually few or none)
     effective_attrs = CharacterAttributes(
-        strength=attributes.strength + attr_bonuses.get('strength', 0),
-        agility=attributes.agility + attr_bonuses.get('agility', 0),
-        constitution=attributes.constitution + attr_bonuses.get('constitution', 0),
-        intelligence=attributes.intelligence + attr_bonuses.get('intelligence', 0),
-        willpower=attributes.willpower + attr_bonuses.get('willpower', 0),
-        perception=attributes.perception + attr_bonuses.get('perception', 0)
+        attributes.strength, attributes.agility, attributes.constitution,
+        attributes.intelligence, attributes.willpower, attributes.perception
     )
+    for attr, bonus in attr_bonuses.items():
+        if attr in _ATTRIBUTE_NAMES:
+            setattr(effective_attrs, attr, getattr(effective_attrs, attr) + bonus)
     
     return effective_attrs
 
 
+class DerivedStats(NamedTuple):
+    """All stats derived from effective attributes, level and equipment."""
+    max_hp: int
+    attack_power: int
+    evasion: int
+    damage_reduction: int
+    speed: int
+    agility: int
+
+
+def compute_derived_stats(attributes: CharacterAttributes, equipment_bonuses: dict, level: int = 1) -> DerivedStats:
+    """Compute every derived stat in one pass.
+    
+    Equivalent to get_effective_attributes followed by the calculate_* helpers
+    (with equipment attack and defense added), without building an
+    intermediate CharacterAttributes.
+    """
+    attr_bonuses = equipment_bonuses.get('attributes', {})
+    if attr_bonuses:
+        strength = attributes.strength + attr_bonuses.get('strength', 0)
+        agility = attributes.agility + attr_bonuses.get('agility', 0)
+        constitution = attributes.constitution + attr_bonuses.get('constitution', 0)
+    else:
+        strength = attributes.strength
+        agility = attributes.agility
+        constitution = attributes.constitution
+    
+    return DerivedStats(
+        _max_hp(constitution, strength, level),
+        _attack_power(strength, level) + equipment_bonuses.get('attack', 0),
+        _evasion(agility, level),
+        _damage_reduction(constitution, equipment_bonuses.get('defense', 0)),
+        _speed(agility),
+        agility
+    )
+
+
 def calculate_speed(attributes: CharacterAttributes, base_speed: int = 100) -> int:
     """Calculate speed/initiative from agility."""
-    return base_speed + (attributes.agility * 2)
+    return _speed(attributes.agility, base_speed)
 
 
 def calculate_hit_chance(attacker_ap: int, target_ev: int, base_chance: int = 70) -> int:
@@ -84,17 +155,24 @@ def calculate_hit_chance(attacker_ap: int, target_ev: int, base_chance: int = 70
     ap_advantage = attacker_ap - target_ev
     hit_chance = base_chance + (ap_advantage * 3)  # 3% per point difference
     
-    # Clamp between 5% and 95%
-    return max(5, min(95, hit_chance))
+    # Clamp between 5% and 95% (inline compares avoid two builtin calls)
+    if hit_chance < 5:
+        return 5
+    return hit_chance if hit_chance < 95 else 95
 
 
 def calculate_critical_chance(attacker_agility: int, target_agility: int, base_crit: int = 5) -> int:
     """Calculate critical hit chance based on agility difference."""
     agility_advantage = attacker_agility - target_agility
-    crit_chance = base_crit + max(0, agility_advantage)  # Only positive advantage helps
+    if agility_advantage > 0:  # Only positive advantage helps
+        crit_chance = base_crit + agility_advantage
+    else:
+        crit_chance = base_crit
     
     # Clamp between 0% and 25%
-    return max(0, min(25, crit_chance))
+    if crit_chance < 0:
+        return 0
+    return crit_chance if crit_chance < 25 else 25
 
 
 def update_health_from_attributes(health: Health, attributes: CharacterAttributes, level: int = 1) -> None:
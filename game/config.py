@@ -54,14 +54,34 @@ class GameConfig:
     @classmethod
     def is_valid_y(cls, y: int) -> bool:
         """Check if Y coordinate is within valid map bounds."""
-        return 0 <= y < cls.LEVEL_HEIGHT
+        return is_valid_y(y)
     
     @classmethod
     def is_valid_x(cls, x: int) -> bool:
         """Check if X coordinate is within valid map bounds."""
-        return 0 <= x < cls.LEVEL_WIDTH
+        return is_valid_x(x)
     
     @classmethod
     def is_valid_position(cls, x: int, y: int) -> bool:
         """Check if position is within valid map bounds."""
-        return cls.is_valid_x(x) and cls.is_valid_y(y)
+        return is_valid_position(x, y)
+
+
+# Module-level copies for hot paths; bounds are bound as defaults so checks are local reads
+LEVEL_WIDTH = GameConfig.LEVEL_WIDTH
+LEVEL_HEIGHT = GameConfig.LEVEL_HEIGHT
+
+
+def is_valid_y(y: int, _height: int = LEVEL_HEIGHT) -> bool:
+    """Check if Y coordinate is within valid map bounds."""
+    return 0 <= y < _height
+
+
+def is_valid_x(x: int, _width: int = LEVEL_WIDTH) -> bool:
+    """Check if X coordinate is within valid map bounds."""
+    return 0 <= x < _width
+
+
+def is_valid_position(x: int, y: int, _width: int = LEVEL_WIDTH, _height: int = LEVEL_HEIGHT) -> bool:
+    """Check if position is within valid map bounds."""
+    return 0 <= x < _width and 0 <= y < _height
@@ -5,6 +5,7 @@ Dungeon level management for the roguelike.
 from typing import List, Set, Tuple, Optional, Dict, Any
 from dataclasses import dataclass, field
 from game.worldgen.core import Tile
+from ecs.component import get_component_state, set_component_state
 
 
 @dataclass
@@ -15,21 +16,33 @@ class DungeonLevel:
     width: int
     height: int
     tiles: List[List[Tile]] = field(default_factory=list)
-    entities: List[int] = field(default_factory=list)
+    entities: List[int] = field(default_factory=list)  # Unordered: remove_entity swap-pops
     blood_tiles: Set[Tuple[int, int]] = field(default_factory=set)
     stairs_down: Optional[Tuple[int, int]] = None
     stairs_up: Optional[Tuple[int, int]] = None
-    entity_data: List[Dict[str, Any]] = field(default_factory=list)  # Serialized entity data
+    entity_data: List[Dict[str, Any]] = field(default_factory=list)  # Serialized entity records ({'_old_id', 'components'})
     
     def __post_init__(self):
         """Initialize tiles if not provided."""
         if not self.tiles:
-            self.tiles = []
-            for y in range(self.height):
-                row = []
-                for x in range(self.width):
-                    row.append(Tile(x, y, is_wall=True))  # Start with walls for maze generation
-                self.tiles.append(row)
+            # Start with walls for maze generation
+            columns = range(self.width)
+            self.tiles = [[Tile(x, y, True) for x in columns] for y in range(self.height)]
+        
+        # Row-major wall flags (1 = wall), built by rebuild_wall_grid() once tiles are final
+        self.wall_grid: Optional[bytearray] = None
+        
+        # entity_id -> index in entities, so membership and removal are O(1)
+        self._entity_rows: Dict[int, int] = {}
+        self._reindex_entities()
+    
+    def _reindex_entities(self) -> None:
+        """Rebuild the entity index after entities was replaced wholesale."""
+        self._entity_rows = {entity_id: row for row, entity_id in enumerate(self.entities)}
+    
+    def rebuild_wall_grid(self) -> None:
+        """Snapshot tile walls into wall_grid; call again after changing a tile's is_wall."""
+        self.wall_grid = bytearray(tile.is_wall for row in self.tiles for tile in row)
     
     def get_tile(self, x: int, y: int) -> Optional[Tile]:
         """Get a tile at the specified coordinates."""
@@ -39,18 +52,44 @@ class DungeonLevel:
     
     def is_wall(self, x: int, y: int) -> bool:
         """Check if a position is a wall."""
-        tile = self.get_tile(x, y)
-        return tile is None or tile.is_wall
+        if 0 <= x < self.width and 0 <= y < self.height:
+            wall_grid = self.wall_grid
+            if wall_grid is not None:
+                return wall_grid[y * self.width + x] != 0
+            # Still generating: read the tile directly
+            return self.tiles[y][x].is_wall
+        return True
     
     def add_entity(self, entity_id: int) -> None:
         """Add an entity to this level."""
-        if entity_id not in self.entities:
+        if entity_id not in self._entity_rows:
+            self._entity_rows[entity_id] = len(self.entities)
             self.entities.append(entity_id)
     
     def remove_entity(self, entity_id: int) -> None:
-        """Remove an entity from this level."""
-        if entity_id in self.entities:
-            self.entities.remove(entity_id)
+        """Remove an entity from this level, filling the gap with the last entity.
+        
+        This does not preserve the order of entities; nothing relies on it.
+        """
+        row = self._entity_rows.pop(entity_id, None)
+        if row is None:
+            return
+        last = self.entities.pop()
+        if row < len(self.entities):
+            self.entities[row] = last
+            self._entity_rows[last] = row
+    
+    def remove_entities(self, entity_ids) -> None:
+        """Remove several entities from this level in one pass."""
+        removed = set(entity_ids)
+        if removed:
+            self.entities[:] = [entity_id for entity_id in self.entities if entity_id not in removed]
+            self._reindex_entities()
+    
+    def clear_entities(self) -> None:
+        """Remove every entity from this level."""
+        self.entities.clear()
+        self._entity_rows.clear()
     
     def has_stairs_down(self) -> bool:
         """Check if this level has downward stairs."""
@@ -117,21 +156,22 @@ class DungeonLevel:
         return False
     
     def save_entity_data(self, world) -> List[Dict[str, Any]]:
-        """Save entity data for all entities on this level (without preserving entity IDs)."""
+        """Save entity data for all entities on this level.
+        
+        Each record keeps the entity's current ID under '_old_id' so references
+        between saved entities can be remapped when the level is restored.
+        """
         entity_data = []
         
         for entity_id in self.entities:
             if world.entities.is_alive(entity_id):
                 # Get all components for this entity
                 components = {}
-                for component_type, component_dict in world.components._components.items():
-                    if entity_id in component_dict:
-                        component = component_dict[entity_id]
-                        # Store component data as a dictionary
-                        components[component_type.__name__] = component.__dict__.copy()
+                for component_type, component in world.components.get_entity_components(entity_id):
+                    # Store component data as a dictionary
+                    components[component_type.__name__] = get_component_state(component)
                 
-                # Store components without the entity ID
-                entity_data.append(components)
+                entity_data.append({'_old_id': entity_id, 'components': components})
         
         return entity_data
     
@@ -177,20 +217,19 @@ class DungeonLevel:
             'ThrownObject': ThrownObject,
         }
         
-        # First pass: Create all entities and build ID mapping
+        # First pass: Create all entities and map saved IDs to the new ones
         entity_id_mapping = {}
         new_entities = []
         
-        for i, components in enumerate(entity_data):
+        for record in entity_data:
             new_entity_id = world.create_entity()
-            new_entities.append((new_entity_id, components))
-            # We'll use the index as a temporary identifier for mapping
-            entity_id_mapping[i] = new_entity_id
+            new_entities.append((new_entity_id, record['components']))
+            entity_id_mapping[record['_old_id']] = new_entity_id
         
         # Second pass: Restore components with updated references
         for new_entity_id, components in new_entities:
             # Handle entity reference updates in components
-            updated_components = self._update_entity_references(components, entity_id_mapping, entity_data)
+            updated_components = self._update_entity_references(components, entity_id_mapping)
             
             # Restore all components with updated references
             for component_name, component_data in updated_components.items():
@@ -199,15 +238,15 @@ class DungeonLevel:
                     
                     # Create component instance and restore its data
                     component = component_class.__new__(component_class)
-                    component.__dict__.update(component_data)
+                    set_component_state(component, component_data)
                     
                     # Add component to world
                     world.components.add_component(new_entity_id, component)
             
             # Add entity to this level's entity list
-            self.entities.append(new_entity_id)
+            self.add_entity(new_entity_id)
     
-    def _update_entity_references(self, components: Dict[str, Any], entity_id_mapping: Dict[int, int], all_entity_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _update_entity_references(self, components: Dict[str, Any], entity_id_mapping: Dict[int, int]) -> Dict[str, Any]:
         """Update entity references in component data to use new entity IDs."""
         updated_components = {}
         
@@ -218,37 +257,29 @@ class DungeonLevel:
             if component_name == 'Inventory' and 'items' in updated_data:
                 updated_items = []
                 for old_item_id in updated_data['items']:
-                    # Find the item entity in the saved data and map to new ID
-                    new_item_id = self._find_and_map_item_entity(old_item_id, entity_id_mapping, all_entity_data)
+                    # Map the saved item ID to its restored entity
+                    new_item_id = self._find_and_map_item_entity(old_item_id, entity_id_mapping)
                     if new_item_id is not None:
                         updated_items.append(new_item_id)
                 updated_data['items'] = updated_items
             
             # Handle EquipmentSlots component - update equipped item entity IDs
-            elif component_name == 'EquipmentSlots':
-                for slot_name in ['weapon', 'armor', 'accessory']:
-                    if slot_name in updated_data and updated_data[slot_name] is not None:
-                        old_item_id = updated_data[slot_name]
-                        # Find the item entity in the saved data and map to new ID
-                        new_item_id = self._find_and_map_item_entity(old_item_id, entity_id_mapping, all_entity_data)
-                        updated_data[slot_name] = new_item_id
+            elif component_name == 'EquipmentSlots' and '_slots' in updated_data:
+                updated_slots = dict(updated_data['_slots'])
+                for slot_name, old_item_id in updated_slots.items():
+                    if old_item_id is not None:
+                        # Map the saved item ID to its restored entity
+                        new_item_id = self._find_and_map_item_entity(old_item_id, entity_id_mapping)
+                        updated_slots[slot_name] = new_item_id
+                updated_data['_slots'] = updated_slots
             
             updated_components[component_name] = updated_data
         
         return updated_components
     
-    def _find_and_map_item_entity(self, old_item_id: int, entity_id_mapping: Dict[int, int], all_entity_data: List[Dict[str, Any]]) -> Optional[int]:
-        """Find an item entity in the saved data and return its new mapped ID."""
-        # Find the item in the saved entity data by matching its properties
-        for i, entity_components in enumerate(all_entity_data):
-            if 'Item' in entity_components:
-                # This is an item entity, check if it matches what we're looking for
-                # We'll use the index in the entity_data list to map to the new entity ID
-                if i in entity_id_mapping:
-                    return entity_id_mapping[i]
-        
-        # If we can't find a mapping, return None (item will be lost)
-        return None
+    def _find_and_map_item_entity(self, old_item_id: int, entity_id_mapping: Dict[int, int]) -> Optional[int]:
+        """Return the new ID of a saved item entity, or None if it wasn't saved (item will be lost)."""
+        return entity_id_mapping.get(old_item_id)
     
     def has_persistence_artifact(self, world) -> bool:
         """Check if this level contains a persistence artifact."""
@@ -262,7 +293,8 @@ class DungeonLevel:
                     return True
         
         # Check saved entity data for persistence artifacts
-        for entity_components in self.entity_data:
+        for record in self.entity_data:
+            entity_components = record['components']
             if 'Item' in entity_components:
                 item_data = entity_components['Item']
                 if item_data.get('special') == 'persistence':
@@ -124,10 +124,9 @@ class GameInitializer:
     
     def _give_starting_items(self, player_entity: int) -> None:
         """Give the player some starting items."""
-        inventory = self.world.get_component(player_entity, Inventory)
         equipment_slots = self.world.get_component(player_entity, EquipmentSlots)
         
-        if not inventory or not equipment_slots:
+        if not equipment_slots or not self.world.has_component(player_entity, Inventory):
             return
         
         # Create starting equipment - war maul and chain mail
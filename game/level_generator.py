@@ -114,6 +114,9 @@ class LevelGenerator:
         tile_converter = TileEntityConverter(self.world)
         tile_converter.convert_level_tiles(level)
         
+        # Tiles are final from here on
+        level.rebuild_wall_grid()
+        
         # Spawn creatures
         if self.scheduler:
             self._spawn_creatures(level, ctx)
@@ -4,6 +4,9 @@ Level management and transition logic.
 
 from components.core import Position
 from components.items import Inventory, EquipmentSlots
+from ecs.component import get_component_state
+from events.core import EventType
+from events.movement import EntityTeleportedEvent
 
 
 class LevelManager:
@@ -82,14 +85,12 @@ class LevelManager:
                     if self.world.entities.is_alive(entity_id):
                         # Get all components for this entity
                         components = {}
-                        for component_type, component_dict in self.world.components._components.items():
-                            if entity_id in component_dict:
-                                component = component_dict[entity_id]
-                                # Store component data as a dictionary
-                                components[component_type.__name__] = component.__dict__.copy()
+                        for component_type, component in self.world.components.get_entity_components(entity_id):
+                            # Store component data as a dictionary
+                            components[component_type.__name__] = get_component_state(component)
                         
                         if components:  # Only save if entity has components
-                            saved_entities.append(components)
+                            saved_entities.append({'_old_id': entity_id, 'components': components})
                 
                 current_level.entity_data = saved_entities
             else:
@@ -106,7 +107,7 @@ class LevelManager:
                 self.world.destroy_entity(entity_id)
             
             # Clear the level's entity list completely
-            current_level.entities.clear()
+            current_level.clear_entities()
         
         # Check if target level exists, if not generate it
         if not self.game_state.has_level(target_level_id):
@@ -153,7 +154,11 @@ class LevelManager:
         if stairs_pos:
             position = self.world.get_component(player_entity, Position)
             if position:
+                old_x, old_y = position.x, position.y
                 position.x, position.y = stairs_pos
+                self.world.event_manager.emit_if_subscribed(
+                    EventType.ENTITY_TELEPORTED, EntityTeleportedEvent,
+                    player_entity, old_x, old_y, position.x, position.y, "stairs")
         
         # Add player to new level
         target_level.add_entity(player_entity)
@@ -100,6 +100,10 @@ class LevelWorldGenerator:
         
         return self._current_level.blood_tiles.copy()
     
+    def is_blood_at(self, x: int, y: int) -> bool:
+        """Check if the current level has blood at a tile, without copying the blood set."""
+        return self._current_level is not None and (x, y) in self._current_level.blood_tiles
+    
     def add_blood_tile(self, x: int, y: int) -> None:
         """Add a blood tile to the current level."""
         if self._current_level:
@@ -7,9 +7,29 @@ import json
 import os
 import random
 from typing import Dict, Any, List, Optional, Tuple
-from dataclasses import asdict
+from dataclasses import asdict, is_dataclass
 from enum import Enum
 from pathlib import Path
+from types import MappingProxyType
+from ecs.component import Component, get_component_state, set_component_state
+
+
+def _encode_enum(obj: Enum) -> Dict[str, Any]:
+    """Encode an enum member with its type tag."""
+    return {'__enum__': obj.__class__.__name__, 'value': obj.value}
+
+
+def _tag_enum_fields(state: Dict[str, Any]) -> Dict[str, Any]:
+    """Tag enum-valued fields of a component state dict.
+
+    IntEnum members are ints, so json writes them as bare numbers without
+    ever calling SaveGameEncoder.default; tag them here so they load back
+    as enum members.
+    """
+    for name, value in state.items():
+        if isinstance(value, Enum):
+            state[name] = _encode_enum(value)
+    return state
 
 
 class SaveGameEncoder(json.JSONEncoder):
@@ -17,14 +37,18 @@ class SaveGameEncoder(json.JSONEncoder):
     
     def default(self, obj):
         if isinstance(obj, Enum):
-            return {'__enum__': obj.__class__.__name__, 'value': obj.value}
+            return _encode_enum(obj)
         elif isinstance(obj, set):
             return {'__set__': list(obj)}
         elif isinstance(obj, tuple):
             return {'__tuple__': list(obj)}
-        elif hasattr(obj, '__dict__'):
-            # Handle component objects
-            return {'__class__': obj.__class__.__name__, '__dict__': obj.__dict__}
+        elif isinstance(obj, bytearray):
+            return {'__bytearray__': list(obj)}
+        elif isinstance(obj, MappingProxyType):
+            return dict(obj)
+        elif isinstance(obj, Component) or is_dataclass(obj) or hasattr(obj, '__dict__'):
+            # Handle component objects (including __slots__ based ones)
+            return {'__class__': obj.__class__.__name__, '__dict__': _tag_enum_fields(get_component_state(obj))}
         return super().default(obj)
 
 
@@ -51,9 +75,12 @@ def save_game_decoder(dct):
         # Add other enums as needed
         return dct['value']  # Fallback
     elif '__set__' in dct:
-        return set(dct['__set__'])
+        # Older saves wrote sets of tuples with the tuples as plain lists
+        return {tuple(value) if isinstance(value, list) else value for value in dct['__set__']}
     elif '__tuple__' in dct:
         return tuple(dct['__tuple__'])
+    elif '__bytearray__' in dct:
+        return bytearray(dct['__bytearray__'])
     return dct
 
 
@@ -63,6 +90,11 @@ class SaveSystem:
     SAVE_DIR = "saves"
     SAVE_FILE = "current_game.json"
     
+    # Written into new saves; 1.0 saves are still read, with component
+    # fields saved under older layouts migrated by their restore_state()
+    SAVE_VERSION = '2.0'
+    SUPPORTED_VERSIONS = ('1.0', '2.0')
+    
     def __init__(self):
         self.save_path = Path(self.SAVE_DIR)
         self.save_path.mkdir(exist_ok=True)
@@ -110,6 +142,11 @@ class SaveSystem:
         try:
             with open(self.save_file_path, 'r') as f:
                 save_data = json.load(f, object_hook=save_game_decoder)
+            
+            version = save_data.get('version')
+            if version not in self.SUPPORTED_VERSIONS:
+                print(f"Error loading game: unsupported save version {version!r}")
+                return None
             print("DEBUG: Save data loaded successfully")
             return save_data
             
@@ -120,7 +157,7 @@ class SaveSystem:
     def _create_save_data(self, world, game_state, message_log, camera, world_generator) -> Dict[str, Any]:
         """Create the complete save data structure."""
         save_data = {
-            'version': '1.0',
+            'version': self.SAVE_VERSION,
             'game_state': self._save_game_state(game_state),
             'world_state': self._save_world_state(world),
             'levels': self._save_levels(game_state),
@@ -150,8 +187,8 @@ class SaveSystem:
         # Save entity manager state
         entity_state = {
             'next_id': world.entities._next_id,
-            'alive_entities': list(world.entities._alive_entities),
-            'dead_entities': list(world.entities._dead_entities)
+            'alive_entities': list(world.entities.get_alive_entities()),
+            'dead_entities': world.entities.get_dead_entities()
         }
         
         # Save all components for all entities
@@ -161,7 +198,7 @@ class SaveSystem:
             components_data[component_name] = {}
             
             for entity_id, component in entity_dict.items():
-                components_data[component_name][str(entity_id)] = component.__dict__.copy()
+                components_data[component_name][str(entity_id)] = _tag_enum_fields(get_component_state(component))
         
         return {
             'entities': entity_state,
@@ -324,19 +361,15 @@ class SaveSystem:
             world.destroy_entity(entity_id)
         
         # Clear any remaining state
-        world.entities._next_id = 0
-        world.entities._alive_entities.clear()
-        world.entities._dead_entities.clear()
-        world.components._components.clear()
-        world.components._entity_components.clear()
+        world.entities.clear()
+        world.components.clear()
     
     def _restore_world_state(self, world_data: Dict[str, Any], world) -> None:
         """Restore ECS World state."""
         # Restore entity manager state
         entity_data = world_data['entities']
-        world.entities._next_id = entity_data['next_id']
-        world.entities._alive_entities = set(entity_data['alive_entities'])
-        world.entities._dead_entities = set(entity_data['dead_entities'])
+        world.entities.restore(entity_data['next_id'], entity_data['alive_entities'],
+                               entity_data['dead_entities'])
         
         # Import component classes
         component_classes = self._get_component_classes()
@@ -352,7 +385,7 @@ class SaveSystem:
                     
                     # Create component instance and restore its data
                     component = component_class.__new__(component_class)
-                    component.__dict__.update(component_data)
+                    set_component_state(component, component_data)
                     
                     # Add component to world
                     world.components.add_component(entity_id, component)
@@ -397,6 +430,7 @@ class SaveSystem:
                 stairs_down=tuple(level_data['stairs_down']) if level_data['stairs_down'] else None,
                 stairs_up=tuple(level_data['stairs_up']) if level_data['stairs_up'] else None
             )
+            level.rebuild_wall_grid()
             
             # Handle blood_tiles separately to avoid unhashable type errors
             if level_data['blood_tiles']:
@@ -0,0 +1,84 @@
+"""
+Spatial hash of positioned entities for fast "what is at (x, y)" lookups.
+"""
+
+from typing import Dict, FrozenSet, Optional, Set, Tuple
+from components.core import Position
+from events.core import EventType
+
+# Returned for empty cells so lookups never allocate
+_EMPTY: FrozenSet[int] = frozenset()
+
+
+class SpatialIndex:
+    """Maps tile coordinates to the entities standing on them.
+    
+    Moves are applied incrementally from ENTITY_MOVED/ENTITY_TELEPORTED
+    events. Adding or removing Position components (spawns, pickups, deaths,
+    level changes, loading) replaces the world's cached Position entity set,
+    which triggers a full rebuild on the next lookup.
+    """
+    
+    def __init__(self, world):
+        self.world = world
+        # (x, y) -> entity ids on that tile
+        self._cells: Dict[Tuple[int, int], Set[int]] = {}
+        # entity id -> the cell it is filed under
+        self._entity_cells: Dict[int, Tuple[int, int]] = {}
+        # Position entity set the index was built from
+        self._source: Optional[FrozenSet[int]] = None
+        
+        world.event_manager.subscribe(EventType.ENTITY_MOVED, self._on_entity_moved)
+        world.event_manager.subscribe(EventType.ENTITY_TELEPORTED, self._on_entity_moved)
+    
+    def _sync(self) -> None:
+        """Rebuild the index if entities gained or lost a Position since the last build."""
+        source = self.world.get_entities_with_components(Position)
+        if source is self._source:
+            return
+        
+        cells = self._cells = {}
+        entity_cells = self._entity_cells = {}
+        for entity_id, position in self.world.get_all_components(Position).items():
+            cell = (position.x, position.y)
+            entity_cells[entity_id] = cell
+            entities = cells.get(cell)
+            if entities is None:
+                cells[cell] = {entity_id}
+            else:
+                entities.add(entity_id)
+        self._source = source
+    
+    def _on_entity_moved(self, event) -> None:
+        """Refile an entity under its new tile."""
+        self._sync()
+        self.remove(event.entity_id)
+        position = self.world.get_component(event.entity_id, Position)
+        if position is not None:
+            self.add(event.entity_id, position.x, position.y)
+    
+    def add(self, entity_id: int, x: int, y: int) -> None:
+        """File an entity under a tile."""
+        cell = (x, y)
+        self._entity_cells[entity_id] = cell
+        entities = self._cells.get(cell)
+        if entities is None:
+            self._cells[cell] = {entity_id}
+        else:
+            entities.add(entity_id)
+    
+    def remove(self, entity_id: int) -> None:
+        """Drop an entity from the index."""
+        cell = self._entity_cells.pop(entity_id, None)
+        if cell is None:
+            return
+        entities = self._cells.get(cell)
+        if entities is not None:
+            entities.discard(entity_id)
+            if not entities:
+                del self._cells[cell]
+    
+    def at(self, x: int, y: int):
+        """Get the ids of entities on a tile (read-only)."""
+        self._sync()
+        return self._cells.get((x, y), _EMPTY)
@@ -18,6 +18,10 @@ class WorldConfig:
 class Tile:
     """Represents a single tile in the world."""
     
+    # One Tile per map cell, so skip the per-instance __dict__
+    __slots__ = ('x', 'y', 'is_wall', 'visible', 'explored', 'lit', 'penumbra',
+                 'interesting', 'tile_type', 'properties')
+    
     def __init__(self, x: int, y: int, is_wall: bool = False):
         self.x = x
         self.y = y
@@ -32,6 +32,7 @@ from systems.throwing import ThrowingSystem
 from systems.auto_explore import AutoExploreSystem
 from systems.examine import ExamineSystem
 from game.item_factory import ItemFactory
+from game.spatial_index import SpatialIndex
 from effects.core import EffectsManager
 from effects.physics import PhysicsSystem, KnockbackEffect, ShockwaveEffect
 from effects.status_effects import StatusEffectsSystem, BleedingEffect
@@ -45,12 +46,12 @@ from game.save_system import SaveSystem
 class RoguelikeGame:
     """Main game class that coordinates all systems."""
     
-    def __init__(self, charset_override=None):
+    def __init__(self, charset_override=None, debug=False):
         # Store charset override for use in initialization
         self.charset_override = charset_override
         
-        # Initialize core ECS
-        self.world = World()
+        # Initialize core ECS (debug: event subscribers that raise are logged, not fatal)
+        self.world = World(debug=debug)
         
         # Initialize game components
         self.game_state = GameStateManager()
@@ -58,6 +59,9 @@ class RoguelikeGame:
         self.camera = Camera(viewport_width=GameConfig.MAP_WIDTH, viewport_height=GameConfig.MAP_HEIGHT)
         self.world_generator = LevelWorldGenerator(self.world, seed=random.randint(0, 1000000))
         
+        # Index of entities by tile, shared by systems that look up "what is here"
+        self.spatial_index = SpatialIndex(self.world)
+        
         # Initialize item factory
         self.item_factory = ItemFactory(self.world)
         
@@ -66,14 +70,16 @@ class RoguelikeGame:
         
         # Initialize effects systems
         self.effects_manager = EffectsManager(self.world)
-        self.tile_effects_system = TileEffectsSystem(self.world, self.message_log)
+        self.tile_effects_system = TileEffectsSystem(self.world, self.message_log,
+                                                     GameConfig.LEVEL_WIDTH, GameConfig.LEVEL_HEIGHT)
         self.status_effects_system = StatusEffectsSystem(self.world, self.effects_manager, self.message_log, self.game_state, self.world_generator)
         
         # Initialize systems (render system first, then input system with render system reference)
         self.render_system = RenderSystem(self.world, self.camera, self.message_log, 
                                         self.world_generator, self.game_state, self.tile_effects_system, self.glyph_config)
         self.input_system = InputSystem(self.world, self.game_state, self.message_log, self.render_system)
-        self.movement_system = MovementSystem(self.world, self.world_generator, self.message_log, self.glyph_config)
+        self.movement_system = MovementSystem(self.world, self.world_generator, self.message_log, self.glyph_config,
+                                              spatial_index=self.spatial_index)
         
         # Initialize physics system after movement and render systems are created
         self.physics_system = PhysicsSystem(self.world, self.movement_system, self.message_log, 
@@ -84,7 +90,8 @@ class RoguelikeGame:
         self.effects_manager.register_effect(ShockwaveEffect(self.physics_system, self.movement_system))
         self.effects_manager.register_effect(BleedingEffect(self.status_effects_system))
         self.effects_manager.register_effect(BloodSplatterEffect(self.tile_effects_system))
-        self.combat_system = CombatSystem(self.world, self.game_state, self.message_log, self.effects_manager, self.world_generator)
+        self.combat_system = CombatSystem(self.world, self.game_state, self.message_log, self.effects_manager, self.world_generator,
+                                          spatial_index=self.spatial_index)
         self.skills_system = SkillsSystem(self.world, self.message_log)
         self.ai_system = AISystem(self.world, self.movement_system, self.combat_system, self.message_log)
         self.simple_lighting = SimpleLightingSystem(self.world, self.world_generator, message_log=self.message_log)
@@ -92,7 +99,7 @@ class RoguelikeGame:
         self.fov_system = self.simple_lighting
         
         # Initialize inventory system (no complex lighting event manager needed)
-        self.inventory_system = InventorySystem(self.world, self.message_log)
+        self.inventory_system = InventorySystem(self.world, self.message_log, spatial_index=self.spatial_index)
         # Set render system reference
         self.inventory_system.set_render_system(self.render_system)
         
@@ -704,7 +711,7 @@ def main():
     if choice == 1:
         # New Game
         try:
-            game = RoguelikeGame(charset_override=charset_override)
+            game = RoguelikeGame(charset_override=charset_override, debug=args.debug)
             game._initialize_game()  # Explicitly initialize for new games
             game.run()
         except Exception as e:
@@ -719,7 +726,7 @@ def main():
             # Continue Game
             try:
                 print("DEBUG: Creating RoguelikeGame instance...")
-                game = RoguelikeGame(charset_override=charset_override)
+                game = RoguelikeGame(charset_override=charset_override, debug=args.debug)
                 print("DEBUG: Attempting to load saved game...")
                 success = game.load_saved_game()
                 print(f"DEBUG: Load result: {success}")
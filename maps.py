@@ -37,8 +37,7 @@ class PreviewFOVSystem:
             return
             
         player_entity = next(iter(player_entities))
-        player_pos = self.world.get_component(player_entity, Position)
-        if not player_pos:
+        if not self.world.has_component(player_entity, Position):
             return
         
         # In preview mode, make all tiles visible
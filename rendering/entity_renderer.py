@@ -30,20 +30,19 @@ class EntityRenderer:
             return
             
         self.entity_position_cache.clear()
-        entities = self.world.get_entities_with_components(Position, Renderable)
         
         # Group entities by position
         position_entities = {}
         
-        for entity_id in entities:
-            position = self.world.get_component(entity_id, Position)
-            renderable = self.world.get_component(entity_id, Renderable)
-            
-            if position and renderable:
-                pos_key = (position.x, position.y)
-                if pos_key not in position_entities:
-                    position_entities[pos_key] = []
-                position_entities[pos_key].append((entity_id, renderable.char, renderable.color))
+        positions = self.world.get_all_components(Position)
+        renderables = self.world.get_all_components(Renderable)
+        for entity_id in self.world.get_entities_with_components(Position, Renderable):
+            position = positions[entity_id]
+            renderable = renderables[entity_id]
+            pos_key = (position.x, position.y)
+            if pos_key not in position_entities:
+                position_entities[pos_key] = []
+            position_entities[pos_key].append((entity_id, renderable.char, renderable.color))
         
         # Process each position
         for pos_key, entities_at_pos in position_entities.items():
@@ -156,11 +156,7 @@ class UnifiedTileRenderer:
     def _render_effects_layer(self, world_x: int, world_y: int, tile, render_info=None) -> Optional[CompositeLayer]:
         """Render blood and other tile effects."""
         # Check for blood
-        blood_tiles = set()
-        if hasattr(self.world_generator, 'get_blood_tiles'):
-            blood_tiles = self.world_generator.get_blood_tiles()
-        
-        if (world_x, world_y) in blood_tiles:
+        if self.world_generator.is_blood_at(world_x, world_y):
             # Blood effect - use appropriate terrain char based on lighting
             if render_info and (render_info.lit or render_info.penumbra):
                 # Use normal glyph for lit/penumbra tiles
@@ -414,10 +410,8 @@ class UnifiedTileRenderer:
         
         # Index last seen character positions
         from components.core import Visible
-        visible_entities = self.world.get_entities_with_components(Visible)
-        for entity_id in visible_entities:
-            visible = self.world.get_component(entity_id, Visible)
-            if (visible and visible.explored and 
+        for visible in self.world.get_all_components(Visible).values():
+            if (visible.explored and 
                 visible.last_seen_x is not None and visible.last_seen_y is not None and
                 visible.last_seen_char and visible.last_seen_color):
                 pos = (visible.last_seen_x, visible.last_seen_y)
@@ -7,7 +7,7 @@ from components.core import Position, Player, Visible, Door
 from components.items import Item, Pickupable
 from components.combat import Health
 from components.ai import AI
-from components.auto_explore import AutoExplore, AutoExploreState, ExploreTarget, ExploreTargetType
+from components.auto_explore import AutoExplore, AutoExploreState, ExploreTarget, ExploreTargetType, TARGET_DESCRIPTIONS
 from systems.movement import MovementSystem
 from systems.simple_lighting_system import SimpleLightingSystem
 from utils.pathfinding import Pathfinder
@@ -320,7 +320,7 @@ class AutoExploreSystem(System):
             should_stop = True  # Stop at items
         elif target.target_type in [ExploreTargetType.STAIRS_DOWN, ExploreTargetType.STAIRS_UP]:
             auto_explore.stairs_found += 1
-            self.message_log.add_info(f"Auto-explore: Found {target.target_type.value}!")
+            self.message_log.add_info(f"Auto-explore: Found {target.target_type.label}!")
             should_stop = True  # Stop at stairs
         elif target.target_type == ExploreTargetType.DOOR:
             self.message_log.add_info("Auto-explore: Found door!")
@@ -386,21 +386,14 @@ class AutoExploreSystem(System):
     
     def _get_target_description(self, target: ExploreTarget) -> str:
         """Get a human-readable description of a target."""
-        descriptions = {
-            ExploreTargetType.UNEXPLORED: "unexplored area",
-            ExploreTargetType.STAIRS_DOWN: "stairs down",
-            ExploreTargetType.STAIRS_UP: "stairs up",
-            ExploreTargetType.ITEM: "item",
-            ExploreTargetType.DOOR: "door"
-        }
-        return descriptions.get(target.target_type, "unknown target")
+        return TARGET_DESCRIPTIONS[target.target_type]
     
     def start_auto_explore(self, entity_id: int) -> None:
         """Start auto-exploration for an entity."""
         auto_explore = self.world.get_component(entity_id, AutoExplore)
         if not auto_explore:
             # Add AutoExplore component if it doesn't exist
-            auto_explore = AutoExplore()
+            auto_explore = AutoExplore(map_width=GameConfig.LEVEL_WIDTH, map_height=GameConfig.LEVEL_HEIGHT)
             self.world.add_component(entity_id, auto_explore)
         
         if auto_explore.is_active():
@@ -409,7 +402,7 @@ class AutoExploreSystem(System):
         
         # Reset the component state for a fresh start
         auto_explore.clear_target()
-        auto_explore.visited_positions.clear()
+        auto_explore.clear_visited()
         auto_explore.last_scan_turn = 0  # Force immediate scan
         
         auto_explore.activate()
@@ -462,7 +455,7 @@ class AutoExploreSystem(System):
         # Set up auto-explore component
         auto_explore = self.world.get_component(entity_id, AutoExplore)
         if not auto_explore:
-            auto_explore = AutoExplore()
+            auto_explore = AutoExplore(map_width=GameConfig.LEVEL_WIDTH, map_height=GameConfig.LEVEL_HEIGHT)
             self.world.add_component(entity_id, auto_explore)
         
         # Create target and start movement
@@ -504,7 +497,7 @@ class AutoExploreSystem(System):
         # Set up auto-explore component
         auto_explore = self.world.get_component(entity_id, AutoExplore)
         if not auto_explore:
-            auto_explore = AutoExplore()
+            auto_explore = AutoExplore(map_width=GameConfig.LEVEL_WIDTH, map_height=GameConfig.LEVEL_HEIGHT)
             self.world.add_component(entity_id, auto_explore)
         
         # Create target and start movement
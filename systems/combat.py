@@ -20,12 +20,14 @@ import json
 class CombatSystem(System):
     """Handles combat resolution between entities."""
     
-    def __init__(self, world, game_state: GameStateManager, message_log, effects_manager=None, world_generator=None):
+    def __init__(self, world, game_state: GameStateManager, message_log, effects_manager=None, world_generator=None,
+                 spatial_index=None):
         super().__init__(world)
         self.game_state = game_state
         self.message_log = message_log
         self.effects_manager = effects_manager
         self.world_generator = world_generator
+        self.spatial_index = spatial_index
         
         # Initialize helper classes
         self.stats_resolver = CombatStatsResolver(world)
@@ -158,8 +160,7 @@ class CombatSystem(System):
         
         if self.world.has_component(target_id, Player):
             # Player died - handle permadeath
-            species = self.world.get_component(target_id, Species)
-            if not species:
+            if not self.world.has_component(target_id, Species):
                 # Add default human species if missing
                 self.world.add_component(target_id, Species('human'))
             
@@ -286,6 +287,12 @@ class CombatSystem(System):
     
     def get_attackable_entity_at(self, x: int, y: int) -> int:
         """Get an entity that can be attacked at the given position."""
+        if self.spatial_index:
+            for entity_id in self.spatial_index.at(x, y):
+                if self.world.has_component(entity_id, Health):
+                    return entity_id
+            return None
+        
         entities_at_pos = self.world.get_entities_with_components(Position, Health)
         
         for entity_id in entities_at_pos:
@@ -9,9 +9,8 @@ from components.character import CharacterAttributes, Experience
 from components.effects import WeaponEffects, Physics
 from components.ai import AI
 from game.character_stats import (
-    calculate_attack_power, calculate_evasion, calculate_damage_reduction,
     calculate_hit_chance, calculate_critical_chance,
-    get_total_equipment_bonuses, get_effective_attributes
+    get_total_equipment_bonuses, compute_derived_stats
 )
 import random
 
@@ -44,12 +43,12 @@ class CombatStatsResolver:
             # New attribute system
             level = exp.level if exp else 1
             equipment = get_total_equipment_bonuses(self.world, entity_id)
-            effective_attrs = get_effective_attributes(attrs, equipment)
+            derived = compute_derived_stats(attrs, equipment, level)
             
-            attack_power = calculate_attack_power(effective_attrs, level) + equipment['attack']
-            evasion = calculate_evasion(effective_attrs, level)
-            damage_reduction = calculate_damage_reduction(effective_attrs, equipment['defense'])
-            agility = effective_attrs.agility
+            attack_power = derived.attack_power
+            evasion = derived.evasion
+            damage_reduction = derived.damage_reduction
+            agility = derived.agility
         else:
             # Fallback to old system
             from components.combat import Stats
@@ -169,29 +168,32 @@ class WeaponEffectsHandler:
             if not self.world.has_component(target_id, Physics):
                 self.world.add_component(target_id, Physics())
             
-            self.effects_manager.trigger_effect("knockback",
-                target_id=target_id,
-                force=effects_data.knockback_data['force'],
-                source_x=effects_data.knockback_data['source_x'],
-                source_y=effects_data.knockback_data['source_y']
-            )
+            knockback_data = effects_data.knockback_data
+            context = self.effects_manager.new_context()
+            context['target_id'] = target_id
+            context['force'] = knockback_data['force']
+            context['source_x'] = knockback_data['source_x']
+            context['source_y'] = knockback_data['source_y']
+            self.effects_manager.trigger_effect("knockback", context)
         
         # Apply slashing effects if calculated
         if effects_data.slashing_data:
+            slashing_data = effects_data.slashing_data
+            
             # Apply bleeding status effect
-            self.effects_manager.trigger_effect("apply_bleeding",
-                target_id=target_id,
-                intensity=effects_data.slashing_data['intensity'],
-                duration=effects_data.slashing_data['duration']
-            )
+            context = self.effects_manager.new_context()
+            context['target_id'] = target_id
+            context['intensity'] = slashing_data['intensity']
+            context['duration'] = slashing_data['duration']
+            self.effects_manager.trigger_effect("apply_bleeding", context)
             
             # Trigger blood splatter effect
-            self.effects_manager.trigger_effect("blood_splatter",
-                center_x=effects_data.slashing_data['target_x'],
-                center_y=effects_data.slashing_data['target_y'],
-                intensity=effects_data.slashing_data['splatter_intensity'],
-                radius=1
-            )
+            context = self.effects_manager.new_context()
+            context['center_x'] = slashing_data['target_x']
+            context['center_y'] = slashing_data['target_y']
+            context['intensity'] = slashing_data['splatter_intensity']
+            context['radius'] = 1
+            self.effects_manager.trigger_effect("blood_splatter", context)
     
     def apply_weapon_effects(self, attacker_id: int, target_id: int, damage: int) -> None:
         """Apply all weapon effects from the attacker's weapon to the target."""
@@ -215,12 +217,12 @@ class WeaponEffectsHandler:
         # Calculate knockback force based on attacker's strength
         calculated_force = self._calculate_knockback_force(attacker_id, weapon_effects)
         
-        self.effects_manager.trigger_effect("knockback",
-            target_id=target_id,
-            force=calculated_force,
-            source_x=attacker_pos.x,
-            source_y=attacker_pos.y
-        )
+        context = self.effects_manager.new_context()
+        context['target_id'] = target_id
+        context['force'] = calculated_force
+        context['source_x'] = attacker_pos.x
+        context['source_y'] = attacker_pos.y
+        self.effects_manager.trigger_effect("knockback", context)
     
     def _apply_slashing_effect(self, target_id: int, damage: int, weapon_effects: WeaponEffects, target_pos: Position) -> None:
         """Apply slashing effects (bleeding and blood splatter)."""
@@ -231,20 +233,20 @@ class WeaponEffectsHandler:
             return
         
         # Apply bleeding status effect
-        self.effects_manager.trigger_effect("apply_bleeding",
-            target_id=target_id,
-            intensity=max(1, weapon_effects.slashing_damage // 2),
-            duration=5 + (damage // 5)  # Duration based on damage dealt
-        )
+        context = self.effects_manager.new_context()
+        context['target_id'] = target_id
+        context['intensity'] = max(1, weapon_effects.slashing_damage // 2)
+        context['duration'] = 5 + (damage // 5)  # Duration based on damage dealt
+        self.effects_manager.trigger_effect("apply_bleeding", context)
         
         # Trigger blood splatter effect
         splatter_intensity = max(1, damage // 10)  # More damage = more blood
-        self.effects_manager.trigger_effect("blood_splatter",
-            center_x=target_pos.x,
-            center_y=target_pos.y,
-            intensity=splatter_intensity,
-            radius=1
-        )
+        context = self.effects_manager.new_context()
+        context['center_x'] = target_pos.x
+        context['center_y'] = target_pos.y
+        context['intensity'] = splatter_intensity
+        context['radius'] = 1
+        self.effects_manager.trigger_effect("blood_splatter", context)
     
     def _calculate_knockback_force(self, attacker_id: int, weapon_effects: WeaponEffects) -> float:
         """Calculate knockback force based on weapon and attacker strength."""
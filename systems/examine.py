@@ -59,8 +59,7 @@ class ExamineSystem(System):
     
     def exit_examine_mode(self, player_entity: int) -> bool:
         """Exit examine mode."""
-        cursor = self.world.get_component(player_entity, ExamineCursor)
-        if cursor:
+        if self.world.has_component(player_entity, ExamineCursor):
             self.world.remove_component(player_entity, ExamineCursor)
             self.message_log.add_info("Examine mode ended.")
             return True
@@ -210,14 +209,14 @@ class ExamineSystem(System):
             char_name = species.species_name.capitalize()
         else:
             # Fallback to AI type if no species component
-            ai_type = ai.ai_type.value if hasattr(ai.ai_type, 'value') else str(ai.ai_type)
+            ai_type = ai.ai_type.label if hasattr(ai.ai_type, 'label') else str(ai.ai_type)
             char_name = ai_type.capitalize()
         
         if disposition:
-            disposition_str = disposition.disposition.value if hasattr(disposition.disposition, 'value') else str(disposition.disposition)
+            disposition_str = disposition.disposition.label if hasattr(disposition.disposition, 'label') else str(disposition.disposition)
         else:
             # Fallback to JSON lookup if no disposition component
-            species_name = species.species_name if species else ai.ai_type.value
+            species_name = species.species_name if species else ai.ai_type.label
             char_data = self._character_data.get(species_name, {})
             disposition_str = char_data.get('disposition', 'unknown')
         
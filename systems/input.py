@@ -6,7 +6,7 @@ from ecs.system import System
 from components.core import Position, Player
 from components.combat import Health
 from game.game_state import GameStateManager
-from game.config import GameConfig
+from game.config import is_valid_y
 from typing import Optional
 
 
@@ -233,7 +233,7 @@ class InputSystem(System):
             return False
         
         # Prevent moving outside Y bounds
-        if not GameConfig.is_valid_y(new_y):
+        if not is_valid_y(new_y):
             self.message_log.add_warning("You cannot go that way!")
             return False
         
@@ -7,15 +7,42 @@ from components.core import Position, Player
 from components.items import Item, Equipment, Consumable, Inventory, EquipmentSlots, Pickupable
 from components.combat import Health
 from components.character import CharacterAttributes
+from game.character_stats import get_total_equipment_bonuses
+from events.core import EventType
+from events.movement import EntityMovedEvent
 from typing import Optional, List, Tuple
 
 
+def get_equippable_items(world, inventory: Inventory) -> List[int]:
+    """Items in the inventory that can be equipped (cached on the inventory)."""
+    # Membership in the live Equipment column is the "has Equipment" test
+    return inventory.get_filtered_items('equippable', world.get_all_components(Equipment).__contains__)
+
+
+def get_consumable_items(world, inventory: Inventory) -> List[int]:
+    """Items in the inventory that can be used (cached on the inventory)."""
+    return inventory.get_filtered_items('consumable', world.get_all_components(Consumable).__contains__)
+
+
+def get_throwable_items(world, inventory: Inventory) -> List[int]:
+    """Items in the inventory that can be thrown (cached on the inventory).
+    
+    Items are throwable if they have a Throwable or a Physics component.
+    """
+    from components.items import Throwable
+    from components.effects import Physics
+    throwables = world.get_all_components(Throwable)
+    physics = world.get_all_components(Physics)
+    return inventory.get_filtered_items('throwable', lambda item_id: item_id in throwables or item_id in physics)
+
+
 class InventorySystem(System):
     """Handles inventory management, item usage, and equipment."""
     
-    def __init__(self, world, message_log):
+    def __init__(self, world, message_log, spatial_index=None):
         super().__init__(world)
         self.message_log = message_log
+        self.spatial_index = spatial_index
         self.render_system = None  # Will be set by the main game
         # No longer need complex lighting event manager
     
@@ -48,17 +75,15 @@ class InventorySystem(System):
         # Add item to inventory
         if inventory.add_item(item_entity_id):
             # Store old position for movement event before removing
-            old_pos = None
             if self.world.has_component(item_entity_id, Position):
                 position = self.world.get_component(item_entity_id, Position)
-                old_pos = (position.x, position.y)
+                old_x, old_y = position.x, position.y
                 self.world.remove_component(item_entity_id, Position)
                 
                 # Emit movement event for item being picked up (moved to inventory)
                 # Use a special position (-1, -1) to indicate "in inventory"
-                from events.movement import EntityMovedEvent
-                event = EntityMovedEvent(item_entity_id, old_pos, (-1, -1))
-                self.world.event_manager.emit('entity_moved', event)
+                self.world.event_manager.emit_if_subscribed(
+                    EventType.ENTITY_MOVED, EntityMovedEvent.acquire, item_entity_id, old_x, old_y, -1, -1)
             
             # Remove item from current level's entity list
             self._remove_item_from_current_level(item_entity_id)
@@ -122,9 +147,8 @@ class InventorySystem(System):
             self.world.add_component(item_entity_id, Position(position.x, position.y))
             
             # Emit movement event for item being dropped (moved from inventory to world)
-            from events.movement import EntityMovedEvent
-            event = EntityMovedEvent(item_entity_id, (-1, -1), (position.x, position.y))
-            self.world.event_manager.emit('entity_moved', event)
+            self.world.event_manager.emit_if_subscribed(
+                EventType.ENTITY_MOVED, EntityMovedEvent.acquire, item_entity_id, -1, -1, position.x, position.y)
             
             # Get item name for message
             item = self.world.get_component(item_entity_id, Item)
@@ -158,7 +182,7 @@ class InventorySystem(System):
             return False
         
         # Check if item is in inventory
-        if item_entity_id not in inventory.items:
+        if not inventory.has_item(item_entity_id):
             return False
         
         # Equip the item (this may return a previously equipped item)
@@ -240,7 +264,7 @@ class InventorySystem(System):
             return False
         
         # Check if item is in inventory
-        if item_entity_id not in inventory.items:
+        if not inventory.has_item(item_entity_id):
             return False
         
         # Apply the consumable effect
@@ -286,6 +310,10 @@ class InventorySystem(System):
     
     def get_items_at_position(self, x: int, y: int) -> List[int]:
         """Get all pickupable items at a position."""
+        if self.spatial_index:
+            return [entity_id for entity_id in self.spatial_index.at(x, y)
+                    if self.world.has_component(entity_id, Pickupable)]
+        
         items = []
         entities = self.world.get_entities_with_components(Position, Pickupable)
         
@@ -331,30 +359,7 @@ class InventorySystem(System):
     
     def get_total_equipment_bonuses(self, entity_id: int) -> dict:
         """Calculate total bonuses from all equipped items."""
-        equipment_slots = self.world.get_component(entity_id, EquipmentSlots)
-        if not equipment_slots:
-            return {'attack': 0, 'defense': 0, 'attributes': {}}
-        
-        total_attack = 0
-        total_defense = 0
-        total_attributes = {}
-        
-        for slot, item_entity_id in equipment_slots.get_equipped_items().items():
-            if item_entity_id:
-                equipment = self.world.get_component(item_entity_id, Equipment)
-                if equipment:
-                    total_attack += equipment.attack_bonus
-                    total_defense += equipment.defense_bonus
-                    
-                    # Add attribute bonuses
-                    for attr, bonus in equipment.attribute_bonuses.items():
-                        total_attributes[attr] = total_attributes.get(attr, 0) + bonus
-        
-        return {
-            'attack': total_attack,
-            'defense': total_defense,
-            'attributes': total_attributes
-        }
+        return get_total_equipment_bonuses(self.world, entity_id)
     
     def _handle_light_activation(self, item_entity_id: int) -> bool:
         """Activate a light source if it has a LightEmitter component. Returns True if a light was activated."""
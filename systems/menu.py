@@ -15,6 +15,8 @@ class BaseMenu(ABC):
         self.selected_index = -1  # -1 means no item highlighted
         self.navigation_mode = False
         self._menu_items = []
+        # Values behind the menu lines (e.g. item entity ids), filled by build_menu_items
+        self._entries = []
         self._items_dirty = True
     
     @abstractmethod
@@ -40,9 +42,7 @@ class BaseMenu(ABC):
             return self.get_subtitle(), False
         
         # Build menu items if needed
-        if self._items_dirty:
-            self._menu_items = self.build_menu_items(player_entity)
-            self._items_dirty = False
+        self._ensure_items(player_entity)
         
         item_line = line_num - 2
         if item_line >= 0 and item_line < len(self._menu_items):
@@ -53,6 +53,18 @@ class BaseMenu(ABC):
         
         return "", False
     
+    def get_entries(self, player_entity: int) -> list:
+        """Get the selectable values behind the menu lines, in display order."""
+        self._ensure_items(player_entity)
+        return self._entries
+    
+    def _ensure_items(self, player_entity: int) -> None:
+        """Rebuild menu items (and entries) if they are dirty."""
+        if self._items_dirty:
+            self._entries = []
+            self._menu_items = self.build_menu_items(player_entity)
+            self._items_dirty = False
+    
     def navigate_up(self) -> None:
         """Navigate up in the menu."""
         if self._items_dirty:
@@ -3,6 +3,10 @@
 from typing import List
 from systems.menu import BaseMenu
 
+# Entry tags: what selecting an equip menu line does
+EQUIP_ENTRY = 0
+UNEQUIP_ENTRY = 1
+
 
 class EquipMenu(BaseMenu):
     """Menu for equipping and unequipping items."""
@@ -14,10 +18,15 @@ class EquipMenu(BaseMenu):
         return "Select item number:"
     
     def build_menu_items(self, player_entity: int) -> List[str]:
-        """Build list of equippable items and equipped items."""
-        from components.items import Inventory, Item, Equipment, EquipmentSlots
+        """Build list of equippable items and equipped items.
+        
+        Entries are (EQUIP_ENTRY, item_id) or (UNEQUIP_ENTRY, item_id, slot) tuples.
+        """
+        from components.items import Inventory, Item, EquipmentSlots
+        from systems.inventory import get_equippable_items
         
         items = []
+        entries = self._entries
         inventory = self.world.get_component(player_entity, Inventory)
         equipment_slots = self.world.get_component(player_entity, EquipmentSlots)
         
@@ -25,13 +34,12 @@ class EquipMenu(BaseMenu):
             return items
         
         # Add equippable items from inventory
-        for item_entity_id in inventory.items:
-            equipment = self.world.get_component(item_entity_id, Equipment)
-            if equipment:
-                item = self.world.get_component(item_entity_id, Item)
-                if item:
-                    name = item.name[:16]
-                    items.append(f"{name} (equip)")
+        for item_entity_id in get_equippable_items(self.world, inventory):
+            item = self.world.get_component(item_entity_id, Item)
+            if item:
+                name = item.name[:16]
+                items.append(f"{name} (equip)")
+                entries.append((EQUIP_ENTRY, item_entity_id))
         
         # Add equipped items for unequipping
         equipped_items = equipment_slots.get_equipped_items()
@@ -41,5 +49,6 @@ class EquipMenu(BaseMenu):
                 if item:
                     name = item.name[:14]
                     items.append(f"{name} (unequip)")
+                    entries.append((UNEQUIP_ENTRY, item_entity_id, slot))
         
         return items
@@ -155,12 +155,10 @@ class ItemExaminationMenu(BaseMenu):
         # Check for equipment
         if self.world.has_component(self.examined_item_id, Equipment):
             equipment_slots = self.world.get_component(player_entity, EquipmentSlots)
-            equipment = self.world.get_component(self.examined_item_id, Equipment)
             
-            if equipment_slots and equipment:
+            if equipment_slots:
                 # Check if already equipped
-                equipped_items = equipment_slots.get_equipped_items()
-                if self.examined_item_id in equipped_items.values():
+                if equipment_slots.get_item_slot(self.examined_item_id) is not None:
                     self.available_actions.append("Unequip")
                 else:
                     self.available_actions.append("Equip")
@@ -170,8 +168,8 @@ class ItemExaminationMenu(BaseMenu):
             self.available_actions.append("Use")
         
         # Check for light emitter
-        if self.world.has_component(self.examined_item_id, LightEmitter):
-            light = self.world.get_component(self.examined_item_id, LightEmitter)
+        light = self.world.get_component(self.examined_item_id, LightEmitter)
+        if light:
             if light.fuel > 0:
                 if light.active:
                     self.available_actions.append("Extinguish")
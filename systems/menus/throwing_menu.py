@@ -14,9 +14,11 @@ class ThrowingMenu(BaseMenu):
         return "Select item to throw:"
     
     def build_menu_items(self, player_entity: int) -> List[str]:
-        """Build list of throwable items."""
+        """Build list of throwable items. Entries are throwable item ids."""
         from components.items import Inventory, Item, Throwable
         from components.corpse import Corpse
+        from components.effects import Physics
+        from systems.inventory import get_throwable_items
         
         items = []
         inventory = self.world.get_component(player_entity, Inventory)
@@ -25,32 +27,30 @@ class ThrowingMenu(BaseMenu):
             return items
         
         # Add throwable items from inventory
-        for item_entity_id in inventory.items:
-            # Check if item has throwable component or physics component
+        for item_entity_id in get_throwable_items(self.world, inventory):
             throwable = self.world.get_component(item_entity_id, Throwable)
-            from components.effects import Physics
             physics = self.world.get_component(item_entity_id, Physics)
             
-            # Items are throwable if they have Throwable component or Physics component
-            if throwable or physics:
-                item = self.world.get_component(item_entity_id, Item)
-                if item:
-                    name = item.name[:16]
+            item = self.world.get_component(item_entity_id, Item)
+            if item:
+                name = item.name[:16]
+                weight_info = ""
+                if throwable:
+                    weight_info = f" ({throwable.weight:.1f}lbs)"
+                elif physics:
+                    weight_info = f" ({physics.mass:.1f}lbs)"
+                items.append(f"{name}{weight_info}")
+                self._entries.append(item_entity_id)
+            else:
+                # Check if it's a corpse
+                corpse = self.world.get_component(item_entity_id, Corpse)
+                if corpse:
+                    name = f"{corpse.original_entity_type} corpse"[:16]
                     weight_info = ""
-                    if throwable:
-                        weight_info = f" ({throwable.weight:.1f}lbs)"
-                    elif physics:
+                    if physics:
                         weight_info = f" ({physics.mass:.1f}lbs)"
                     items.append(f"{name}{weight_info}")
-                else:
-                    # Check if it's a corpse
-                    corpse = self.world.get_component(item_entity_id, Corpse)
-                    if corpse:
-                        name = f"{corpse.original_entity_type} corpse"[:16]
-                        weight_info = ""
-                        if physics:
-                            weight_info = f" ({physics.mass:.1f}lbs)"
-                        items.append(f"{name}{weight_info}")
+                    self._entries.append(item_entity_id)
         
         if not items:
             items.append("No throwable items")
@@ -59,21 +59,11 @@ class ThrowingMenu(BaseMenu):
     
     def get_throwable_items(self, player_entity: int) -> List[int]:
         """Get list of throwable item entity IDs."""
-        from components.items import Inventory, Throwable
-        from components.effects import Physics
+        from components.items import Inventory
+        from systems.inventory import get_throwable_items
         
-        throwable_items = []
         inventory = self.world.get_component(player_entity, Inventory)
-        
         if not inventory:
-            return throwable_items
-        
-        for item_entity_id in inventory.items:
-            # Items are throwable if they have Throwable component or Physics component
-            throwable = self.world.get_component(item_entity_id, Throwable)
-            physics = self.world.get_component(item_entity_id, Physics)
-            
-            if throwable or physics:
-                throwable_items.append(item_entity_id)
+            return []
         
-        return throwable_items
+        return get_throwable_items(self.world, inventory)
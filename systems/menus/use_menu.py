@@ -14,8 +14,9 @@ class UseMenu(BaseMenu):
         return "Select item number:"
     
     def build_menu_items(self, player_entity: int) -> List[str]:
-        """Build list of usable items."""
+        """Build list of usable items. Entries are consumable item ids."""
         from components.items import Inventory, Item, Consumable
+        from systems.inventory import get_consumable_items
         
         items = []
         inventory = self.world.get_component(player_entity, Inventory)
@@ -24,13 +25,13 @@ class UseMenu(BaseMenu):
             return items
         
         # Add consumable items from inventory
-        for item_entity_id in inventory.items:
-            consumable = self.world.get_component(item_entity_id, Consumable)
-            if consumable:
-                item = self.world.get_component(item_entity_id, Item)
-                if item:
-                    name = item.name[:16]
-                    uses_text = f"({consumable.uses})" if consumable.uses > 1 else ""
-                    items.append(f"{name} {uses_text}")
+        for item_entity_id in get_consumable_items(self.world, inventory):
+            item = self.world.get_component(item_entity_id, Item)
+            if item:
+                consumable = self.world.get_component(item_entity_id, Consumable)
+                name = item.name[:16]
+                uses_text = f"({consumable.uses})" if consumable.uses > 1 else ""
+                items.append(f"{name} {uses_text}")
+                self._entries.append(item_entity_id)
         
         return items
@@ -6,38 +6,45 @@ from ecs.system import System
 from components.core import Position, Blocking, Door, Renderable
 from components.combat import Health
 from game.level_world_gen import LevelWorldGenerator
-from game.config import GameConfig
+from game.config import is_valid_y, is_valid_position
 from game.glyph_config import GlyphConfig
-from typing import Set
+from events.core import EventType
+from events.movement import EntityMovedEvent
+from typing import Optional, Set, Tuple
 
 
 class MovementSystem(System):
     """Handles movement and collision detection."""
     
-    def __init__(self, world, world_generator: LevelWorldGenerator, message_log, glyph_config: GlyphConfig = None):
+    def __init__(self, world, world_generator: LevelWorldGenerator, message_log, glyph_config: GlyphConfig = None,
+                 spatial_index=None):
         super().__init__(world)
         self.world_generator = world_generator
         self.message_log = message_log
         self.glyph_config = glyph_config or GlyphConfig()
+        self.spatial_index = spatial_index
     
     def update(self, dt: float = 0.0) -> None:
         """Movement system doesn't auto-update - it responds to action requests."""
         pass
     
-    def try_move_entity(self, entity_id: int, dx: int, dy: int) -> bool:
-        """Attempt to move an entity by the given offset."""
+    def try_move_entity(self, entity_id: int, dx: int, dy: int) -> Optional[Tuple[int, int]]:
+        """Attempt to move an entity by the given offset.
+        
+        Returns the entity's new (x, y) on success, None if the move was blocked.
+        """
         position = self.world.get_component(entity_id, Position)
         if not position:
-            return False
+            return None
         
         # Store old position for event
-        old_pos = (position.x, position.y)
-        new_x = position.x + dx
-        new_y = position.y + dy
+        old_x, old_y = position.x, position.y
+        new_x = old_x + dx
+        new_y = old_y + dy
         
         # Check bounds using centralized config
-        if not GameConfig.is_valid_y(new_y):
-            return False
+        if not is_valid_y(new_y):
+            return None
         
         # Check for doors first - they can be opened
         door_entity = self._get_door_at_position(new_x, new_y)
@@ -49,23 +56,23 @@ class MovementSystem(System):
                 position.x = new_x
                 position.y = new_y
                 # Emit movement event
-                self._emit_movement_event(entity_id, old_pos, (new_x, new_y))
-                return True
+                self._emit_movement_event(entity_id, old_x, old_y, new_x, new_y)
+                return new_x, new_y
         
         # Check for collision
         if self._is_position_blocked(new_x, new_y, entity_id):
             # Handle dark vision bumping exploration for player entities
             self._handle_bump_exploration(entity_id, new_x, new_y)
-            return False
+            return None
         
         # Move the entity
         position.x = new_x
         position.y = new_y
         
         # Emit movement event
-        self._emit_movement_event(entity_id, old_pos, (new_x, new_y))
+        self._emit_movement_event(entity_id, old_x, old_y, new_x, new_y)
         
-        return True
+        return new_x, new_y
     
     def try_move_to(self, entity_id: int, target_x: int, target_y: int) -> bool:
         """Attempt to move an entity to a specific position."""
@@ -74,10 +81,10 @@ class MovementSystem(System):
             return False
         
         # Store old position for event
-        old_pos = (position.x, position.y)
+        old_x, old_y = position.x, position.y
         
         # Check bounds using centralized config
-        if not GameConfig.is_valid_y(target_y):
+        if not is_valid_y(target_y):
             return False
         
         # Check for collision
@@ -89,7 +96,7 @@ class MovementSystem(System):
         position.y = target_y
         
         # Emit movement event
-        self._emit_movement_event(entity_id, old_pos, (target_x, target_y))
+        self._emit_movement_event(entity_id, old_x, old_y, target_x, target_y)
         
         return True
     
@@ -100,36 +107,42 @@ class MovementSystem(System):
             return True
         
         # Check for blocking entities
-        blocking_entities = self.world.get_entities_with_components(Position, Blocking)
+        if self.spatial_index:
+            blocking = self.world.get_all_components(Blocking)
+            for entity_id in self.spatial_index.at(x, y):
+                if entity_id != moving_entity and entity_id in blocking:
+                    return True
+            return False
         
-        for entity_id in blocking_entities:
-            if entity_id == moving_entity:
-                continue  # Don't check collision with self
-            
-            entity_pos = self.world.get_component(entity_id, Position)
-            if entity_pos and entity_pos.x == x and entity_pos.y == y:
+        positions = self.world.get_all_components(Position)
+        for entity_id in self.world.get_entities_with_components(Position, Blocking):
+            entity_pos = positions[entity_id]
+            if entity_pos.x == x and entity_pos.y == y and entity_id != moving_entity:
                 return True
         
         return False
     
     def get_entity_at_position(self, x: int, y: int) -> int:
         """Get the first entity at the given position, or None."""
-        entities_with_position = self.world.get_entities_with_components(Position)
-        
-        for entity_id in entities_with_position:
-            position = self.world.get_component(entity_id, Position)
-            if position and position.x == x and position.y == y:
+        for entity_id, position in self.world.get_all_components(Position).items():
+            if position.x == x and position.y == y:
                 return entity_id
         
         return None
     
     def get_blocking_entity_at(self, x: int, y: int) -> int:
         """Get the blocking entity at the given position, or None."""
-        blocking_entities = self.world.get_entities_with_components(Position, Blocking)
-        
-        for entity_id in blocking_entities:
-            position = self.world.get_component(entity_id, Position)
-            if position and position.x == x and position.y == y:
+        if self.spatial_index:
+            blocking = self.world.get_all_components(Blocking)
+            for entity_id in self.spatial_index.at(x, y):
+                if entity_id in blocking:
+                    return entity_id
+            return None
+        
+        positions = self.world.get_all_components(Position)
+        for entity_id in self.world.get_entities_with_components(Position, Blocking):
+            position = positions[entity_id]
+            if position.x == x and position.y == y:
                 return entity_id
         
         return None
@@ -137,17 +150,14 @@ class MovementSystem(System):
     def get_entities_in_radius(self, center_x: int, center_y: int, radius: int) -> Set[int]:
         """Get all entities within a given radius of a position."""
         entities = set()
-        entities_with_position = self.world.get_entities_with_components(Position)
-        
-        for entity_id in entities_with_position:
-            position = self.world.get_component(entity_id, Position)
-            if position:
-                dx = abs(position.x - center_x)
-                dy = abs(position.y - center_y)
-                distance = max(dx, dy)  # Chebyshev distance (8-directional)
-                
-                if distance <= radius:
-                    entities.add(entity_id)
+        
+        for entity_id, position in self.world.get_all_components(Position).items():
+            dx = abs(position.x - center_x)
+            dy = abs(position.y - center_y)
+            distance = max(dx, dy)  # Chebyshev distance (8-directional)
+            
+            if distance <= radius:
+                entities.add(entity_id)
         
         return entities
     
@@ -174,11 +184,17 @@ class MovementSystem(System):
     
     def _get_door_at_position(self, x: int, y: int) -> int:
         """Get the door entity at the given position, or None."""
-        door_entities = self.world.get_entities_with_components(Position, Door)
-        
-        for entity_id in door_entities:
-            position = self.world.get_component(entity_id, Position)
-            if position and position.x == x and position.y == y:
+        if self.spatial_index:
+            doors = self.world.get_all_components(Door)
+            for entity_id in self.spatial_index.at(x, y):
+                if entity_id in doors:
+                    return entity_id
+            return None
+        
+        positions = self.world.get_all_components(Position)
+        for entity_id in self.world.get_entities_with_components(Position, Door):
+            position = positions[entity_id]
+            if position.x == x and position.y == y:
                 return entity_id
         
         return None
@@ -230,12 +246,11 @@ class MovementSystem(System):
             return
         
         # Check if player has dark vision component
-        dark_vision = self.world.get_component(entity_id, DarkVision)
-        if not dark_vision:
+        if not self.world.has_component(entity_id, DarkVision):
             return
         
         # Check if the bumped position is a wall and within bounds
-        if (GameConfig.is_valid_position(bump_x, bump_y) and 
+        if (is_valid_position(bump_x, bump_y) and 
             self.world_generator.is_wall_at(bump_x, bump_y)):
             
             # Mark the wall tile as explored
@@ -247,10 +262,9 @@ class MovementSystem(System):
                 if self.message_log:
                     self.message_log.add_info("You feel around in the darkness.")
     
-    def _emit_movement_event(self, entity_id: int, old_pos: tuple, new_pos: tuple) -> None:
+    def _emit_movement_event(self, entity_id: int, old_x: int, old_y: int, new_x: int, new_y: int) -> None:
         """Emit a movement event when an entity moves."""
         # Only emit if position actually changed
-        if old_pos != new_pos:
-            from events.movement import EntityMovedEvent
-            event = EntityMovedEvent(entity_id, old_pos, new_pos)
-            self.world.event_manager.emit('entity_moved', event)
+        if old_x != new_x or old_y != new_y:
+            self.world.event_manager.emit_if_subscribed(
+                EventType.ENTITY_MOVED, EntityMovedEvent.acquire, entity_id, old_x, old_y, new_x, new_y)
@@ -4,6 +4,7 @@ Refactored for modularity and scalability.
 """
 
 from ecs.system import System
+from events.core import EventType
 from game.camera import Camera
 from game.message_log import MessageLog
 from game.level_world_gen import LevelWorldGenerator
@@ -70,7 +71,7 @@ class RenderSystem(System):
         self.simple_lighting = None
         
         # Register for movement events to invalidate cache
-        self.world.event_manager.subscribe('entity_moved', self._on_entity_moved)
+        self.world.event_manager.subscribe(EventType.ENTITY_MOVED, self._on_entity_moved)
     
     def update(self, dt: float = 0.0) -> None:
         """Render the complete game screen."""
@@ -88,6 +89,11 @@ class RenderSystem(System):
         left, top, right, bottom = self.camera.get_viewport_bounds()
         message_lines = self.message_log.get_recent_lines(self.MESSAGE_HEIGHT)
         
+        # Map columns in world coordinates, shared by every map row
+        map_columns = range(left, left + self.MAP_WIDTH)
+        get_tile_display = self.tile_renderer.get_tile_display
+        apply_color = self.text_formatter.apply_color
+        
         
         # Build each row of the screen (24 total rows)
         for screen_y in range(self.TOTAL_SCREEN_HEIGHT):
@@ -132,10 +138,7 @@ class RenderSystem(System):
             if screen_y < self.MAP_HEIGHT:
                 # Map area (rows 0-22)
                 world_y = top + screen_y
-                for screen_x in range(self.MAP_WIDTH):
-                    world_x = left + screen_x
-                    char, color = self.tile_renderer.get_tile_display(world_x, world_y)
-                    line += self.text_formatter.apply_color(char, color)
+                line += ''.join([apply_color(*get_tile_display(world_x, world_y)) for world_x in map_columns])
             else:
                 # Status line (row 23)
                 status_line = self.status_display.get_status_line()
@@ -293,11 +296,8 @@ class RenderSystem(System):
     def _on_entity_moved(self, event) -> None:
         """Handle entity movement events by invalidating cache for affected positions."""
         # Invalidate cache for both old and new positions
-        old_x, old_y = event.old_pos
-        new_x, new_y = event.new_pos
-        
-        self.invalidate_position(old_x, old_y)
-        self.invalidate_position(new_x, new_y)
+        self.invalidate_position(event.old_x, event.old_y)
+        self.invalidate_position(event.new_x, event.new_y)
     
     def cleanup(self) -> None:
         """Clean up terminal state."""
@@ -23,7 +23,7 @@ from dataclasses import dataclass
 
 if TYPE_CHECKING:
     from game.level_world_gen import LevelWorldGenerator
-from game.config import GameConfig
+from game.config import LEVEL_WIDTH, LEVEL_HEIGHT, is_valid_position
 
 
 @dataclass
@@ -187,7 +187,7 @@ class SimpleLightingSystem(System):
                     if dx == 0 and dy == 0:
                         continue
                     x, y = player_pos.x + dx, player_pos.y + dy
-                    if GameConfig.is_valid_position(x, y):
+                    if is_valid_position(x, y):
                         self.player_fov.add((x, y))
         else:
             # Normal shadowcasting
@@ -202,9 +202,10 @@ class SimpleLightingSystem(System):
         """Add lit/penumbra tiles that the player has line of sight to."""
         # Check all lit and penumbra tiles
         all_lit_tiles = self.lit_tiles | self.penumbra_tiles
+        is_opaque = self._opacity_test()
         
         for x, y in all_lit_tiles:
-            if self._has_line_of_sight(player_x, player_y, x, y):
+            if self._has_line_of_sight(player_x, player_y, x, y, is_opaque):
                 self.player_fov.add((x, y))
     
     def _get_all_light_sources(self) -> list:
@@ -281,6 +282,7 @@ class SimpleLightingSystem(System):
         """Calculate visible positions from a point using shadowcasting."""
         visible = set()
         visible.add((cx, cy))  # Source position is always visible
+        is_opaque = self._opacity_test()
         
         # Cast shadows in all 8 octants
         for octant in range(8):
@@ -288,18 +290,21 @@ class SimpleLightingSystem(System):
                             self.octant_multipliers[0][octant],
                             self.octant_multipliers[1][octant],
                             self.octant_multipliers[2][octant],
-                            self.octant_multipliers[3][octant])
+                            self.octant_multipliers[3][octant],
+                            is_opaque)
         
         return visible
     
     def _cast_shadow(self, cx: int, cy: int, row: int, start: float, end: float,
                     radius: int, visible: Set[Tuple[int, int]],
-                    xx: int, xy: int, yx: int, yy: int) -> None:
+                    xx: int, xy: int, yx: int, yy: int, is_opaque) -> None:
         """Recursive shadowcasting algorithm."""
         if start < end:
             return
         
         radius_squared = radius * radius
+        width = LEVEL_WIDTH
+        height = LEVEL_HEIGHT
         new_start = 0.0
         
         for j in range(row, radius + 1):
@@ -324,13 +329,14 @@ class SimpleLightingSystem(System):
                 elif end > l_slope:
                     break
                 
-                # Check if within radius
-                if dx * dx + dy * dy <= radius_squared:
+                # Check if within radius and on the map; off-map cells are
+                # opaque, so they still shape the shadows below
+                if dx * dx + dy * dy <= radius_squared and 0 <= mx < width and 0 <= my < height:
                     visible.add((mx, my))
                 
                 if blocked:
                     # In shadow
-                    if self._is_wall(mx, my):
+                    if is_opaque(mx, my):
                         new_start = r_slope
                         continue
                     else:
@@ -338,17 +344,19 @@ class SimpleLightingSystem(System):
                         start = new_start
                 else:
                     # In light
-                    if self._is_wall(mx, my) and j < radius:
+                    if is_opaque(mx, my) and j < radius:
                         blocked = True
                         self._cast_shadow(cx, cy, j + 1, start, l_slope, radius, visible,
-                                        xx, xy, yx, yy)
+                                        xx, xy, yx, yy, is_opaque)
                         new_start = r_slope
             
             if blocked:
                 break
     
-    def _has_line_of_sight(self, x1: int, y1: int, x2: int, y2: int) -> bool:
+    def _has_line_of_sight(self, x1: int, y1: int, x2: int, y2: int, is_opaque=None) -> bool:
         """Check line of sight using Bresenham's algorithm."""
+        if is_opaque is None:
+            is_opaque = self._opacity_test()
         dx = abs(x2 - x1)
         dy = abs(y2 - y1)
         
@@ -360,7 +368,7 @@ class SimpleLightingSystem(System):
         while True:
             # Check for walls (skip start and end points)
             if (x, y) != (x1, y1) and (x, y) != (x2, y2):
-                if self._is_wall(x, y):
+                if is_opaque(x, y):
                     return False
             
             if x == x2 and y == y2:
@@ -376,39 +384,55 @@ class SimpleLightingSystem(System):
         
         return True
     
-    def _is_wall(self, x: int, y: int) -> bool:
-        """Check if position blocks line of sight."""
-        # Terrain walls
-        if self.world_generator.is_wall_at(x, y):
-            return True
-        
-        # Closed doors
-        door_entities = self.world.get_entities_with_components(Position, Door)
-        for entity_id in door_entities:
-            position = self.world.get_component(entity_id, Position)
-            door = self.world.get_component(entity_id, Door)
+    def _opacity_test(self):
+        """Build an (x, y) -> bool test for tiles that block line of sight.
+        
+        Door positions are gathered once here so FOV and LOS loops don't
+        rescan every door for each tile they touch.
+        """
+        # Closed doors (the first door found on a tile decides it)
+        door_states = {}
+        positions = self.world.get_all_components(Position)
+        doors = self.world.get_all_components(Door)
+        for entity_id in self.world.get_entities_with_components(Position, Door):
+            position = positions[entity_id]
+            door_states.setdefault((position.x, position.y), not doors[entity_id].is_open)
+        closed_doors = {pos for pos, closed in door_states.items() if closed}
+        
+        # Terrain walls, read straight from the level's wall grid when built
+        level = self.world_generator.get_current_level()
+        wall_grid = level.wall_grid if level else None
+        if wall_grid is None:
+            is_wall_at = self.world_generator.is_wall_at
             
-            if position and door and position.x == x and position.y == y:
-                return not door.is_open
-        
-        return False
+            def is_opaque(x: int, y: int) -> bool:
+                return is_wall_at(x, y) or (x, y) in closed_doors
+            return is_opaque
+        
+        width = level.width
+        height = level.height
+        
+        def is_opaque(x: int, y: int) -> bool:
+            if not (0 <= x < width and 0 <= y < height) or wall_grid[y * width + x]:
+                return True
+            return (x, y) in closed_doors
+        return is_opaque
     
     def _apply_entity_visibility(self) -> None:
         """Apply visibility to entities based on FOV (optimized)."""
         # Performance optimization: Only update entities that have changed visibility
         
-        # Get all entities with position and visibility
-        entities_with_visibility = self.world.get_entities_with_components(Position, Visible)
+        from components.core import Renderable
+        player_fov = self.player_fov
+        renderables = self.world.get_all_components(Renderable)
         
-        for entity_id in entities_with_visibility:
-            position = self.world.get_component(entity_id, Position)
-            visible = self.world.get_component(entity_id, Visible)
-            
-            if not position or not visible:
-                continue
-            
+        positions = self.world.get_all_components(Position)
+        visibles = self.world.get_all_components(Visible)
+        for entity_id in self.world.get_entities_with_components(Position, Visible):
+            position = positions[entity_id]
+            visible = visibles[entity_id]
             # Check if entity should be visible
-            should_be_visible = (position.x, position.y) in self.player_fov
+            should_be_visible = (position.x, position.y) in player_fov
             
             # Only update if visibility changed
             if visible.visible != should_be_visible:
@@ -416,8 +440,7 @@ class SimpleLightingSystem(System):
                 
                 # Update last seen info if now visible
                 if should_be_visible:
-                    from components.core import Renderable
-                    renderable = self.world.get_component(entity_id, Renderable)
+                    renderable = renderables.get(entity_id)
                     if renderable:
                         visible.last_seen_x = position.x
                         visible.last_seen_y = position.y
@@ -552,7 +575,7 @@ class SimpleLightingSystem(System):
                     if dx == 0 and dy == 0:
                         continue
                     x, y = player_pos.x + dx, player_pos.y + dy
-                    if GameConfig.is_valid_position(x, y):
+                    if is_valid_position(x, y):
                         self.player_fov.add((x, y))
         else:
             # Normal shadowcasting - use cache
@@ -578,6 +601,7 @@ class SimpleLightingSystem(System):
         
         # Performance optimization: Only check tiles within reasonable distance
         MAX_SIGHT_DISTANCE = 20  # Reasonable maximum for line-of-sight checks
+        is_opaque = self._opacity_test()
         
         for x, y in all_lit_tiles:
             # Distance culling - skip very distant tiles
@@ -585,7 +609,7 @@ class SimpleLightingSystem(System):
             if distance_squared > MAX_SIGHT_DISTANCE ** 2:
                 continue
             
-            if self._has_line_of_sight(player_x, player_y, x, y):
+            if self._has_line_of_sight(player_x, player_y, x, y, is_opaque):
                 self.player_fov.add((x, y))
     
     def force_recalculation(self) -> None:
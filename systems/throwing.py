@@ -8,9 +8,11 @@ from components.throwing import ThrowingCursor, ThrownObject
 from components.items import Inventory, Item, Throwable
 from components.effects import Physics
 from components.character import CharacterAttributes
-from components.skills import Skills
+from components.skills import Skills, SKILL_THROWING
 from components.ai import AI
 from utils.line_drawing import draw_line, calculate_distance
+from events.core import EventType
+from events.movement import EntityMovedEvent
 import random
 from typing import Optional, Tuple, List
 
@@ -29,15 +31,16 @@ class ThrowingSystem(System):
     
     def update(self, dt: float = 0.0) -> None:
         """Update throwing system - process thrown objects."""
-        # Process any thrown objects that need to land
-        thrown_entities = self.world.get_entities_with_components(ThrownObject, Position)
-        for entity_id in thrown_entities:
-            self._process_thrown_object(entity_id)
+        # Process any thrown objects that need to land. The entity set is an
+        # immutable snapshot, so processing can remove ThrownObject safely.
+        thrown_objects = self.world.get_all_components(ThrownObject)
+        positions = self.world.get_all_components(Position)
+        for entity_id in self.world.get_entities_with_components(ThrownObject, Position):
+            self._process_thrown_object(entity_id, thrown_objects[entity_id], positions[entity_id])
     
     def start_throwing(self, player_entity: int, selected_item: int) -> bool:
         """Start the throwing process with cursor targeting."""
-        player_pos = self.world.get_component(player_entity, Position)
-        if not player_pos:
+        if not self.world.has_component(player_entity, Position):
             return False
         
         # Find initial cursor position
@@ -84,7 +87,7 @@ class ThrowingSystem(System):
         
         # Get the item being thrown
         item_entity = cursor.selected_item
-        if item_entity not in inventory.items:
+        if not inventory.has_item(item_entity):
             self.message_log.add_warning("Item no longer in inventory!")
             return False
         
@@ -97,7 +100,7 @@ class ThrowingSystem(System):
         
         strength = attributes.strength if attributes else 10
         agility = attributes.agility if attributes else 10
-        throwing_skill = skills.get_skill('throwing') if skills else 1
+        throwing_skill = skills.get_skill_by_id(SKILL_THROWING) if skills else 1
         
         # Get item weight
         item_weight = self._get_item_weight(item_entity)
@@ -117,23 +120,21 @@ class ThrowingSystem(System):
         
         # Move item to landing position
         item_pos = self.world.get_component(item_entity, Position)
-        old_pos = None
         
         if not item_pos:
             # Item doesn't have position (was in inventory), add it
             item_pos = Position(actual_x, actual_y)
             self.world.add_component(item_entity, item_pos)
-            old_pos = (-1, -1)  # Special position indicating "from inventory"
+            old_x, old_y = -1, -1  # Special position indicating "from inventory"
         else:
             # Item already has position, update it
-            old_pos = (item_pos.x, item_pos.y)
+            old_x, old_y = item_pos.x, item_pos.y
             item_pos.x = actual_x
             item_pos.y = actual_y
         
         # Always emit movement event for thrown items (position always changes)
-        from events.movement import EntityMovedEvent
-        event = EntityMovedEvent(item_entity, old_pos, (actual_x, actual_y))
-        self.world.event_manager.emit('entity_moved', event)
+        self.world.event_manager.emit_if_subscribed(
+            EventType.ENTITY_MOVED, EntityMovedEvent.acquire, item_entity, old_x, old_y, actual_x, actual_y)
         
         # Add thrown object component for processing
         thrown_obj = ThrownObject(cursor.cursor_x, cursor.cursor_y, player_entity, 
@@ -159,8 +160,7 @@ class ThrowingSystem(System):
     
     def cancel_throwing(self, player_entity: int) -> bool:
         """Cancel the throwing action."""
-        cursor = self.world.get_component(player_entity, ThrowingCursor)
-        if cursor:
+        if self.world.has_component(player_entity, ThrowingCursor):
             self.world.remove_component(player_entity, ThrowingCursor)
             self.message_log.add_info("Throwing cancelled.")
             return True
@@ -268,12 +268,9 @@ class ThrowingSystem(System):
         
         return (target_x, target_y)
     
-    def _process_thrown_object(self, item_entity: int) -> None:
+    def _process_thrown_object(self, item_entity: int, thrown_obj: ThrownObject, item_pos: Position) -> None:
         """Process a thrown object for collision and damage."""
-        thrown_obj = self.world.get_component(item_entity, ThrownObject)
-        item_pos = self.world.get_component(item_entity, Position)
-        
-        if not thrown_obj or not item_pos or thrown_obj.has_landed:
+        if thrown_obj.has_landed:
             return
         
         # Mark as landed
@@ -285,9 +282,9 @@ class ThrowingSystem(System):
         if target_entity:
             # Calculate damage
             item_weight = self._get_item_weight(item_entity)
+            thrower_pos = self.world.get_component(thrown_obj.thrower_id, Position)
             distance_thrown = calculate_distance(
-                self.world.get_component(thrown_obj.thrower_id, Position).x,
-                self.world.get_component(thrown_obj.thrower_id, Position).y,
+                thrower_pos.x, thrower_pos.y,
                 item_pos.x, item_pos.y
             )
             
@@ -329,6 +326,6 @@ class ThrowingSystem(System):
         
         ai = self.world.get_component(entity_id, AI)
         if ai:
-            return ai.ai_type.value
+            return ai.ai_type.label
         
         return "entity"
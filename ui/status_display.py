@@ -96,7 +96,7 @@ class StatusDisplay:
             
             status_text = self.formatter.apply_color("Status: ", "bright_black")
             
-            if status_effect and status_effect.effects:
+            if status_effect and status_effect.names:
                 # Show status effects with colored indicators
                 status_indicators = []
                 if status_effect.has_effect("bleeding"):
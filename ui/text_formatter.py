@@ -6,37 +6,35 @@ import blessed
 class TextFormatter:
     """Handles text formatting, coloring, and highlighting for terminal output."""
     
+    # Color names understood by apply_color, each also a terminal capability name
+    COLOR_CAPABILITIES = (
+        'white',
+        'yellow',
+        'red',
+        'green',
+        'bright_black',
+        'cyan',
+        'magenta',
+        'black_on_magenta',
+        'black_on_white',
+        'blue',
+        'black',
+    )
+    
     def __init__(self, terminal: blessed.Terminal):
         self.term = terminal
+        
+        # Resolve every color's escape sequence once instead of per call
+        self._normal = terminal.normal
+        self._color_codes = {name: getattr(terminal, name) for name in self.COLOR_CAPABILITIES}
+        self._color_codes['dark_red'] = terminal.color(88)  # Dark red color
     
     def apply_color(self, text: str, color: str) -> str:
         """Apply terminal color to text."""
-        if color == 'white':
-            return self.term.white + text + self.term.normal
-        elif color == 'yellow':
-            return self.term.yellow + text + self.term.normal
-        elif color == 'red':
-            return self.term.red + text + self.term.normal
-        elif color == 'green':
-            return self.term.green + text + self.term.normal
-        elif color == 'bright_black':
-            return self.term.bright_black + text + self.term.normal
-        elif color == 'cyan':
-            return self.term.cyan + text + self.term.normal
-        elif color == 'magenta':
-            return self.term.magenta + text + self.term.normal
-        elif color == 'black_on_magenta':
-            return self.term.black_on_magenta + text + self.term.normal
-        elif color == 'black_on_white':
-            return self.term.black_on_white + text + self.term.normal
-        elif color == 'blue':
-            return self.term.blue + text + self.term.normal
-        elif color == 'black':
-            return self.term.black + text + self.term.normal
-        elif color == 'dark_red':
-            return self.term.color(88) + text + self.term.normal  # Dark red color
-        else:
+        code = self._color_codes.get(color)
+        if code is None:
             return text
+        return code + text + self._normal
     
     def apply_highlight(self, text: str) -> str:
         """Apply highlighting (reverse colors) to text."""
@@ -25,7 +25,7 @@ def get_entity_name(world: 'World', entity_id: int) -> str:
     # Second priority: AI type (fallback for compatibility)
     ai = world.get_component(entity_id, AI)
     if ai:
-        return ai.ai_type.value
+        return ai.ai_type.label
     
     # Last resort
     return "entity"
@@ -0,0 +1,25 @@
+"""
+Enum helpers shared by component modules.
+"""
+
+from enum import IntEnum
+
+
+class LabeledIntEnum(IntEnum):
+    """IntEnum whose members also carry a lowercase string label.
+
+    Members compare as plain ints, which keeps per-tick checks cheap, while
+    the label keeps the old string form for display, data files and saves.
+    """
+
+    @property
+    def label(self) -> str:
+        """Lowercase display name of this member (e.g. 'stairs_down')."""
+        return self.name.lower()
+
+    @classmethod
+    def _missing_(cls, value):
+        # Accept the legacy string values used by data files and older saves
+        if isinstance(value, str):
+            return cls.__members__.get(value.upper())
+        return None
@@ -2,32 +2,15 @@
 A* pathfinding algorithm for auto-exploration.
 """
 
-import heapq
-from typing import List, Tuple, Optional, Set, Callable
-from dataclasses import dataclass
+from heapq import heappush, heappop
+from typing import List, Tuple, Optional, Set, Dict, Callable
 
 
-@dataclass
-class PathNode:
-    """A node in the pathfinding graph."""
-    x: int
-    y: int
-    g_cost: float = 0.0  # Cost from start
-    h_cost: float = 0.0  # Heuristic cost to goal
-    f_cost: float = 0.0  # Total cost (g + h)
-    parent: Optional['PathNode'] = None
-    
-    def __post_init__(self):
-        self.f_cost = self.g_cost + self.h_cost
-    
-    def __lt__(self, other):
-        return self.f_cost < other.f_cost
-    
-    def __eq__(self, other):
-        return self.x == other.x and self.y == other.y
-    
-    def __hash__(self):
-        return hash((self.x, self.y))
+# 8-directional steps with their movement cost (diagonal moves cost more)
+_NEIGHBOR_STEPS = (
+    (-1, -1, 1.4), (-1, 0, 1.0), (-1, 1, 1.4), (0, -1, 1.0),
+    (0, 1, 1.0), (1, -1, 1.4), (1, 0, 1.0), (1, 1, 1.4),
+)
 
 
 class Pathfinder:
@@ -45,7 +28,7 @@ class Pathfinder:
         self.max_cache_size = 100
     
     def find_path(self, start_x: int, start_y: int, goal_x: int, goal_y: int, 
-                  max_distance: int = 100) -> Optional[List[Tuple[int, int]]]:
+                  max_distance: int = 100) -> Optional[Tuple[Tuple[int, int], ...]]:
         """
         Find a path from start to goal using A* algorithm.
         
@@ -55,7 +38,8 @@ class Pathfinder:
             max_distance: Maximum search distance to prevent infinite loops
             
         Returns:
-            List of (x, y) coordinates representing the path, or None if no path found
+            Tuple of (x, y) coordinates representing the path, or None if no path found.
+            Paths are shared with the cache, hence immutable.
         """
         # Check cache first
         cache_key = (start_x, start_y, goal_x, goal_y)
@@ -68,76 +52,55 @@ class Pathfinder:
         
         # If start is goal, return empty path
         if start_x == goal_x and start_y == goal_y:
-            return []
+            return ()
         
-        open_set = []
-        closed_set: Set[Tuple[int, int]] = set()
-        
-        # Create start node
-        start_node = PathNode(start_x, start_y)
-        start_node.h_cost = self._heuristic(start_x, start_y, goal_x, goal_y)
-        start_node.f_cost = start_node.h_cost
+        is_walkable = self.is_walkable
+        start_pos = (start_x, start_y)
         
-        heapq.heappush(open_set, start_node)
-        open_dict = {(start_x, start_y): start_node}
+        # Open set entries are (f_cost, insertion order, x, y); a position can be
+        # pushed again with a lower cost, and stale entries are skipped on pop
+        open_set = [(self._heuristic(start_x, start_y, goal_x, goal_y), 0, start_x, start_y)]
+        g_costs: Dict[Tuple[int, int], float] = {start_pos: 0.0}
+        came_from: Dict[Tuple[int, int], Tuple[int, int]] = {}
+        closed_set: Set[Tuple[int, int]] = set()
+        pushed = 0
         
         while open_set:
-            current = heapq.heappop(open_set)
-            current_pos = (current.x, current.y)
-            
-            # Remove from open dict
-            if current_pos in open_dict:
-                del open_dict[current_pos]
-            
-            # Add to closed set
+            _, _, x, y = heappop(open_set)
+            current_pos = (x, y)
+            if current_pos in closed_set:
+                continue
             closed_set.add(current_pos)
             
             # Check if we reached the goal
-            if current.x == goal_x and current.y == goal_y:
-                path = self._reconstruct_path(current)
+            if x == goal_x and y == goal_y:
+                path = self._reconstruct_path(came_from, current_pos)
                 self._cache_path(cache_key, path)
                 return path
             
             # Check max distance
-            if current.g_cost > max_distance:
+            g_cost = g_costs[current_pos]
+            if g_cost > max_distance:
                 continue
             
             # Check all neighbors
-            for dx, dy in [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]:
-                neighbor_x = current.x + dx
-                neighbor_y = current.y + dy
+            for dx, dy, move_cost in _NEIGHBOR_STEPS:
+                neighbor_x = x + dx
+                neighbor_y = y + dy
                 neighbor_pos = (neighbor_x, neighbor_y)
                 
-                # Skip if already processed
-                if neighbor_pos in closed_set:
+                # Skip if already processed or not walkable
+                if neighbor_pos in closed_set or not is_walkable(neighbor_x, neighbor_y):
                     continue
                 
-                # Skip if not walkable
-                if not self.is_walkable(neighbor_x, neighbor_y):
-                    continue
-                
-                # Calculate movement cost (diagonal moves cost more)
-                move_cost = 1.4 if abs(dx) + abs(dy) == 2 else 1.0
-                tentative_g = current.g_cost + move_cost
-                
-                # Check if this is a better path to the neighbor
-                if neighbor_pos in open_dict:
-                    neighbor = open_dict[neighbor_pos]
-                    if tentative_g < neighbor.g_cost:
-                        neighbor.g_cost = tentative_g
-                        neighbor.f_cost = neighbor.g_cost + neighbor.h_cost
-                        neighbor.parent = current
-                        heapq.heapify(open_set)  # Re-heapify since we changed a value
-                else:
-                    # Create new neighbor node
-                    neighbor = PathNode(neighbor_x, neighbor_y)
-                    neighbor.g_cost = tentative_g
-                    neighbor.h_cost = self._heuristic(neighbor_x, neighbor_y, goal_x, goal_y)
-                    neighbor.f_cost = neighbor.g_cost + neighbor.h_cost
-                    neighbor.parent = current
-                    
-                    heapq.heappush(open_set, neighbor)
-                    open_dict[neighbor_pos] = neighbor
+                # Keep only the cheapest way found to each neighbor
+                tentative_g = g_cost + move_cost
+                if tentative_g < g_costs.get(neighbor_pos, tentative_g + 1.0):
+                    g_costs[neighbor_pos] = tentative_g
+                    came_from[neighbor_pos] = current_pos
+                    pushed += 1
+                    h_cost = max(abs(goal_x - neighbor_x), abs(goal_y - neighbor_y))
+                    heappush(open_set, (tentative_g + h_cost, pushed, neighbor_x, neighbor_y))
         
         # No path found
         self._cache_path(cache_key, None)
@@ -145,7 +108,7 @@ class Pathfinder:
     
     def find_nearest_reachable(self, start_x: int, start_y: int, 
                               targets: List[Tuple[int, int]], 
-                              max_distance: int = 50) -> Optional[Tuple[int, int, List[Tuple[int, int]]]]:
+                              max_distance: int = 50) -> Optional[Tuple[int, int, Tuple[Tuple[int, int], ...]]]:
         """
         Find the nearest reachable target from a list of targets.
         
@@ -186,19 +149,20 @@ class Pathfinder:
         """Calculate heuristic distance (Chebyshev distance for 8-directional movement)."""
         return max(abs(x2 - x1), abs(y2 - y1))
     
-    def _reconstruct_path(self, node: PathNode) -> List[Tuple[int, int]]:
-        """Reconstruct path from goal node back to start."""
+    def _reconstruct_path(self, came_from: Dict[Tuple[int, int], Tuple[int, int]],
+                          goal_pos: Tuple[int, int]) -> Tuple[Tuple[int, int], ...]:
+        """Reconstruct path from goal back to start (start itself excluded)."""
         path = []
-        current = node
+        current = goal_pos
         
-        while current.parent is not None:
-            path.append((current.x, current.y))
-            current = current.parent
+        while current in came_from:
+            path.append(current)
+            current = came_from[current]
         
         path.reverse()
-        return path
+        return tuple(path)
     
-    def _cache_path(self, cache_key: Tuple[int, int, int, int], path: Optional[List[Tuple[int, int]]]):
+    def _cache_path(self, cache_key: Tuple[int, int, int, int], path: Optional[Tuple[Tuple[int, int], ...]]):
         """Cache a path result."""
         if len(self.path_cache) >= self.max_cache_size:
             # Remove oldest entry (simple FIFO)